@@ -9,4 +9,44 @@ float calculate_fair_distribution(const Student student);
 float recalculate_fair_distribution(const Student student,float priority_score,int priority_credit);
 void destroy_object(const Student student);
 
+/* Stateless entry points: no Student object, no hidden state, reentrant */
+float fair_distribution(int com_credit,int rem_credit,float curr_cwa,float target_cwa);
+float fair_redistribution(int com_credit,int rem_credit,float curr_cwa,float target_cwa,float total_priority_wa,int total_priority_credit);
+
+/* Arena API: n students in one contiguous block, released with a single free */
+Student init_students_bulk(int n);
+Student student_at(const Student students,int index);
+void set_student(const Student student,char*name,int com_credit,int rem_credit,float curr_cwa,float target_cwa);
+void destroy_students_bulk(const Student students);
+
+/* Batch API: status codes written by calculate_fair_distribution_batch */
+#define CWA_STATUS_OK 0
+#define CWA_STATUS_NO_REMAINING 1
+#define CWA_STATUS_ABOVE_MAX -1
+#define CWA_STATUS_BELOW_MIN -2
+
+void calculate_fair_distribution_batch(
+    int n,
+    const int *restrict com_credits,
+    const int *restrict rem_credits,
+    const float *restrict curr_cwa,
+    const float *restrict target_cwa,
+    const float *restrict locked_wa,
+    const int *restrict locked_credits,
+    float *restrict required,
+    int *restrict status
+);
+
+/* Allocation solver: per-course scores within [lower, upper] that minimize the highest score */
+#define CWA_STATUS_INVALID -3
+
+int allocate_scores(
+    int n,
+    const int *restrict credits,
+    const float *restrict lower,
+    const float *restrict upper,
+    float required_wa,
+    float *restrict allocated
+);
+
 #endif
\ No newline at end of file
@@ -15,6 +15,21 @@ struct student{
     float wa_remain;
 };
 
+//Same range check as the single-student functions, written as
+//conditional expressions so the batch loop stays branch-free
+PRIVATE inline float checked_distribution(float weighted_average, float credit_hrs){
+    float score_dist = weighted_average / credit_hrs;
+    return score_dist > 100 ? -1 : (score_dist < 0 ? -2 : score_dist);
+}
+
+//Weighted average still needed on the remaining credits (student->wa_remain)
+PRIVATE inline float remaining_weighted_average(int com_credit,int rem_credit,float curr_cwa,float target_cwa){
+    int total_credit_hrs = com_credit + rem_credit;
+    float weighted_average_com = curr_cwa * com_credit;
+    float final_weighted_average = target_cwa * total_credit_hrs;
+    return final_weighted_average - weighted_average_com;
+}
+
 PUBLIC Student init_student(char*name,int com_credit,int rem_credit,float curr_cwa,float target_cwa){
     //Allocate memory for student struct
     Student student = malloc(sizeof(struct student));
@@ -24,15 +39,37 @@ PUBLIC Student init_student(char*name,int com_credit,int rem_credit,float curr_c
     }
 
     //Set Struct fields
+    set_student(student,name,com_credit,rem_credit,curr_cwa,target_cwa);
+
+    
+    return student;
+
+}
+
+PUBLIC void set_student(const Student student,char*name,int com_credit,int rem_credit,float curr_cwa,float target_cwa){
     student->name = name;
     student->completed_credits = com_credit;
     student->remaining_credits = rem_credit;
     student->current_cwa = curr_cwa;
     student->target_cwa = target_cwa;
+    student->wa_remain = 0;
+}
 
-    
-    return student;
+PUBLIC Student init_students_bulk(int n){
+    //Allocate one zeroed block for n student structs
+    if(n <= 0){
+        return NULL;
+    }
+    Student students = calloc((size_t)n, sizeof(struct student));
+    if(!students){
+        fprintf(stderr,"Allocation error\n");
+        return NULL;
+    }
+    return students;
+}
 
+PUBLIC Student student_at(const Student students,int index){
+    return students + index;
 }
 
 PUBLIC float calculate_fair_distribution(const Student student){
@@ -76,6 +113,158 @@ PUBLIC float recalculate_fair_distribution(const Student student,float total_pri
     
 }
 
+//Stateless versions of calculate_fair_distribution / recalculate_fair_distribution.
+//They take every input as an argument and touch no shared state, so they are
+//safe to call concurrently from any number of threads.
+PUBLIC float fair_distribution(int com_credit,int rem_credit,float curr_cwa,float target_cwa){
+    float weighted_average_remain = remaining_weighted_average(com_credit,rem_credit,curr_cwa,target_cwa);
+    return checked_distribution(weighted_average_remain, rem_credit);
+}
+
+PUBLIC float fair_redistribution(int com_credit,int rem_credit,float curr_cwa,float target_cwa,float total_priority_wa,int total_priority_credit){
+    float wa_diff = remaining_weighted_average(com_credit,rem_credit,curr_cwa,target_cwa) - total_priority_wa;
+    float credit_hr_diff = rem_credit - total_priority_credit;
+    return checked_distribution(wa_diff, credit_hr_diff);
+}
+
 PUBLIC void destroy_object(const Student student){
     free(student);
-}
\ No newline at end of file
+}
+
+//Frees a block from init_students_bulk; never call destroy_object on its slots
+PUBLIC void destroy_students_bulk(const Student students){
+    free(students);
+}
+
+//Batch version of calculate_fair_distribution + recalculate_fair_distribution
+//for n students stored in contiguous arrays. No Student objects are allocated.
+//locked_wa/locked_credits hold the priority WA and credits (0 if none); the
+//recalculated score is used only when it is valid, like the Python bridge does.
+PUBLIC void calculate_fair_distribution_batch(
+    int n,
+    const int *restrict com_credits,
+    const int *restrict rem_credits,
+    const float *restrict curr_cwa,
+    const float *restrict target_cwa,
+    const float *restrict locked_wa,
+    const int *restrict locked_credits,
+    float *restrict required,
+    int *restrict status
+){
+#ifdef _OPENMP
+    #pragma omp parallel for simd schedule(static) if(n > 4096)
+#else
+    #pragma omp simd
+#endif
+    for(int i = 0; i < n; i++){
+        int rem = rem_credits[i];
+        float weighted_average_remain = remaining_weighted_average(com_credits[i],rem,curr_cwa[i],target_cwa[i]);
+
+        float score_dist = checked_distribution(weighted_average_remain, rem);
+
+        int lcr = locked_credits[i];
+        float lwa = locked_wa[i];
+        int use_locked = (lcr > 0) & (lwa > 0) & (lcr < rem);
+        float credit_hr_diff = rem - lcr;
+        float locked_dist = checked_distribution(weighted_average_remain - lwa, credit_hr_diff);
+        score_dist = (use_locked & (locked_dist > 0)) ? locked_dist : score_dist;
+
+        int code = score_dist == -1 ? CWA_STATUS_ABOVE_MAX : CWA_STATUS_OK;
+        code = score_dist == -2 ? CWA_STATUS_BELOW_MIN : code;
+
+        int active = rem > 0;
+        required[i] = active ? score_dist : 0;
+        status[i] = active ? code : CWA_STATUS_NO_REMAINING;
+    }
+}
+
+//One bound of one course: the level at which its slope starts (lower) or stops (upper)
+typedef struct{
+    float value;
+    int credit_delta;
+}AllocationEvent;
+
+PRIVATE int compare_events(const void*a, const void*b){
+    float x = ((const AllocationEvent*)a)->value;
+    float y = ((const AllocationEvent*)b)->value;
+    return (x > y) - (x < y);
+}
+
+//Water-filling: every course gets clamp(level, lower, upper), with the lowest
+//level whose weighted sum reaches required_wa. No course can go lower without
+//another going above the level, so the highest score is minimized.
+//Sorting the 2n bounds makes it O(n log n).
+PUBLIC int allocate_scores(
+    int n,
+    const int *restrict credits,
+    const float *restrict lower,
+    const float *restrict upper,
+    float required_wa,
+    float *restrict allocated
+){
+    double floor_wa = 0, cap_wa = 0;
+    int active = 0;
+    for(int i = 0; i < n; i++){
+        if(lower[i] > upper[i]){
+            return CWA_STATUS_INVALID;
+        }
+        if(credits[i] > 0){
+            floor_wa += (double)credits[i] * lower[i];
+            cap_wa += (double)credits[i] * upper[i];
+            active++;
+        }
+    }
+
+    //Target is met even at the floors, or cannot be met even at the caps
+    if(floor_wa >= required_wa || cap_wa < required_wa){
+        const float*bound = floor_wa >= required_wa ? lower : upper;
+        for(int i = 0; i < n; i++){
+            allocated[i] = credits[i] > 0 ? bound[i] : 0;
+        }
+        if(floor_wa == required_wa){
+            return CWA_STATUS_OK;
+        }
+        return floor_wa > required_wa ? CWA_STATUS_BELOW_MIN : CWA_STATUS_ABOVE_MAX;
+    }
+
+    AllocationEvent*events = malloc(sizeof(AllocationEvent) * 2 * (size_t)active);
+    if(!events){
+        fprintf(stderr,"Allocation error\n");
+        return CWA_STATUS_INVALID;
+    }
+    int m = 0;
+    for(int i = 0; i < n; i++){
+        if(credits[i] > 0){
+            events[m++] = (AllocationEvent){lower[i], credits[i]};
+            events[m++] = (AllocationEvent){upper[i], -credits[i]};
+        }
+    }
+    qsort(events, m, sizeof(AllocationEvent), compare_events);
+
+    //Walk the breakpoints; between two of them the weighted sum grows by
+    //slope (credits currently between their bounds) per point of level
+    double wa = floor_wa;
+    double level = events[0].value;
+    int slope = 0;
+    for(int k = 0; k < m; k++){
+        double next_wa = wa + slope * (events[k].value - level);
+        if(slope > 0 && next_wa >= required_wa){
+            break;
+        }
+        wa = next_wa;
+        level = events[k].value;
+        slope += events[k].credit_delta;
+    }
+    if(slope > 0){
+        level += (required_wa - wa) / slope;
+    }
+    free(events);
+
+    for(int i = 0; i < n; i++){
+        float score = (float)level;
+        score = score < lower[i] ? lower[i] : score;
+        score = score > upper[i] ? upper[i] : score;
+        allocated[i] = credits[i] > 0 ? score : 0;
+    }
+    return CWA_STATUS_OK;
+}
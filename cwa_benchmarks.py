@@ -0,0 +1,310 @@
+"""
+Micro-benchmarks for the engine bridge, the prediction model and the GUI recompute.
+
+Each case is timed over a range of input sizes and the results are written
+as JSON, so runs from different versions can be diffed for regressions.
+
+Run:
+    python cwa_benchmarks.py                      # all cases, JSON to stdout
+    python cwa_benchmarks.py --output bench.json  # JSON to a file
+    python cwa_benchmarks.py --filter gui --quick # subset, smaller sizes
+
+GUI cases use Qt's offscreen platform, so no display is needed. Cases whose
+dependencies are missing (engine library, PySide6, ...) are reported as
+skipped instead of failing the run.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+COURSE_SIZES = [1, 10, 100, 1000]
+STUDENT_SIZES = [1, 10, 100, 1000, 10_000, 100_000]
+QUICK_COURSE_SIZES = [1, 10, 100]
+QUICK_STUDENT_SIZES = [1, 100, 10_000]
+
+# per-student Python loops get slow quickly; cap them so a run stays short
+LOOP_MAX_STUDENTS = 10_000
+
+
+class SkipCase(Exception):
+    pass
+
+
+# -----------------------------------
+# INPUT GENERATORS
+# -----------------------------------
+
+def _courses(n: int, seed: int = 0) -> List[dict]:
+    rng = np.random.default_rng(seed)
+    done = rng.random(n) < 0.5
+    return [
+        {
+            "course": f"C{i}",
+            "credits": int(rng.integers(1, 6)),
+            "current": float(round(rng.uniform(40, 95), 2)) if done[i] else 0.0,
+            "allocated": float(round(rng.uniform(40, 95), 2)) if rng.random() < 0.5 else 0.0,
+        }
+        for i in range(n)
+    ]
+
+
+def _cohort(n_students: int, courses_per_student: int = 36, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    rows = n_students * courses_per_student
+    student_id = np.repeat(np.arange(n_students), courses_per_student)
+    credits = rng.integers(1, 6, rows)
+    current = np.where(rng.random(rows) < 0.6, rng.uniform(40, 95, rows).round(2), 0.0)
+    allocated = np.where(rng.random(rows) < 0.5, rng.uniform(40, 95, rows).round(2), 0.0)
+    target = rng.uniform(50, 80, n_students).round(2)
+    return student_id, credits, current, allocated, target
+
+
+# -----------------------------------
+# CASES: each returns a zero-argument callable to time
+# -----------------------------------
+
+def _bridge():
+    try:
+        import cwa_engine_bridge as bridge
+        bridge.load_engine()
+    except Exception as e:
+        raise SkipCase(f"engine not available: {e}")
+    return bridge
+
+
+def _engine_info() -> Optional[dict]:
+    # which engine build the timings came from (None if it cannot load)
+    try:
+        return _bridge().engine_info()
+    except SkipCase:
+        return None
+
+
+def case_student_handle(size: int) -> Callable[[], None]:
+    bridge = _bridge()
+
+    def run():
+        for _ in range(size):
+            h = bridge._StudentHandle(60, 30, 65.0, 70.0)
+            h.calculate_fair_distribution()
+            h.close()
+    return run
+
+
+def case_pooled_student(size: int) -> Callable[[], None]:
+    bridge = _bridge()
+    pool = bridge._StudentPool()
+
+    def run():
+        for _ in range(size):
+            with pool.acquire(60, 30, 65.0, 70.0) as s:
+                s.calculate_fair_distribution()
+    return run
+
+
+def case_compute_summary(size: int) -> Callable[[], None]:
+    bridge = _bridge()
+    payload = {"courses": _courses(size), "target_cwa": 70.0}
+    return lambda: bridge.compute_summary(payload)
+
+
+def case_compute_summary_loop(size: int) -> Callable[[], None]:
+    if size > LOOP_MAX_STUDENTS:
+        raise SkipCase(f"per-student loop capped at {LOOP_MAX_STUDENTS} students")
+    bridge = _bridge()
+    sid, cr, cur, alloc, target = _cohort(size)
+    # group rows by student once (setup only; run() times the summary loop)
+    order = np.argsort(sid, kind="stable")
+    students, starts = np.unique(sid[order], return_index=True)
+    groups = zip(*(np.split(a[order], starts[1:]) for a in (cr, cur, alloc)))
+    payloads = [
+        {
+            "courses": [
+                {"credits": int(c), "current": float(u), "allocated": float(a)}
+                for c, u, a in zip(g_cr, g_cur, g_alloc)
+            ],
+            "target_cwa": float(target[s]),
+        }
+        for s, (g_cr, g_cur, g_alloc) in zip(students, groups)
+    ]
+
+    def run():
+        for p in payloads:
+            bridge.compute_summary(p)
+    return run
+
+
+def case_compute_summaries(size: int) -> Callable[[], None]:
+    bridge = _bridge()
+    cohort = _cohort(size)
+    return lambda: bridge.compute_summaries(*cohort)
+
+
+def case_predict_cwa(size: int) -> Callable[[], None]:
+    if size > LOOP_MAX_STUDENTS:
+        raise SkipCase(f"per-student loop capped at {LOOP_MAX_STUDENTS} students")
+    import model_training
+    model_training.get_model()
+    rows = np.random.default_rng(0).uniform([40, 12, 10], [95, 24, 40], (size, 3)).tolist()
+
+    def run():
+        for r in rows:
+            model_training.predict_cwa(*r)
+    return run
+
+
+def case_predict_cwa_many(size: int) -> Callable[[], None]:
+    import model_training
+    model_training.get_model()
+    features = np.random.default_rng(0).uniform([40, 12, 10], [95, 24, 40], (size, 3))
+    return lambda: model_training.predict_cwa_many(features)
+
+
+_qt_app = None
+
+
+def _estimator_page(size: int):
+    global _qt_app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PySide6.QtWidgets import QApplication
+        import cwa_pyside6_app as gui
+    except Exception as e:
+        raise SkipCase(f"PySide6 not available: {e}")
+    if not gui.ENGINE_OK:
+        raise SkipCase(f"engine not available: {gui.ENGINE_ERR}")
+
+    _qt_app = QApplication.instance() or QApplication([])
+    page = gui.CWAEstimatorPage()
+    page.target_cwa_edit.setText("70")
+    model = page.current_model()
+    for r, c in enumerate(_courses(size)):
+        if r:
+            page.add_course_row()
+        model.setData(model.index(r, 0), c["course"])
+        model.setData(model.index(r, 1), str(c["credits"]))
+        model.setData(model.index(r, 2), f"{c['current']:.2f}" if c["current"] else "")
+        model.setData(model.index(r, 4), f"{c['allocated']:.2f}" if c["allocated"] else "")
+    page.recompute()
+    page.wait_for_engine()
+    return page, model
+
+
+def case_gui_recompute(size: int) -> Callable[[], None]:
+    page, _ = _estimator_page(size)
+
+    def run():
+        page.recompute()
+        page.wait_for_engine()
+    return run
+
+
+def case_gui_cell_edit(size: int) -> Callable[[], None]:
+    page, model = _estimator_page(size)
+    index = model.index(size // 2, 2)
+    values = ["55", "65"]
+    state = {"i": 0}
+
+    def run():
+        state["i"] ^= 1
+        model.setData(index, values[state["i"]])
+        page.recompute()
+        page.wait_for_engine()
+    return run
+
+
+# name -> (group, unit, factory, full sizes, quick sizes)
+CASES: Dict[str, tuple] = {
+    "bridge.student_handle": ("bridge", "calls", case_student_handle, [1, 100, 1000], [1, 100]),
+    "bridge.pooled_student": ("bridge", "calls", case_pooled_student, [1, 100, 1000], [1, 100]),
+    "bridge.compute_summary": ("bridge", "courses", case_compute_summary, COURSE_SIZES, QUICK_COURSE_SIZES),
+    "bridge.compute_summary_loop": ("bridge", "students", case_compute_summary_loop, STUDENT_SIZES, QUICK_STUDENT_SIZES),
+    "bridge.compute_summaries": ("bridge", "students", case_compute_summaries, STUDENT_SIZES, QUICK_STUDENT_SIZES),
+    "model.predict_cwa": ("model", "students", case_predict_cwa, STUDENT_SIZES, QUICK_STUDENT_SIZES),
+    "model.predict_cwa_many": ("model", "students", case_predict_cwa_many, STUDENT_SIZES, QUICK_STUDENT_SIZES),
+    "gui.recompute": ("gui", "courses", case_gui_recompute, COURSE_SIZES, QUICK_COURSE_SIZES),
+    "gui.cell_edit": ("gui", "courses", case_gui_cell_edit, COURSE_SIZES, QUICK_COURSE_SIZES),
+}
+
+
+# -----------------------------------
+# RUNNER
+# -----------------------------------
+
+def time_callable(fn: Callable[[], None], repeat: int, min_time: float) -> dict:
+    timer = timeit.Timer(fn)
+    loops, _ = timer.autorange()
+    while True:
+        t = timer.timeit(loops)
+        if t >= min_time or loops >= 1_000_000:
+            break
+        loops *= 2
+    samples = [timer.timeit(loops) / loops for _ in range(repeat)]
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "max_s": max(samples),
+    }
+
+
+def run(filter_text: str = "", quick: bool = False, repeat: int = 5, min_time: float = 0.05) -> dict:
+    results = []
+    for name, (group, unit, factory, sizes, quick_sizes) in CASES.items():
+        if filter_text and filter_text not in name:
+            continue
+        for size in (quick_sizes if quick else sizes):
+            entry = {"name": name, "group": group, "unit": unit, "size": size}
+            try:
+                fn = factory(size)
+            except SkipCase as e:
+                entry["skipped"] = str(e)
+                results.append(entry)
+                continue
+            entry.update(time_callable(fn, repeat, min_time))
+            entry["per_item_s"] = entry["median_s"] / max(size, 1)
+            results.append(entry)
+            print(f"{name:<30} {unit:>8}={size:<7} {entry['median_s'] * 1e3:10.3f} ms", file=sys.stderr)
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "engine": _engine_info(),
+        "results": results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the CWA micro-benchmarks")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="use fewer, smaller input sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="timing samples per case")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    parser.add_argument("--output", default="-", help="JSON destination ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    report = run(args.filter, args.quick, max(1, args.repeat), args.min_time)
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Columnar binary cohort file (.cwab), read through np.memmap.
+
+Layout (little-endian), every column block starts on a 64-byte boundary:
+
+    header (128 bytes)
+        magic        8s   b"CWACOHRT"
+        version      u32
+        header_size  u32
+        n_students   u64
+        n_rows       u64
+        id_width     u32  0 = int64 student ids, otherwise fixed-width bytes (S<id_width>)
+        (padding)    u32
+        6 x u64           byte offsets of the column blocks below
+    student_ids  int64[n_students] or S<id_width>[n_students]
+    offsets      int64[n_students + 1]   student i owns rows offsets[i]:offsets[i+1]
+    credits      int32[n_rows]
+    current      float64[n_rows]
+    allocated    float64[n_rows]
+    targets      float64[n_students]
+
+Opening a file only parses the header; the columns are memmap views that go
+straight into compute_summaries_grouped() without copying or parsing.
+
+Run:
+    python cwa_cohort_format.py convert extract.csv cohort.cwab
+    python cwa_cohort_format.py evaluate cohort.cwab --output results.csv
+"""
+import argparse
+import struct
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+import cwa_engine_bridge
+
+MAGIC = b"CWACOHRT"
+FORMAT_VERSION = 1
+HEADER_SIZE = 128
+ALIGN = 64
+
+_HEADER = struct.Struct("<8sIIQQI4x6Q")
+
+COLUMNS = ["student_ids", "offsets", "credits", "current", "allocated", "targets"]
+
+
+def _align(pos: int) -> int:
+    return (pos + ALIGN - 1) // ALIGN * ALIGN
+
+
+def write_cohort(path, student_id, credits, current, allocated, target_cwa) -> Path:
+    """
+    Write a cohort file from flat per-row columns.
+
+    Arguments follow compute_summaries(): rows may be in any order and
+    target_cwa is a scalar or one value per student in np.unique order.
+    Rows are grouped with a stable sort, so each student's row order is kept.
+    """
+    sid = np.asarray(student_id)
+    if sid.dtype.kind in "iu":
+        sid = sid.astype(np.int64)
+        id_width = 0
+    else:
+        sid = np.char.encode(sid.astype(str), "utf-8") if sid.dtype.kind == "U" else sid.astype(bytes)
+        id_width = max(1, sid.dtype.itemsize)
+        sid = sid.astype(f"S{id_width}")
+
+    order = np.argsort(sid, kind="stable")
+    sid = sid[order]
+    ids, counts = np.unique(sid, return_counts=True)
+    n_students = ids.shape[0]
+    n_rows = sid.shape[0]
+
+    offsets = np.zeros(n_students + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    target = np.asarray(target_cwa, dtype=np.float64)
+    if target.ndim == 0:
+        target = np.full(n_students, float(target))
+    elif target.shape != (n_students,):
+        raise ValueError(f"target_cwa must be a scalar or have one value per student ({n_students})")
+
+    blocks = [
+        ids,
+        offsets,
+        cwa_engine_bridge.as_credit_array(credits)[order].astype(np.int32),
+        np.asarray(current, dtype=np.float64)[order],
+        np.asarray(allocated, dtype=np.float64)[order],
+        target,
+    ]
+
+    positions = []
+    pos = HEADER_SIZE
+    for block in blocks:
+        pos = _align(pos)
+        positions.append(pos)
+        pos += block.nbytes
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, HEADER_SIZE, n_students, n_rows, id_width, *positions)
+    path = Path(path)
+    with open(path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        for block, start in zip(blocks, positions):
+            f.write(b"\0" * (start - f.tell()))
+            f.write(np.ascontiguousarray(block).tobytes())
+    return path
+
+
+class CohortFile:
+    """
+    Read-only, memory-mapped view of a cohort file.
+
+    The columns (student_ids, offsets, credits, current, allocated, targets)
+    are np.memmap views backed by the page cache.
+    """
+
+    def __init__(self, path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            raw = f.read(_HEADER.size)
+        if len(raw) < _HEADER.size:
+            raise ValueError(f"{self.path}: file too short for a cohort header")
+
+        magic, version, header_size, n_students, n_rows, id_width, *positions = _HEADER.unpack(raw)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: not a cohort file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{self.path}: unsupported cohort format version {version}")
+
+        self.n_students = int(n_students)
+        self.n_rows = int(n_rows)
+
+        id_dtype = np.dtype("<i8") if id_width == 0 else np.dtype(f"S{id_width}")
+        layout = [
+            (id_dtype, self.n_students),
+            (np.dtype("<i8"), self.n_students + 1),
+            (np.dtype("<i4"), self.n_rows),
+            (np.dtype("<f8"), self.n_rows),
+            (np.dtype("<f8"), self.n_rows),
+            (np.dtype("<f8"), self.n_students),
+        ]
+
+        self._mm = np.memmap(self.path, dtype=np.uint8, mode="r")
+        for name, start, (dtype, count) in zip(COLUMNS, positions, layout):
+            end = start + dtype.itemsize * count
+            if end > self._mm.shape[0]:
+                raise ValueError(f"{self.path}: truncated {name} block")
+            setattr(self, name, self._mm[start:end].view(dtype))
+
+    def __len__(self) -> int:
+        return self.n_students
+
+    def evaluate(self) -> dict:
+        """compute_summaries() for every student in the file."""
+        return cwa_engine_bridge.compute_summaries_grouped(
+            self.student_ids, self.offsets, self.credits, self.current, self.allocated, self.targets
+        )
+
+
+def open_cohort(path) -> CohortFile:
+    return CohortFile(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Binary cohort files")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    conv = sub.add_parser("convert", help="convert a registrar CSV extract to a cohort file")
+    conv.add_argument("extract", help="CSV with student_id,credits,current,allocated,target")
+    conv.add_argument("output", help="cohort file to write")
+
+    ev = sub.add_parser("evaluate", help="evaluate every student in a cohort file")
+    ev.add_argument("cohort", help="cohort file")
+    ev.add_argument("--output", default="-", help="results CSV ('-' for stdout)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "convert":
+        from cwa_cohort_runner import read_extract
+
+        path = write_cohort(args.output, *read_extract(args.extract))
+        print(f"Wrote {path}", file=sys.stderr)
+        return 0
+
+    from cwa_cohort_runner import write_results
+
+    t0 = time.perf_counter()
+    cohort = open_cohort(args.cohort)
+    t_open = time.perf_counter() - t0
+    results = cohort.evaluate()
+    t_eval = time.perf_counter() - t0 - t_open
+
+    if args.output == "-":
+        write_results(results, sys.stdout)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            write_results(results, f)
+    print(
+        f"{cohort.n_students} students, {cohort.n_rows} rows; "
+        f"open {t_open * 1e3:.2f} ms, evaluate {t_eval * 1e3:.1f} ms",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Process-pool cohort runner.
+
+Splits a registrar extract into shards of whole students, evaluates the
+shards with compute_summaries() in a ProcessPoolExecutor and merges the
+results back in student_id order. Each worker process loads the engine
+library once, in its initializer.
+
+Extract format (CSV, one row per course):
+    student_id,credits,current,allocated,target
+
+Run:
+    python cwa_cohort_runner.py extract.csv --workers 8 --chunk-size 5000 --output results.csv
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+import cwa_engine_bridge
+
+RESULT_COLUMNS = [
+    "student_id",
+    "current_cwa",
+    "required_avg",
+    "total_credits",
+    "selected_credits",
+    "remaining_credits",
+    "status",
+]
+
+
+def _init_worker() -> None:
+    # one library load per worker process, not per shard
+    cwa_engine_bridge.load_engine()
+
+
+def _evaluate_shard(index: int, student_id, credits, current, allocated, target) -> Tuple[int, dict, dict]:
+    t0 = time.perf_counter()
+    result = cwa_engine_bridge.compute_summaries(student_id, credits, current, allocated, target)
+    timing = {
+        "shard": index,
+        "students": int(result["student_id"].shape[0]),
+        "rows": int(np.asarray(student_id).shape[0]),
+        "seconds": time.perf_counter() - t0,
+        "pid": os.getpid(),
+    }
+    return index, result, timing
+
+
+def make_shards(student_id, credits, current, allocated, target_cwa, chunk_size: int) -> List[tuple]:
+    """
+    Group rows by student and cut the cohort into shards of chunk_size students.
+
+    Rows are sorted by student_id with a stable sort, so each student's rows
+    keep their original order. target_cwa is a scalar or one value per
+    student in np.unique(student_id) order, as in compute_summaries().
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    sid = np.asarray(student_id)
+    order = np.argsort(sid, kind="stable")
+    sid = sid[order]
+    cr = np.asarray(credits)[order]
+    cur = np.asarray(current)[order]
+    alloc = np.asarray(allocated)[order]
+
+    # first row of every student in the sorted extract
+    starts = np.flatnonzero(np.r_[True, sid[1:] != sid[:-1]]) if sid.size else np.empty(0, dtype=np.int64)
+    n_students = starts.shape[0]
+
+    target = np.asarray(target_cwa, dtype=np.float64)
+    if target.ndim == 0:
+        target = np.full(n_students, float(target))
+    elif target.shape != (n_students,):
+        raise ValueError(f"target_cwa must be a scalar or have one value per student ({n_students})")
+
+    shards = []
+    for first in range(0, n_students, chunk_size):
+        last = min(first + chunk_size, n_students)
+        a = starts[first]
+        b = starts[last] if last < n_students else sid.shape[0]
+        shards.append((sid[a:b], cr[a:b], cur[a:b], alloc[a:b], target[first:last]))
+    return shards
+
+
+def run_cohort(
+    student_id,
+    credits,
+    current,
+    allocated,
+    target_cwa,
+    workers: Optional[int] = None,
+    chunk_size: int = 5000,
+) -> Tuple[dict, List[dict]]:
+    """
+    compute_summaries() for a whole cohort, sharded across processes.
+
+    Returns (results, timings): results has the same keys and order as
+    compute_summaries() on the full extract; timings has one entry per
+    shard (students, rows, seconds, worker pid), in shard order.
+    """
+    shards = make_shards(student_id, credits, current, allocated, target_cwa, chunk_size)
+    if not shards:
+        empty = cwa_engine_bridge.compute_summaries(
+            np.asarray(student_id), np.asarray(credits), np.asarray(current), np.asarray(allocated), target_cwa
+        )
+        return empty, []
+
+    parts: List[Optional[dict]] = [None] * len(shards)
+    timings: List[Optional[dict]] = [None] * len(shards)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(_evaluate_shard, i, *shard) for i, shard in enumerate(shards)]
+        for fut in futures:
+            index, result, timing = fut.result()
+            parts[index] = result
+            timings[index] = timing
+
+    merged = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+    return merged, timings
+
+
+def read_extract(path: str):
+    """Read a registrar CSV into columns; target is taken from each student's first row."""
+    sid: List[str] = []
+    cr: List[float] = []
+    cur: List[float] = []
+    alloc: List[float] = []
+    first_target = {}
+
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            s = row["student_id"]
+            sid.append(s)
+            cr.append(cwa_engine_bridge.safe_float(row.get("credits")))
+            cur.append(cwa_engine_bridge.safe_float(row.get("current")))
+            alloc.append(cwa_engine_bridge.safe_float(row.get("allocated")))
+            if s not in first_target:
+                first_target[s] = cwa_engine_bridge.safe_float(row.get("target"))
+
+    ids = np.asarray(sid)
+    target = np.array([first_target[s] for s in np.unique(ids)], dtype=np.float64)
+    return ids, np.asarray(cr), np.asarray(cur), np.asarray(alloc), target
+
+
+def write_results(results: dict, out) -> None:
+    writer = csv.writer(out)
+    writer.writerow(RESULT_COLUMNS)
+    columns = [results[c].tolist() for c in RESULT_COLUMNS]
+    if results["student_id"].dtype.kind == "S":
+        # fixed-width byte ids from a cohort file
+        columns[0] = np.char.decode(results["student_id"], "utf-8").tolist()
+    writer.writerows(zip(*columns))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Evaluate a cohort extract across worker processes")
+    parser.add_argument("extract", help="CSV with student_id,credits,current,allocated,target")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="students per shard")
+    parser.add_argument("--output", default="-", help="results CSV ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    columns = read_extract(args.extract)
+    t_read = time.perf_counter() - t0
+
+    results, timings = run_cohort(*columns, workers=args.workers, chunk_size=args.chunk_size)
+
+    if args.output == "-":
+        write_results(results, sys.stdout)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            write_results(results, f)
+
+    for t in timings:
+        print(
+            f"shard {t['shard']:>4}: {t['students']:>7} students {t['rows']:>9} rows "
+            f"{t['seconds'] * 1e3:9.1f} ms (pid {t['pid']})",
+            file=sys.stderr,
+        )
+    print(
+        f"{len(results['student_id'])} students in {len(timings)} shards; "
+        f"read {t_read:.2f} s, total {time.perf_counter() - t0:.2f} s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,42 +1,269 @@
+import atexit
+import bisect
 import ctypes
+import functools
+import os
+import platform
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
 
 
 # -----------------------------------
 # DLL LOADING
 # -----------------------------------
 
-C_LIB_PATH = Path("CWA-ENGINE/cwa_engine.dll").resolve()
-c_lib = ctypes.CDLL(str(C_LIB_PATH))
+# Resolved from this file, not the working directory.
+ENGINE_DIR = Path(__file__).resolve().parent / "CWA-ENGINE"
+PREBUILT_DLL = Path(__file__).resolve().parent / "cwa_engine.dll"
+LIB_SUFFIX = {"win32": ".dll", "darwin": ".dylib"}.get(sys.platform, ".so")
 
-# ---- Signatures from cwa_estimater.h ----
-# Student init_student(int credits_com,int credits_remain);
-c_lib.init_student.argtypes = [
-    ctypes.c_int,  # credits_com
-    ctypes.c_int,  # credits_remain
-]
-c_lib.init_student.restype = ctypes.c_void_p  # Student*
+# CPU-specific builds from `make variants`, fastest first, with the CPU
+# flags (as named in /proc/cpuinfo) each one needs.
+ENGINE_VARIANTS = (
+    ("x86-64-v3", frozenset({"avx", "avx2", "bmi1", "bmi2", "f16c", "fma", "movbe", "abm"})),
+    ("baseline", frozenset()),
+)
 
-# float calculate_dist_CWA(const Student student,float target_cwa,float current_cwa);
-c_lib.calculate_dist_CWA.argtypes = [
-    ctypes.c_void_p,  # Student
-    ctypes.c_float,   # target_cwa
-    ctypes.c_float,   # current_cwa
-]
-c_lib.calculate_dist_CWA.restype = ctypes.c_float
+# CWA_ENGINE_LIB=path loads exactly that library; CWA_ENGINE_VARIANT=name
+# restricts the search to one variant (e.g. to benchmark baseline).
+ENGINE_LIB_ENV = "CWA_ENGINE_LIB"
+ENGINE_VARIANT_ENV = "CWA_ENGINE_VARIANT"
+
+# The library is loaded on first use (see _engine()), so importing this
+# module stays cheap for tools that only need part of it.
+_c_lib: Optional[ctypes.CDLL] = None
+_c_lib_lock = threading.Lock()
+_has_batch_kernel = False
+_has_student_arena = False
+_has_stateless_calls = False
+_engine_variant: Optional[str] = None
+_engine_path: Optional[Path] = None
+
+
+def cpu_features() -> frozenset:
+    """Lower-case feature flags of the running CPU (empty when unknown)."""
+    if platform.machine().lower() not in ("x86_64", "amd64"):
+        return frozenset()
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/cpuinfo", "r", encoding="ascii", errors="replace") as f:
+                for line in f:
+                    if line.startswith("flags"):
+                        return frozenset(line.partition(":")[2].split())
+        except OSError:
+            pass
+
+    # elsewhere, fall back on NumPy's own runtime dispatch table
+    try:
+        from numpy._core._multiarray_umath import __cpu_features__
+    except ImportError:
+        try:
+            from numpy.core._multiarray_umath import __cpu_features__
+        except ImportError:
+            return frozenset()
+    rename = {"FMA3": "fma", "BMI": "bmi1", "LZCNT": "abm"}
+    return frozenset(rename.get(name, name.lower()) for name, on in __cpu_features__.items() if on)
+
+
+def engine_candidates() -> List[tuple]:
+    """(variant, path) pairs load_engine() tries, in order."""
+    override = os.environ.get(ENGINE_LIB_ENV)
+    if override:
+        return [("custom", Path(override))]
+
+    wanted = os.environ.get(ENGINE_VARIANT_ENV)
+    flags = cpu_features()
+    lib_dir = ENGINE_DIR / "lib"
+    candidates = [
+        (name, lib_dir / f"libcwa_{name}{LIB_SUFFIX}")
+        for name, needs in ENGINE_VARIANTS
+        if needs <= flags and wanted in (None, "", name)
+    ]
+    if not wanted:
+        # plain `make` output, then the prebuilt Windows library
+        candidates.append(("default", lib_dir / f"libcwa{LIB_SUFFIX}"))
+        if sys.platform == "win32":
+            candidates.append(("prebuilt", PREBUILT_DLL))
+    return candidates
+
+
+def load_engine() -> ctypes.CDLL:
+    """
+    Load the C engine and declare its signatures (thread-safe, runs once).
+
+    Picks the fastest build in engine_candidates() that exists, loads and
+    exports the core Student API; engine_info() reports which one. Raises
+    OSError if none qualifies.
+    Call it up front when you want load errors at startup rather than on
+    the first calculation.
+    """
+    global _c_lib, _has_batch_kernel, _has_student_arena, _has_stateless_calls, _engine_variant, _engine_path
+    with _c_lib_lock:
+        if _c_lib is None:
+            errors = []
+            for variant, path in engine_candidates():
+                if not path.is_file():
+                    errors.append(f"{path}: not found")
+                    continue
+                try:
+                    lib = ctypes.CDLL(str(path))
+                    _declare_signatures(lib)
+                    break
+                except (OSError, AttributeError) as e:
+                    # unloadable, or a stale build missing a required symbol
+                    errors.append(f"{path}: {e}")
+            else:
+                if not errors:
+                    raise OSError(f"no engine variant matches {ENGINE_VARIANT_ENV}={os.environ.get(ENGINE_VARIANT_ENV)!r} on this CPU")
+                raise OSError("no loadable CWA engine library; tried " + "; ".join(errors))
+
+            _engine_variant, _engine_path = variant, path
+            _has_batch_kernel = hasattr(lib, "calculate_fair_distribution_batch")
+            _has_student_arena = hasattr(lib, "init_students_bulk")
+            _has_stateless_calls = hasattr(lib, "fair_distribution") and hasattr(lib, "fair_redistribution")
+            if _metrics is not None:
+                _instrument_lib(lib, _metrics)
+            _c_lib = lib
+            invalidate_summary_cache()
+    return _c_lib
+
+
+def _engine() -> ctypes.CDLL:
+    lib = _c_lib
+    return lib if lib is not None else load_engine()
+
+
+def engine_info() -> dict:
+    """Which engine build is loaded: variant name, library path and batch-kernel support."""
+    _engine()
+    return {"variant": _engine_variant, "path": str(_engine_path), "batch_kernel": _has_batch_kernel}
 
-# float recalculate_dist_CWA(const Student student,float total_achievable_WA,int total_achievable_Credits);
-c_lib.recalculate_dist_CWA.argtypes = [
-    ctypes.c_void_p,  # Student
-    ctypes.c_float,   # total_achievable_WA
-    ctypes.c_int,     # total_achievable_Credits
-]
-c_lib.recalculate_dist_CWA.restype = ctypes.c_float
 
-# void destroy_object(const Student student);
-c_lib.destroy_object.argtypes = [ctypes.c_void_p]
-c_lib.destroy_object.restype = None
+def has_batch_kernel() -> bool:
+    """True if the loaded engine exports calculate_fair_distribution_batch."""
+    _engine()
+    return _has_batch_kernel
+
+
+def _declare_signatures(lib: ctypes.CDLL) -> None:
+    # ---- Signatures from cwa_estimater.h ----
+    # Student init_student(char*name,int com_credit,int rem_credit,float curr_cwa,float target_cwa);
+    lib.init_student.argtypes = [
+        ctypes.c_char_p,  # name
+        ctypes.c_int,     # com_credit
+        ctypes.c_int,     # rem_credit
+        ctypes.c_float,   # curr_cwa
+        ctypes.c_float,   # target_cwa
+    ]
+    lib.init_student.restype = ctypes.c_void_p  # Student
+
+    # float calculate_fair_distribution(const Student student);
+    lib.calculate_fair_distribution.argtypes = [ctypes.c_void_p]
+    lib.calculate_fair_distribution.restype = ctypes.c_float
+
+    # float recalculate_fair_distribution(const Student student,float total_priority_wa,int total_priority_credit);
+    lib.recalculate_fair_distribution.argtypes = [
+        ctypes.c_void_p,  # Student
+        ctypes.c_float,   # total_priority_wa
+        ctypes.c_int,     # total_priority_credit
+    ]
+    lib.recalculate_fair_distribution.restype = ctypes.c_float
+
+    # void destroy_object(const Student student);
+    lib.destroy_object.argtypes = [ctypes.c_void_p]
+    lib.destroy_object.restype = None
+
+    # Stateless entry points; older builds do not export them and
+    # required_average() falls back to a Student handle.
+    if hasattr(lib, "fair_distribution") and hasattr(lib, "fair_redistribution"):
+        # float fair_distribution(int com_credit,int rem_credit,float curr_cwa,float target_cwa);
+        lib.fair_distribution.argtypes = [
+            ctypes.c_int,    # com_credit
+            ctypes.c_int,    # rem_credit
+            ctypes.c_float,  # curr_cwa
+            ctypes.c_float,  # target_cwa
+        ]
+        lib.fair_distribution.restype = ctypes.c_float
+
+        # float fair_redistribution(int com_credit,int rem_credit,float curr_cwa,float target_cwa,
+        #                           float total_priority_wa,int total_priority_credit);
+        lib.fair_redistribution.argtypes = [
+            ctypes.c_int,    # com_credit
+            ctypes.c_int,    # rem_credit
+            ctypes.c_float,  # curr_cwa
+            ctypes.c_float,  # target_cwa
+            ctypes.c_float,  # total_priority_wa
+            ctypes.c_int,    # total_priority_credit
+        ]
+        lib.fair_redistribution.restype = ctypes.c_float
+
+    # Student arenas. Older engine builds (e.g. the prebuilt cwa_engine.dll)
+    # do not export them; _StudentPool then falls back to init_student.
+    if hasattr(lib, "init_students_bulk"):
+        # Student init_students_bulk(int n);
+        lib.init_students_bulk.argtypes = [ctypes.c_int]
+        lib.init_students_bulk.restype = ctypes.c_void_p
+
+        # Student student_at(const Student students,int index);
+        lib.student_at.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        lib.student_at.restype = ctypes.c_void_p
+
+        # void set_student(const Student student,char*name,int com_credit,int rem_credit,float curr_cwa,float target_cwa);
+        lib.set_student.argtypes = [
+            ctypes.c_void_p,  # Student
+            ctypes.c_char_p,  # name
+            ctypes.c_int,     # com_credit
+            ctypes.c_int,     # rem_credit
+            ctypes.c_float,   # curr_cwa
+            ctypes.c_float,   # target_cwa
+        ]
+        lib.set_student.restype = None
+
+        # void destroy_students_bulk(const Student students);
+        lib.destroy_students_bulk.argtypes = [ctypes.c_void_p]
+        lib.destroy_students_bulk.restype = None
+
+    # void calculate_fair_distribution_batch(int n, const int*com_credits, const int*rem_credits,
+    #     const float*curr_cwa, const float*target_cwa, const float*locked_wa,
+    #     const int*locked_credits, float*required, int*status);
+    # Older engine builds (e.g. the prebuilt cwa_engine.dll) do not export it.
+    if hasattr(lib, "calculate_fair_distribution_batch"):
+        int_array = np.ctypeslib.ndpointer(dtype=np.int32, ndim=1, flags="C_CONTIGUOUS")
+        float_array = np.ctypeslib.ndpointer(dtype=np.float32, ndim=1, flags="C_CONTIGUOUS")
+        lib.calculate_fair_distribution_batch.argtypes = [
+            ctypes.c_int,  # n
+            int_array,     # com_credits
+            int_array,     # rem_credits
+            float_array,   # curr_cwa
+            float_array,   # target_cwa
+            float_array,   # locked_wa
+            int_array,     # locked_credits
+            float_array,   # required (out)
+            int_array,     # status (out)
+        ]
+        lib.calculate_fair_distribution_batch.restype = None
+
+    # int allocate_scores(int n, const int*credits, const float*lower, const float*upper,
+    #     float required_wa, float*allocated);
+    if hasattr(lib, "allocate_scores"):
+        int_array = np.ctypeslib.ndpointer(dtype=np.int32, ndim=1, flags="C_CONTIGUOUS")
+        float_array = np.ctypeslib.ndpointer(dtype=np.float32, ndim=1, flags="C_CONTIGUOUS")
+        lib.allocate_scores.argtypes = [
+            ctypes.c_int,    # n
+            int_array,       # credits
+            float_array,     # lower
+            float_array,     # upper
+            ctypes.c_float,  # required_wa
+            float_array,     # allocated (out)
+        ]
+        lib.allocate_scores.restype = ctypes.c_int
 
 
 # -----------------------------------
@@ -51,34 +278,172 @@ class _StudentHandle:
     - Guarantees destroy_object is called exactly once
     """
 
-    def __init__(self, credits_completed: int, credits_remaining: int) -> None:
-        ptr = c_lib.init_student(int(credits_completed), int(credits_remaining))
+    def __init__(
+        self,
+        credits_completed: int,
+        credits_remaining: int,
+        current_cwa: float,
+        target_cwa: float,
+        name: str = "",
+    ) -> None:
+        # The engine keeps the name pointer, so the buffer must outlive the handle.
+        self._name = str(name or "").encode("utf-8")
+        ptr = _engine().init_student(
+            self._name,
+            int(credits_completed),
+            int(credits_remaining),
+            ctypes.c_float(float(current_cwa)),
+            ctypes.c_float(float(target_cwa)),
+        )
         if not ptr:
             raise RuntimeError("init_student returned NULL pointer")
         self._ptr = ptr
 
-    def calculate_dist_cwa(self, target_cwa: float, current_cwa: float) -> float:
+    def calculate_fair_distribution(self) -> float:
+        return float(_engine().calculate_fair_distribution(self._ptr))
+
+    def recalculate_fair_distribution(self, total_priority_wa: float, total_priority_credits: int) -> float:
         return float(
-            c_lib.calculate_dist_CWA(
+            _engine().recalculate_fair_distribution(
                 self._ptr,
-                ctypes.c_float(float(target_cwa)),
-                ctypes.c_float(float(current_cwa)),
+                ctypes.c_float(float(total_priority_wa)),
+                int(total_priority_credits),
             )
         )
 
-    def recalculate_dist_cwa(self, total_achievable_wa: float, total_achievable_credits: int) -> float:
+    def close(self) -> None:
+        if getattr(self, "_ptr", None):
+            _engine().destroy_object(self._ptr)
+            self._ptr = None
+
+    def __enter__(self) -> "_StudentHandle":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class _PooledStudent:
+    """
+    One slot of a _StudentPool, with the same calculate/recalculate methods
+    as _StudentHandle. close() hands the slot back to the pool instead of
+    freeing memory; use it as a context manager.
+    """
+
+    __slots__ = ("_pool", "_slot", "_ptr")
+
+    def __init__(self, pool: "_StudentPool", slot: int, ptr: int) -> None:
+        self._pool = pool
+        self._slot = slot
+        self._ptr = ptr
+
+    def calculate_fair_distribution(self) -> float:
+        return float(_engine().calculate_fair_distribution(self._ptr))
+
+    def recalculate_fair_distribution(self, total_priority_wa: float, total_priority_credits: int) -> float:
         return float(
-            c_lib.recalculate_dist_CWA(
+            _engine().recalculate_fair_distribution(
                 self._ptr,
-                ctypes.c_float(float(total_achievable_wa)),
-                int(total_achievable_credits),
+                ctypes.c_float(float(total_priority_wa)),
+                int(total_priority_credits),
             )
         )
 
     def close(self) -> None:
-        if getattr(self, "_ptr", None):
-            c_lib.destroy_object(self._ptr)
+        if self._ptr is not None:
             self._ptr = None
+            self._pool._release(self._slot)
+
+    def __enter__(self) -> "_PooledStudent":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _StudentPool:
+    """
+    Reusable student slots backed by init_students_bulk arenas.
+
+    - Slots are allocated one arena (block_size students) at a time
+    - acquire() re-initializes a free slot with set_student
+    - Released slots are reused, so a warmed-up pool never calls malloc/free
+    - All arenas are freed with destroy_students_bulk in close()
+    - Engine builds without the arena API get a fresh _StudentHandle per acquire()
+    """
+
+    def __init__(self, block_size: int = 64) -> None:
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self._block_size = int(block_size)
+        self._blocks: List[int] = []
+        self._slots: List[int] = []      # slot index -> Student pointer
+        self._names: List[bytes] = []    # keeps name buffers alive per slot
+        self._free: List[int] = []
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    def _grow(self) -> None:
+        lib = _engine()
+        block = lib.init_students_bulk(self._block_size)
+        if not block:
+            raise RuntimeError("init_students_bulk returned NULL pointer")
+        self._blocks.append(block)
+        base = len(self._slots)
+        for i in range(self._block_size):
+            self._slots.append(lib.student_at(block, i))
+            self._names.append(b"")
+        self._free.extend(range(base + self._block_size - 1, base - 1, -1))
+
+    def acquire(
+        self,
+        credits_completed: int,
+        credits_remaining: int,
+        current_cwa: float,
+        target_cwa: float,
+        name: str = "",
+    ):
+        _engine()
+        if not _has_student_arena:
+            return _StudentHandle(credits_completed, credits_remaining, current_cwa, target_cwa, name)
+
+        with self._lock:
+            if not self._free:
+                self._grow()
+            slot = self._free.pop()
+
+        name_buf = str(name or "").encode("utf-8")
+        self._names[slot] = name_buf
+        ptr = self._slots[slot]
+        _engine().set_student(
+            ptr,
+            name_buf,
+            int(credits_completed),
+            int(credits_remaining),
+            ctypes.c_float(float(current_cwa)),
+            ctypes.c_float(float(target_cwa)),
+        )
+        return _PooledStudent(self, slot, ptr)
+
+    def _release(self, slot: int) -> None:
+        with self._lock:
+            self._free.append(slot)
+
+    def close(self) -> None:
+        with self._lock:
+            blocks, self._blocks = self._blocks, []
+            self._slots, self._names, self._free = [], [], []
+        for block in blocks:
+            _engine().destroy_students_bulk(block)
 
     def __del__(self):
         try:
@@ -87,6 +452,10 @@ class _StudentHandle:
             pass
 
 
+# Shared pool used by calculate_cwa() and compute_summary().
+_student_pool = _StudentPool()
+
+
 # -----------------------------------
 # PUBLIC ENGINE FUNCTION (simple wrapper)
 # -----------------------------------
@@ -95,32 +464,163 @@ def calculate_cwa(name, completed, remaining, current, target):
     """
     Backwards-compatible wrapper for your earlier usage.
 
-    Now implemented using:
-        init_student
-        calculate_dist_CWA
-        destroy_object
+    Now implemented using a pooled student slot:
+        set_student
+        calculate_fair_distribution
     but keeps the same signature.
     """
-    student = _StudentHandle(int(completed), int(remaining))
-    try:
-        required = student.calculate_dist_cwa(float(target), float(current))
-    finally:
-        student.close()
+    with _student_pool.acquire(int(completed), int(remaining), float(current), float(target), name) as student:
+        required = student.calculate_fair_distribution()
     return required
 
 
+# -----------------------------------
+# STATELESS ENGINE CALLS + THREAD-POOL EVALUATOR
+# -----------------------------------
+
+def required_average(
+    completed: int,
+    remaining: int,
+    current_cwa: float,
+    target_cwa: float,
+    locked_wa: float = 0.0,
+    locked_credits: int = 0,
+) -> float:
+    """
+    Required average on the remaining credits, without any Student object.
+
+    Same rule as compute_summary(): the base distribution from
+    fair_distribution, replaced by fair_redistribution when there are
+    locked credits and the redistributed score is valid (> 0).
+
+    Both engine calls are pure, so this is safe to call from many threads;
+    ctypes releases the GIL for the duration of each call. Engine builds
+    without them get the same numbers from a short-lived Student handle.
+    """
+    com = int(completed)
+    rem = int(remaining)
+    lcr = int(locked_credits)
+    lwa = float(locked_wa)
+    recalc = lcr > 0 and lwa > 0.0 and lcr < rem
+
+    lib = _engine()
+    if not _has_stateless_calls:
+        with _StudentHandle(com, rem, current_cwa, target_cwa) as student:
+            required = student.calculate_fair_distribution()
+            if recalc:
+                new_required = student.recalculate_fair_distribution(lwa, lcr)
+                if new_required > 0:
+                    required = new_required
+        return required
+
+    cur = ctypes.c_float(float(current_cwa))
+    tgt = ctypes.c_float(float(target_cwa))
+
+    required = float(lib.fair_distribution(com, rem, cur, tgt))
+    if recalc:
+        new_required = float(lib.fair_redistribution(com, rem, cur, tgt, ctypes.c_float(lwa), lcr))
+        if new_required > 0:
+            required = new_required
+    return required
+
+
+class ThreadedEvaluator:
+    """
+    Evaluates many students concurrently with a ThreadPoolExecutor.
+
+    Work is split into chunks of chunk_size students. Each worker thread
+    evaluates its chunk with a single calculate_fair_distribution_batch call
+    (or per-student stateless calls on engine builds without the kernel).
+    ctypes drops the GIL during foreign calls, so chunks run in parallel on
+    all cores. Nothing is shared between calls, so one evaluator can be used
+    from several threads at once.
+
+    Usage:
+        with ThreadedEvaluator() as ev:
+            required, status = ev.required_averages(completed, remaining, current, target)
+            summaries = ev.summaries(payloads)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 4096) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.chunk_size = int(chunk_size)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cwa-engine")
+
+    @staticmethod
+    def _evaluate_chunk(completed, remaining, current_cwa, target_cwa, locked_wa, locked_cr):
+        if has_batch_kernel():
+            return _fair_distribution_batch(completed, remaining, current_cwa, target_cwa, locked_wa, locked_cr)
+
+        n = completed.shape[0]
+        required = np.zeros(n, dtype=np.float64)
+        for i in range(n):
+            if remaining[i] > 0:
+                required[i] = required_average(
+                    completed[i], remaining[i], current_cwa[i], target_cwa[i], locked_wa[i], locked_cr[i]
+                )
+        status = np.full(n, STATUS_OK, dtype=np.int8)
+        status[required == -1] = STATUS_ABOVE_MAX
+        status[required == -2] = STATUS_BELOW_MIN
+        status[remaining <= 0] = STATUS_NO_REMAINING
+        return required, status
+
+    def required_averages(self, completed, remaining, current_cwa, target_cwa, locked_wa=None, locked_credits=None):
+        """
+        Per-student arrays in, (required_avg, status) arrays out.
+
+        Values and status codes are the same as in compute_summaries().
+        """
+        com = np.asarray(completed, dtype=np.int64)
+        rem = np.asarray(remaining, dtype=np.int64)
+        n = com.shape[0]
+        cur = np.broadcast_to(np.asarray(current_cwa, dtype=np.float64), (n,))
+        tgt = np.broadcast_to(np.asarray(target_cwa, dtype=np.float64), (n,))
+        lwa = np.zeros(n) if locked_wa is None else np.broadcast_to(np.asarray(locked_wa, dtype=np.float64), (n,))
+        lcr = np.zeros(n, dtype=np.int64) if locked_credits is None else np.broadcast_to(
+            np.asarray(locked_credits, dtype=np.int64), (n,)
+        )
+
+        bounds = [(i, min(i + self.chunk_size, n)) for i in range(0, n, self.chunk_size)]
+        futures = [
+            self._executor.submit(self._evaluate_chunk, com[a:b], rem[a:b], cur[a:b], tgt[a:b], lwa[a:b], lcr[a:b])
+            for a, b in bounds
+        ]
+
+        required = np.empty(n, dtype=np.float64)
+        status = np.empty(n, dtype=np.int8)
+        for (a, b), fut in zip(bounds, futures):
+            required[a:b], status[a:b] = fut.result()
+        return required, status
+
+    def summaries(self, payloads: Iterable[dict]) -> List[dict]:
+        """compute_summary() for every payload, results in input order."""
+        return list(self._executor.map(compute_summary, payloads))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ThreadedEvaluator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 # -----------------------------------
 # HIGH-LEVEL SUMMARY FOR GUI
 # -----------------------------------
 
-def _safe_float(x: Any) -> float:
+def safe_float(x: Any) -> float:
+    """float(x), or 0.0 when x does not convert; how payload values are parsed."""
     try:
         return float(x)
     except Exception:
         return 0.0
 
 
-def _safe_int(x: Any) -> int:
+def safe_int(x: Any) -> int:
+    """int(float(x)) (truncating), or 0 when x does not convert; how credits are parsed."""
     try:
         return int(float(x))
     except Exception:
@@ -148,7 +648,7 @@ def compute_summary(payload: dict) -> dict:
          - remaining_credits: credits that have no 'current' yet (future/remaining)
          - current_cwa: weighted average of 'current' over all credits > 0
 
-      2. Call calculate_dist_CWA to get the base required average
+      2. Call calculate_fair_distribution to get the base required average
          for all remaining credits.
 
       3. Identify LOCKED courses among remaining:
@@ -161,7 +661,7 @@ def compute_summary(payload: dict) -> dict:
            total_achievable_WA = sum(allocated * credits)
            total_achievable_Credits = sum(credits)
 
-      4. If we have any locked courses, call recalculate_dist_CWA
+      4. If we have any locked courses, call recalculate_fair_distribution
          to get the redistributed required average on the *unlocked*
          portion of the remaining credits.
 
@@ -171,38 +671,103 @@ def compute_summary(payload: dict) -> dict:
          - total_credits
          - selected_credits   (here we treat as sum of LOCKED credits)
          - remaining_credits  (remaining_credits_total - locked_credits)
+
+    Results are memoized when the opt-in cache is enabled
+    (enable_summary_cache()).
     """
     courses: List[Dict[str, Any]] = payload.get("courses", []) or []
 
-    # --- credits + current weighted sum ---
+    if "target_cwa" not in payload:
+        raise ValueError("target_cwa is required in payload for compute_summary()")
+
+    cache = _summary_cache
+    if cache is not None:
+        key = SummaryCache.make_key(courses, payload.get("target_cwa"))
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        summary = _compute_summary(courses, payload.get("target_cwa"))
+        cache.put(key, summary)
+        return summary
+
+    return _compute_summary(courses, payload.get("target_cwa"))
+
+
+def _compute_summary(courses: List[Dict[str, Any]], target_cwa: Any) -> dict:
+    # --- credits + current weighted sum + locked courses, one pass ---
     completed_credits = 0
     remaining_credits_total = 0
     weighted_sum = 0.0
+    locked_wa = 0.0
+    locked_cr = 0
 
     for c in courses:
-        cr = _safe_int(c.get("credits", 0))
-        if cr <= 0:
+        contribution = _course_contribution(c.get("credits", 0), c.get("current", 0.0), c.get("allocated", 0.0))
+        if contribution is None:
             continue
 
-        cur = _safe_float(c.get("current", 0.0))
+        done_cr, remain_cr, wa, l_wa, l_cr = contribution
+        completed_credits += done_cr
+        remaining_credits_total += remain_cr
+        weighted_sum += wa
+        if l_cr:
+            locked_wa += l_wa
+            locked_cr += l_cr
+
+    return summary_from_totals(
+        completed_credits, remaining_credits_total, weighted_sum, locked_wa, locked_cr, safe_float(target_cwa)
+    )
+
+
+def _course_contribution(credits: Any, current: Any, allocated: Any):
+    """
+    What one course row adds to the compute_summary() totals, as
+    (completed_credits, remaining_credits, weighted_sum, locked_wa, locked_credits),
+    or None for rows that are ignored (credits <= 0).
+    """
+    cr = safe_int(credits)
+    if cr <= 0:
+        return None
+
+    cur = safe_float(current)
+    alloc = safe_float(allocated)
+
+    # A course is "locked" if:
+    # - it is part of the remaining group (no current yet)
+    # - user has set an allocated score
+    # - AND current >= allocated (same as Target tick rule)
+    locked = cur <= 0.0 and alloc > 0.0 and cur >= alloc
+
+    return (
+        cr if cur > 0.0 else 0,
+        0 if cur > 0.0 else cr,
+        cr * cur,
+        alloc * cr if locked else 0.0,
+        cr if locked else 0,
+    )
 
-        if cur > 0.0:
-            completed_credits += cr
-        else:
-            remaining_credits_total += cr
 
-        weighted_sum += cr * cur
+def summary_from_totals(
+    completed_credits: int,
+    remaining_credits_total: int,
+    weighted_sum: float,
+    locked_wa: float,
+    locked_cr: int,
+    target_cwa: float,
+) -> dict:
+    """
+    compute_summary() from a student's aggregated course totals.
 
+    The totals are what _course_contribution() adds up over the courses
+    (and what SummaryAccumulator keeps): completed and remaining credits,
+    the credit-weighted score sum, and the allocated weighted average and
+    credits of locked courses. Returns the same dict as compute_summary().
+    """
     total_credits = completed_credits + remaining_credits_total
 
     # Current CWA (approximate, as before)
     current_cwa = (weighted_sum / total_credits) if total_credits > 0 else 0.0
 
-    if "target_cwa" not in payload:
-        raise ValueError("target_cwa is required in payload for compute_summary()")
-
-    target_cwa = _safe_float(payload.get("target_cwa"))
-
     # No remaining credits => nothing to compute
     if remaining_credits_total <= 0 or total_credits <= 0:
         return {
@@ -214,35 +779,16 @@ def compute_summary(payload: dict) -> dict:
         }
 
     # ---- 1) Base distribution for all remaining credits ----
-    student = _StudentHandle(completed_credits, remaining_credits_total)
+    student = _student_pool.acquire(completed_credits, remaining_credits_total, current_cwa, target_cwa)
     try:
-        base_required = student.calculate_dist_cwa(target_cwa, current_cwa)
+        base_required = student.calculate_fair_distribution()
 
         # ---- 2) Locked courses among remaining (for recalc) ----
-        locked_wa = 0.0
-        locked_cr = 0
-
-        for c in courses:
-            cr = _safe_int(c.get("credits", 0))
-            if cr <= 0:
-                continue
-
-            cur = _safe_float(c.get("current", 0.0))
-            alloc = _safe_float(c.get("allocated", 0.0))
-
-            # A course is "locked" if:
-            # - it is part of the remaining group (no current yet)
-            # - user has set an allocated score
-            # - AND current >= allocated (same as Target tick rule)
-            if cur <= 0.0 and alloc > 0.0 and cur >= alloc:
-                locked_wa += alloc * cr
-                locked_cr += cr
-
         required_avg = base_required
 
         # Only recalc if there are truly locked courses
         if locked_cr > 0 and locked_wa > 0.0 and locked_cr < remaining_credits_total:
-            new_required = student.recalculate_dist_cwa(locked_wa, locked_cr)
+            new_required = student.recalculate_fair_distribution(locked_wa, locked_cr)
             # If recalc returns an error code (<0), keep base_required
             if new_required > 0:
                 required_avg = new_required
@@ -260,4 +806,1051 @@ def compute_summary(payload: dict) -> dict:
         "total_credits": total_credits,
         "selected_credits": locked_cr,
         "remaining_credits": max(0, remaining_credits_total - locked_cr),
-    }
\ No newline at end of file
+    }
+
+
+class SummaryAccumulator:
+    """
+    Running compute_summary() totals for an editable set of course rows.
+
+    Each row is stored under a caller-chosen key. set_row() subtracts the
+    row's previous contribution and adds the new one, so a single-cell edit
+    costs O(1) no matter how many rows exist. summary() then needs only the
+    engine step and returns the same dict as compute_summary().
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[Any, tuple] = {}
+        self.clear()
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self.completed_credits = 0
+        self.remaining_credits = 0
+        self.weighted_sum = 0.0
+        self.locked_wa = 0.0
+        self.locked_credits = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def total_credits(self) -> int:
+        return self.completed_credits + self.remaining_credits
+
+    def _apply(self, contribution: tuple, sign: int) -> None:
+        done_cr, remain_cr, wa, l_wa, l_cr = contribution
+        self.completed_credits += sign * done_cr
+        self.remaining_credits += sign * remain_cr
+        self.weighted_sum += sign * wa
+        self.locked_wa += sign * l_wa
+        self.locked_credits += sign * l_cr
+
+    def set_row(self, key: Any, credits: Any, current: Any, allocated: Any) -> None:
+        old = self._rows.pop(key, None)
+        if old is not None:
+            self._apply(old, -1)
+
+        new = _course_contribution(credits, current, allocated)
+        if new is not None:
+            self._rows[key] = new
+            self._apply(new, +1)
+
+        if not self._rows:
+            # drop float residue from the running sums
+            self.weighted_sum = 0.0
+            self.locked_wa = 0.0
+
+    def remove_row(self, key: Any) -> None:
+        self.set_row(key, 0, 0.0, 0.0)
+
+    def snapshot(self) -> "SummaryAccumulator":
+        """
+        Detached copy of the running totals (without the per-row entries).
+
+        summary() and sweep() on the copy give the same results as on this
+        accumulator at the time of the call, so another thread can evaluate
+        it while rows keep changing here.
+        """
+        snap = SummaryAccumulator()
+        snap.completed_credits = self.completed_credits
+        snap.remaining_credits = self.remaining_credits
+        snap.weighted_sum = self.weighted_sum
+        snap.locked_wa = self.locked_wa
+        snap.locked_credits = self.locked_credits
+        return snap
+
+    def summary(self, target_cwa: float) -> dict:
+        return summary_from_totals(
+            self.completed_credits,
+            self.remaining_credits,
+            self.weighted_sum,
+            self.locked_wa,
+            self.locked_credits,
+            safe_float(target_cwa),
+        )
+
+    def sweep(self, targets) -> dict:
+        """target_sweep() for the current rows: summary() at every target in one call."""
+        total = self.total_credits
+        return target_sweep(
+            self.completed_credits,
+            self.remaining_credits,
+            self.weighted_sum / total if total > 0 else 0.0,
+            targets,
+            self.locked_wa,
+            self.locked_credits,
+        )
+
+# -----------------------------------
+# OPT-IN SUMMARY CACHE
+# -----------------------------------
+
+class SummaryCache:
+    """
+    Bounded LRU cache of compute_summary() results.
+
+    The key is the canonical form of the payload: the target and the
+    (credits, current, allocated) values of each course after the same
+    parsing compute_summary() applies, in input order. Course names and
+    rows with credits <= 0 do not change the result, so they are left out.
+    get() returns a copy, so callers may modify the dict they receive.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = int(maxsize)
+        self._entries: "OrderedDict[tuple, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(courses: Iterable[Dict[str, Any]], target_cwa: Any) -> tuple:
+        rows = []
+        for c in courses:
+            cr = safe_int(c.get("credits", 0))
+            if cr > 0:
+                rows.append((cr, safe_float(c.get("current", 0.0)), safe_float(c.get("allocated", 0.0))))
+        return safe_float(target_cwa), tuple(rows)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[dict]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return dict(value)
+
+    def put(self, key: tuple, value: dict) -> None:
+        with self._lock:
+            self._entries[key] = dict(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Disabled (None) by default; see enable_summary_cache().
+_summary_cache: Optional[SummaryCache] = None
+
+
+def enable_summary_cache(maxsize: int = 1024) -> SummaryCache:
+    """Turn on caching in compute_summary(), replacing any existing cache."""
+    global _summary_cache
+    _summary_cache = SummaryCache(maxsize)
+    return _summary_cache
+
+
+def disable_summary_cache() -> None:
+    global _summary_cache
+    _summary_cache = None
+
+
+def invalidate_summary_cache() -> None:
+    """
+    Invalidation hook: call it when cached results may be out of date
+    (for example after the engine library has been replaced).
+    """
+    cache = _summary_cache
+    if cache is not None:
+        cache.invalidate()
+
+
+def summary_cache_stats() -> Optional[dict]:
+    """Hit/miss/eviction counters, or None while the cache is disabled."""
+    cache = _summary_cache
+    return cache.stats() if cache is not None else None
+
+
+# -----------------------------------
+# COHORT-SCALE BATCH SUMMARY
+# -----------------------------------
+
+# Status codes returned by compute_summaries(). The negative values mirror
+# the sentinels returned by the C engine's distribution functions.
+STATUS_OK = 0
+STATUS_NO_REMAINING = 1
+STATUS_ABOVE_MAX = -1
+STATUS_BELOW_MIN = -2
+
+
+def _engine_distribution(wa_remain: np.ndarray, credits: np.ndarray) -> np.ndarray:
+    """
+    NumPy port of the C engine's score distribution step.
+
+    All arithmetic is float32, exactly like the C code, so the results are
+    bit-identical to what the per-student ctypes calls return:
+      -1 if the required score is above 100
+      -2 if it is below 0
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = wa_remain / credits.astype(np.float32)
+    score = np.where(score > 100, np.float32(-1), np.where(score < 0, np.float32(-2), score))
+    return score.astype(np.float32)
+
+
+def _engine_wa_remain(completed: np.ndarray, remaining: np.ndarray,
+                      current_cwa: np.ndarray, target_cwa: np.ndarray) -> np.ndarray:
+    """Remaining weighted sum, as stored in student->wa_remain by the engine."""
+    total = (completed + remaining).astype(np.float32)
+    wa_completed = current_cwa.astype(np.float32) * completed.astype(np.float32)
+    return target_cwa.astype(np.float32) * total - wa_completed
+
+
+def _fair_distribution_batch(completed, remaining, current_cwa, target_cwa, locked_wa, locked_cr):
+    """
+    Required averages and status codes for many students at once.
+
+    Uses the engine's calculate_fair_distribution_batch kernel when the loaded
+    library exports it, and the float32 NumPy port otherwise. Both produce the
+    same values as the per-student init_student / calculate / recalculate calls.
+    """
+    n = completed.shape[0]
+
+    if has_batch_kernel():
+        required = np.empty(n, dtype=np.float32)
+        status = np.empty(n, dtype=np.int32)
+        _engine().calculate_fair_distribution_batch(
+            n,
+            np.ascontiguousarray(completed, dtype=np.int32),
+            np.ascontiguousarray(remaining, dtype=np.int32),
+            np.ascontiguousarray(current_cwa, dtype=np.float32),
+            np.ascontiguousarray(target_cwa, dtype=np.float32),
+            np.ascontiguousarray(locked_wa, dtype=np.float32),
+            np.ascontiguousarray(locked_cr, dtype=np.int32),
+            required,
+            status,
+        )
+        return required.astype(np.float64), status.astype(np.int8)
+
+    active = remaining > 0
+    wa_remain = _engine_wa_remain(completed, remaining, current_cwa, target_cwa)
+    base_required = _engine_distribution(wa_remain, remaining)
+
+    recalc = (locked_cr > 0) & (locked_wa > 0.0) & (locked_cr < remaining)
+    new_required = _engine_distribution(wa_remain - locked_wa.astype(np.float32), remaining - locked_cr)
+    required = np.where(recalc & (new_required > 0), new_required, base_required)
+    required = np.where(active, required.astype(np.float64), 0.0)
+
+    status = np.full(n, STATUS_OK, dtype=np.int8)
+    status[required == -1] = STATUS_ABOVE_MAX
+    status[required == -2] = STATUS_BELOW_MIN
+    status[~active] = STATUS_NO_REMAINING
+    return required, status
+
+
+def as_credit_array(x: Any) -> np.ndarray:
+    """
+    Vectorized safe_int(): truncate towards zero, non-finite -> 0.
+
+    Integer arrays (e.g. a cohort file's int32 memmap) are returned as they
+    are, without a copy.
+    """
+    arr = np.asarray(x)
+    if arr.dtype.kind in "iu":
+        return arr
+    arr = np.asarray(arr, dtype=np.float64)
+    arr = np.where(np.isfinite(arr), arr, 0.0)
+    return arr.astype(np.int64)
+
+
+def compute_summaries(student_id, credits, current, allocated, target_cwa) -> dict:
+    """
+    Cohort-scale, columnar version of compute_summary().
+
+    Inputs are flat arrays with one entry per course row:
+
+        student_id : any sortable dtype (int, str, ...)
+        credits    : course credits
+        current    : current score (0 / empty for remaining courses)
+        allocated  : allocated score
+
+    plus target_cwa, which is either a scalar or one value per student in
+    the order of np.unique(student_id) (i.e. the returned "student_id").
+
+    Rows do not need to be grouped by student, but rows of the same student
+    are accumulated in the order they appear, exactly like compute_summary()
+    walks its "courses" list. For every student the returned values are
+    identical to compute_summary() on that student's courses.
+
+    Returns a dict of arrays (one entry per student):
+        student_id, current_cwa, required_avg, total_credits,
+        selected_credits, remaining_credits, status
+
+    status is STATUS_OK, STATUS_NO_REMAINING (nothing left to distribute)
+    or the engine error codes STATUS_ABOVE_MAX / STATUS_BELOW_MIN.
+    """
+    sid = np.asarray(student_id)
+    cr = as_credit_array(credits)
+    cur = np.asarray(current, dtype=np.float64)
+    alloc = np.asarray(allocated, dtype=np.float64)
+
+    if not (sid.shape == cr.shape == cur.shape == alloc.shape) or sid.ndim != 1:
+        raise ValueError("student_id, credits, current and allocated must be 1-D arrays of equal length")
+
+    ids, inverse = _unique_inverse(sid)
+    return _summaries_from_rows(ids, inverse, cr, cur, alloc, target_cwa)
+
+
+def compute_summaries_grouped(student_ids, offsets, credits, current, allocated, target_cwa) -> dict:
+    """
+    compute_summaries() for rows that are already grouped by student.
+
+    Student i owns rows offsets[i]:offsets[i + 1] (CSR layout, so offsets has
+    one more entry than student_ids). target_cwa is a scalar or one value per
+    student. No sort is needed: the column arrays (e.g. np.memmap views) are
+    read in place, integer credits and float64 scores without a dtype copy,
+    and per-student totals are segment sums over the offsets. Results are in
+    student_ids order, with the same values compute_summaries() gives, except
+    that current_cwa may differ in the last bit: reduceat adds a segment's
+    scores in a different order than bincount does.
+    """
+    ids = np.asarray(student_ids)
+    off = np.asarray(offsets, dtype=np.int64)
+    cr = as_credit_array(credits)
+    cur = np.asarray(current, dtype=np.float64)
+    alloc = np.asarray(allocated, dtype=np.float64)
+
+    n = ids.shape[0]
+    rows = cr.shape[0]
+    if ids.ndim != 1 or off.shape != (n + 1,):
+        raise ValueError("offsets must have len(student_ids) + 1 entries")
+    if not (cr.shape == cur.shape == alloc.shape) or cr.ndim != 1:
+        raise ValueError("credits, current and allocated must be 1-D arrays of equal length")
+    if off[0] != 0 or off[-1] != rows or np.any(np.diff(off) < 0):
+        raise ValueError("offsets must start at 0, end at the row count and never decrease")
+
+    target = _student_targets(target_cwa, n)
+
+    # reduceat needs in-range starts and gives an empty segment the value at
+    # its start, so sum over students with rows and scatter into zeros
+    has_rows = np.flatnonzero(off[1:] > off[:-1])
+    starts = off[:-1][has_rows]
+
+    def segment_sum(values: np.ndarray, dtype) -> np.ndarray:
+        out = np.zeros(n, dtype=dtype)
+        if starts.size:
+            out[has_rows] = np.add.reduceat(values, starts, dtype=dtype)
+        return out
+
+    # same rules as _summaries_from_rows(): rows with credits <= 0 are ignored
+    valid = cr > 0
+    done = cur > 0.0
+    locked = valid & ~done & (alloc > 0.0) & (cur >= alloc)
+
+    completed = segment_sum(np.where(valid & done, cr, 0), np.int64)
+    remaining_total = segment_sum(np.where(valid & ~done, cr, 0), np.int64)
+    weighted_sum = segment_sum(np.where(valid, cr * cur, 0.0), np.float64)
+    locked_wa = segment_sum(np.where(locked, alloc * cr, 0.0), np.float64)
+    locked_cr = segment_sum(np.where(locked, cr, 0), np.int64)
+
+    return summaries_from_totals(ids, completed, remaining_total, weighted_sum, locked_wa, locked_cr, target)
+
+
+def compute_summary_many(payloads: Iterable[dict]) -> List[dict]:
+    """
+    compute_summary() for many payloads with one batched engine call.
+
+    Returns one dict per payload, in order, with the same values as
+    compute_summary() plus the STATUS_* code under "status". Raises
+    ValueError if any payload has no target_cwa.
+    """
+    owner: List[int] = []
+    credits: List[int] = []
+    current: List[float] = []
+    allocated: List[float] = []
+    targets: List[float] = []
+
+    for i, payload in enumerate(payloads):
+        if "target_cwa" not in payload:
+            raise ValueError(f"target_cwa is required in payload {i}")
+        for c in payload.get("courses", []) or []:
+            owner.append(i)
+            credits.append(safe_int(c.get("credits", 0)))
+            current.append(safe_float(c.get("current", 0.0)))
+            allocated.append(safe_float(c.get("allocated", 0.0)))
+        targets.append(safe_float(payload.get("target_cwa")))
+
+    # bincount totals add each payload's courses in order, like compute_summary()
+    n = len(targets)
+    result = _summaries_from_rows(
+        np.arange(n),
+        np.asarray(owner, dtype=np.int64),
+        np.asarray(credits, dtype=np.int64),
+        np.asarray(current, dtype=np.float64),
+        np.asarray(allocated, dtype=np.float64),
+        targets,
+    )
+
+    columns = {
+        "current_cwa": result["current_cwa"].tolist(),
+        "required_avg": result["required_avg"].tolist(),
+        "total_credits": result["total_credits"].tolist(),
+        "selected_credits": result["selected_credits"].tolist(),
+        "remaining_credits": result["remaining_credits"].tolist(),
+        "status": result["status"].tolist(),
+    }
+    return [{key: values[i] for key, values in columns.items()} for i in range(n)]
+
+
+def _student_targets(target_cwa, n: int) -> np.ndarray:
+    target = np.asarray(target_cwa, dtype=np.float64)
+    if target.ndim == 0:
+        return np.full(n, float(target))
+    if target.shape != (n,):
+        raise ValueError(f"target_cwa must be a scalar or have one value per student ({n})")
+    return target
+
+
+def _unique_inverse(sid: np.ndarray):
+    # np.unique(sid, return_inverse=True), without the sort when the rows are
+    # already ordered by student (the usual extract layout): ids start where
+    # the value changes and the inverse is a running count of those starts
+    if sid.size and np.all(sid[1:] >= sid[:-1]):
+        starts = np.empty(sid.size, dtype=bool)
+        starts[0] = True
+        np.not_equal(sid[1:], sid[:-1], out=starts[1:])
+        return sid[starts], np.cumsum(starts) - 1
+    ids, inverse = np.unique(sid, return_inverse=True)
+    return ids, inverse.reshape(-1)
+
+
+def _summaries_from_rows(ids, inverse, cr, cur, alloc, target_cwa) -> dict:
+    """Shared body of compute_summaries(): per-row arrays + row->student index in, per-student dict out."""
+    n = ids.shape[0]
+    target = _student_targets(target_cwa, n)
+
+    # Per-student sums are weighted bincounts over the full row arrays, with
+    # the masks applied to the weights (0 for excluded rows) rather than by
+    # gathering filtered copies. Adding 0.0 leaves a running sum unchanged,
+    # so each student's rows still add up in order, as in compute_summary().
+    def student_sum(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(inverse, weights=weights, minlength=n)
+
+    # --- credits + current weighted sum (rows with credits <= 0 are ignored) ---
+    valid = cr > 0
+    done = cur > 0.0
+    credit_w = np.where(valid, cr, 0.0)
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        completed_f = student_sum(np.where(done, credit_w, 0.0))
+        completed = completed_f.astype(np.int64)
+        # credit sums are whole numbers, so the difference is exact
+        remaining_total = (student_sum(credit_w) - completed_f).astype(np.int64)
+        weighted_sum = student_sum(np.where(valid, cr * cur, 0.0))
+
+        # --- locked courses among remaining (same rule as compute_summary) ---
+        locked = valid & ~done & (alloc > 0.0) & (cur >= alloc)
+        locked_wa = student_sum(np.where(locked, alloc * credit_w, 0.0))
+        locked_cr = student_sum(np.where(locked, credit_w, 0.0)).astype(np.int64)
+
+    return summaries_from_totals(ids, completed, remaining_total, weighted_sum, locked_wa, locked_cr, target)
+
+
+def summaries_from_totals(ids, completed, remaining_total, weighted_sum, locked_wa, locked_cr, target) -> dict:
+    """
+    compute_summaries() from per-student totals, one array entry per student.
+
+    The arrays hold the summary_from_totals() totals of each student; the
+    result has the same keys and order as compute_summaries().
+    """
+    total_credits = completed + remaining_total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        current_cwa = np.where(total_credits > 0, weighted_sum / np.maximum(total_credits, 1), 0.0)
+
+    # --- engine math, one call for the whole cohort ---
+    active = remaining_total > 0
+    required, status = _fair_distribution_batch(
+        completed, remaining_total, current_cwa, target, locked_wa, locked_cr
+    )
+
+    return {
+        "student_id": ids,
+        "current_cwa": current_cwa,
+        "required_avg": required,
+        "total_credits": total_credits,
+        "selected_credits": np.where(active, locked_cr, 0),
+        "remaining_credits": np.where(active, np.maximum(0, remaining_total - locked_cr), 0),
+        "status": status,
+    }
+
+
+# -----------------------------------
+# TARGET-CWA SWEEP
+# -----------------------------------
+
+def target_sweep(completed, remaining, current_cwa, targets, locked_wa=0.0, locked_credits=0) -> dict:
+    """
+    Required average for one student at every target in `targets`.
+
+    All targets go through the batch kernel (or its NumPy port) in one call,
+    with no Student allocation. Each value equals what compute_summary() /
+    calculate_cwa() give for that target.
+
+    Returns arrays aligned with targets:
+        target_cwa, required_avg, status (STATUS_* codes) and feasible.
+    A target is feasible when the required average is within 0..100, or,
+    with no remaining credits, when current_cwa already meets it.
+    """
+    tgt = np.atleast_1d(np.asarray(targets, dtype=np.float64))
+    if tgt.ndim != 1:
+        raise ValueError("targets must be a scalar or a 1-D array")
+    n = tgt.shape[0]
+
+    com = np.full(n, int(completed), dtype=np.int64)
+    rem = np.full(n, int(remaining), dtype=np.int64)
+    required, status = _fair_distribution_batch(
+        com,
+        rem,
+        np.full(n, float(current_cwa)),
+        tgt,
+        np.full(n, float(locked_wa)),
+        np.full(n, int(locked_credits), dtype=np.int64),
+    )
+
+    feasible = (status == STATUS_OK) | ((status == STATUS_NO_REMAINING) & (float(current_cwa) >= tgt))
+    return {"target_cwa": tgt, "required_avg": required, "status": status, "feasible": feasible}
+
+
+# -----------------------------------
+# SEMESTER TRAJECTORIES
+# -----------------------------------
+
+def cwa_trajectories(student_id, semester, credits, current, allocated=None) -> dict:
+    """
+    Cumulative CWA after every semester, for a whole cohort at once.
+
+    Inputs are flat per-row arrays as in compute_summaries(), plus the
+    semester of each row (any sortable dtype). Credit-weighted scores are
+    summed into a (students, semesters) grid and prefix-summed along the
+    semesters, so the cost is one pass over the rows plus O(N x S).
+
+    Returns:
+        student_id        (N,)   np.unique(student_id)
+        semester          (S,)   np.unique(semester), the column order
+        cwa               (N, S) CWA over completed courses (current > 0) up
+                                 to and including each semester; NaN before
+                                 the first completed course
+        completed_credits (N, S) the credits behind each cwa value
+        projected         (N, S) only with allocated: as cwa, but remaining
+                                 courses with an allocated score count at
+                                 that score
+
+    Rows with credits <= 0 are ignored, as in compute_summary(), but their
+    semesters still get a column.
+    """
+    sid = np.asarray(student_id)
+    sem = np.asarray(semester)
+    cr = as_credit_array(credits)
+    cur = np.asarray(current, dtype=np.float64)
+
+    ids, s_inv = np.unique(sid, return_inverse=True)
+    sems, m_inv = np.unique(sem, return_inverse=True)
+    n = ids.shape[0]
+    s = sems.shape[0]
+    cell = s_inv.reshape(-1) * s + m_inv.reshape(-1)
+
+    def prefix_cwa(score: np.ndarray, counted: np.ndarray):
+        w = np.bincount(cell[counted], weights=cr[counted] * score[counted], minlength=n * s)
+        c = np.bincount(cell[counted], weights=cr[counted], minlength=n * s)
+        cum_w = np.cumsum(w.reshape(n, s), axis=1)
+        cum_c = np.cumsum(c.reshape(n, s), axis=1).astype(np.int64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cwa = np.where(cum_c > 0, cum_w / np.maximum(cum_c, 1), np.nan)
+        return cwa, cum_c
+
+    done = (cr > 0) & (cur > 0.0)
+    cwa, completed = prefix_cwa(cur, done)
+    out = {"student_id": ids, "semester": sems, "cwa": cwa, "completed_credits": completed}
+
+    if allocated is not None:
+        alloc = np.asarray(allocated, dtype=np.float64)
+        planned = (cr > 0) & (cur <= 0.0) & (alloc > 0.0)
+        out["projected"], _ = prefix_cwa(np.where(done, cur, alloc), done | planned)
+    return out
+
+
+def cwa_trajectory(semesters: List[List[Dict[str, Any]]]) -> dict:
+    """
+    cwa_trajectories() for one student.
+
+    semesters is a list of course lists, each course a compute_summary()
+    style dict. Returns 1-D arrays (one value per semester): cwa,
+    completed_credits and projected.
+    """
+    rows = [(i, c) for i, courses in enumerate(semesters) for c in courses]
+    if not rows:
+        empty = np.full(len(semesters), np.nan)
+        return {"cwa": empty, "completed_credits": np.zeros(len(semesters), dtype=np.int64), "projected": empty.copy()}
+
+    result = cwa_trajectories(
+        np.zeros(len(rows), dtype=np.int64),
+        [i for i, _ in rows],
+        [c.get("credits", 0) for _, c in rows],
+        [safe_float(c.get("current", 0.0)) for _, c in rows],
+        [safe_float(c.get("allocated", 0.0)) for _, c in rows],
+    )
+    # semesters without any course rows still get a column (carrying the previous value)
+    cols = np.searchsorted(result["semester"], np.arange(len(semesters)), side="right") - 1
+    out = {}
+    for key in ("cwa", "completed_credits", "projected"):
+        row = result[key][0]
+        out[key] = np.where(cols >= 0, row[np.maximum(cols, 0)], np.nan if key != "completed_credits" else 0)
+    out["completed_credits"] = out["completed_credits"].astype(np.int64)
+    return out
+
+
+def _trajectory_contribution(credits: Any, current: Any, allocated: Any):
+    """
+    What one course adds to its semester's cwa_trajectories() totals, as
+    (completed_credits, completed_weighted, projected_credits, projected_weighted),
+    or None for rows that are ignored (credits <= 0).
+    """
+    cr = safe_int(credits)
+    if cr <= 0:
+        return None
+    cur = safe_float(current)
+    alloc = safe_float(allocated)
+    if cur > 0.0:
+        return (cr, cr * cur, cr, cr * cur)
+    if alloc > 0.0:
+        return (0, 0.0, cr, cr * alloc)
+    return (0, 0.0, 0, 0.0)
+
+
+class TrajectoryAccumulator:
+    """
+    Running per-semester totals behind cwa_trajectory(), for editable rows.
+
+    Like SummaryAccumulator, each row is stored under a caller-chosen key
+    and set_row() swaps its old contribution for the new one in O(1).
+    trajectory() then prefix-sums the semester totals, so it costs
+    O(semesters) whatever the number of rows, with the same rules as
+    cwa_trajectories().
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[Any, tuple] = {}
+        self._totals: Dict[Any, list] = {}
+
+    def clear(self) -> None:
+        self._rows.clear()
+        self._totals.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _apply(self, semester: Any, contribution: tuple, sign: int) -> None:
+        totals = self._totals.setdefault(semester, [0, 0.0, 0, 0.0])
+        for i, v in enumerate(contribution):
+            totals[i] += sign * v
+        # drop float residue once a semester's credits are gone
+        if totals[0] == 0:
+            totals[1] = 0.0
+        if totals[2] == 0:
+            totals[3] = 0.0
+
+    def set_row(self, key: Any, semester: Any, credits: Any, current: Any, allocated: Any) -> None:
+        old = self._rows.pop(key, None)
+        if old is not None:
+            self._apply(old[0], old[1], -1)
+
+        new = _trajectory_contribution(credits, current, allocated)
+        if new is not None:
+            self._rows[key] = (semester, new)
+            self._apply(semester, new, +1)
+
+    def remove_row(self, key: Any) -> None:
+        old = self._rows.pop(key, None)
+        if old is not None:
+            self._apply(old[0], old[1], -1)
+
+    def trajectory(self, semesters: Iterable[Any]) -> dict:
+        """
+        cwa, completed_credits and projected after each semester in
+        `semesters` (in that order), as 1-D arrays like cwa_trajectory().
+        """
+        zero = (0, 0.0, 0, 0.0)
+        totals = np.array([self._totals.get(sem, zero) for sem in semesters], dtype=np.float64).reshape(-1, 4)
+        cum = np.cumsum(totals, axis=0)
+        done_cr = cum[:, 0].astype(np.int64)
+        plan_cr = cum[:, 2].astype(np.int64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cwa = np.where(done_cr > 0, cum[:, 1] / np.maximum(done_cr, 1), np.nan)
+            projected = np.where(plan_cr > 0, cum[:, 3] / np.maximum(plan_cr, 1), np.nan)
+        return {"cwa": cwa, "completed_credits": done_cr, "projected": projected}
+
+
+# -----------------------------------
+# PER-COURSE ALLOCATION SOLVER
+# -----------------------------------
+
+# Extra status code of allocate_scores(): lower > upper for some course
+STATUS_INVALID = -3
+
+
+def _allocate_levels(cr: np.ndarray, lo: np.ndarray, hi: np.ndarray, required_wa: float):
+    """NumPy port of the engine's allocate_scores() water-filling (same operation order)."""
+    active = cr > 0
+    weights = cr[active].astype(np.float64)
+    lo_a = lo[active].astype(np.float64)
+    hi_a = hi[active].astype(np.float64)
+
+    floor_wa = float(np.cumsum(weights * lo_a)[-1]) if weights.size else 0.0
+    cap_wa = float(np.cumsum(weights * hi_a)[-1]) if weights.size else 0.0
+
+    if floor_wa >= required_wa or cap_wa < required_wa:
+        bound = lo if floor_wa >= required_wa else hi
+        allocated = np.where(active, bound, np.float32(0))
+        if floor_wa == required_wa:
+            return allocated, STATUS_OK
+        return allocated, STATUS_BELOW_MIN if floor_wa > required_wa else STATUS_ABOVE_MAX
+
+    values = np.concatenate([lo_a, hi_a])
+    deltas = np.concatenate([cr[active], -cr[active]]).astype(np.int64)
+    order = np.argsort(values, kind="stable")
+    values = values[order]
+    deltas = deltas[order]
+
+    # slope and weighted sum in effect just before each breakpoint
+    slope = np.concatenate([[0], np.cumsum(deltas)[:-1]])
+    steps = slope * np.diff(values, prepend=values[0])
+    wa = floor_wa + np.concatenate([[0.0], np.cumsum(steps)])
+
+    reached = np.flatnonzero((slope > 0) & (wa[1:] >= required_wa))
+    k = int(reached[0])
+    level = values[k - 1] + (required_wa - wa[k]) / slope[k]
+
+    score = np.float32(level)
+    allocated = np.where(active, np.minimum(np.maximum(score, lo), hi), np.float32(0))
+    return allocated, STATUS_OK
+
+
+def allocate_scores(credits, required_wa: float, lower=0.0, upper=100.0) -> dict:
+    """
+    Per-course scores that bring in required_wa weighted points.
+
+    Each course i gets a score within [lower[i], upper[i]] (scalars apply to
+    every course); the scores are clamp(level, lower, upper) for the lowest
+    level that reaches required_wa, which minimizes the highest score any
+    course needs. Courses with credits <= 0 get 0.
+
+    Returns allocated (float array aligned with credits), level (the highest
+    allocated score) and status: STATUS_OK, STATUS_ABOVE_MAX (unreachable,
+    courses set to their upper bounds), STATUS_BELOW_MIN (already met at the
+    lower bounds, courses set to them) or STATUS_INVALID (lower > upper).
+
+    Uses the engine's allocate_scores() when the loaded library exports it.
+    """
+    cr = as_credit_array(credits).astype(np.int32)
+    if cr.ndim != 1:
+        raise ValueError("credits must be a 1-D array")
+    n = cr.shape[0]
+    lo = np.ascontiguousarray(np.broadcast_to(np.asarray(lower, dtype=np.float32), (n,)))
+    hi = np.ascontiguousarray(np.broadcast_to(np.asarray(upper, dtype=np.float32), (n,)))
+
+    if np.any(lo > hi):
+        allocated, status = np.zeros(n, dtype=np.float32), STATUS_INVALID
+    elif hasattr(_engine(), "allocate_scores"):
+        allocated = np.empty(n, dtype=np.float32)
+        status = _engine().allocate_scores(n, cr, lo, hi, float(np.float32(required_wa)), allocated)
+    else:
+        allocated, status = _allocate_levels(cr, lo, hi, float(np.float32(required_wa)))
+
+    allocated = allocated.astype(np.float64)
+    active = cr > 0
+    return {
+        "allocated": allocated,
+        "level": float(allocated[active].max()) if active.any() else 0.0,
+        "status": int(status),
+    }
+
+
+# -----------------------------------
+# OPTIONAL INSTRUMENTATION
+# -----------------------------------
+
+# Latency histogram bucket bounds in seconds: 100 ns, doubling up to ~107 s
+METRIC_BUCKETS = tuple(1e-7 * 2 ** k for k in range(31))
+
+
+class _LatencyHistogram:
+    __slots__ = ("count", "total", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(METRIC_BUCKETS) + 1)  # last one is +Inf
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect.bisect_left(METRIC_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def quantile(self, q: float) -> float:
+        """Estimate from the buckets, interpolating linearly inside one."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= rank:
+                if i == len(METRIC_BUCKETS):
+                    return METRIC_BUCKETS[-1]
+                lo = METRIC_BUCKETS[i - 1] if i else 0.0
+                return lo + (METRIC_BUCKETS[i] - lo) * (rank - seen) / n
+            seen += n
+        return METRIC_BUCKETS[-1]
+
+
+class BridgeMetrics:
+    """
+    Call counters and latency histograms, keyed by function name.
+
+    Names starting with "c." time the foreign call alone (ctypes argument
+    conversion included); the other names time the Python wrapper around
+    it, so the difference is the marshalling and bookkeeping overhead.
+    """
+
+    def __init__(self) -> None:
+        self._histograms: Dict[str, _LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = _LatencyHistogram()
+            hist.observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """{name: {calls, total_s, mean_s, p50_s, p95_s, p99_s}}, names sorted."""
+        with self._lock:
+            return {
+                name: {
+                    "calls": h.count,
+                    "total_s": h.total,
+                    "mean_s": h.total / h.count if h.count else 0.0,
+                    "p50_s": h.quantile(0.50),
+                    "p95_s": h.quantile(0.95),
+                    "p99_s": h.quantile(0.99),
+                }
+                for name, h in sorted(self._histograms.items())
+            }
+
+    def prometheus_text(self) -> str:
+        """The histograms in Prometheus text exposition format."""
+        lines = [
+            "# HELP cwa_bridge_call_seconds Latency of cwa_engine_bridge calls.",
+            "# TYPE cwa_bridge_call_seconds histogram",
+        ]
+        with self._lock:
+            for name, h in sorted(self._histograms.items()):
+                label = f'function="{name}"'
+                cumulative = 0
+                for bound, n in zip(METRIC_BUCKETS + (float("inf"),), h.buckets):
+                    cumulative += n
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'cwa_bridge_call_seconds_bucket{{{label},le="{le}"}} {cumulative}')
+                lines.append(f"cwa_bridge_call_seconds_sum{{{label}}} {h.total!r}")
+                lines.append(f"cwa_bridge_call_seconds_count{{{label}}} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump_prometheus(self, path) -> Path:
+        """Write prometheus_text() to path, atomically (for textfile collectors)."""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.prometheus_text(), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+
+# Python-level entry points and the engine functions they call. Only calls
+# made through this module are seen: a name imported elsewhere with
+# `from cwa_engine_bridge import ...` keeps the uninstrumented function.
+_INSTRUMENTED_FUNCTIONS = [
+    "calculate_cwa",
+    "required_average",
+    "compute_summary",
+    "summary_from_totals",
+    "compute_summaries",
+    "compute_summaries_grouped",
+    "compute_summary_many",
+    "_fair_distribution_batch",
+    "target_sweep",
+    "allocate_scores",
+]
+_INSTRUMENTED_METHODS = [
+    (_StudentHandle, "__init__"),
+    (_StudentHandle, "calculate_fair_distribution"),
+    (_StudentHandle, "recalculate_fair_distribution"),
+    (_StudentHandle, "close"),
+    (_StudentPool, "acquire"),
+    (_PooledStudent, "calculate_fair_distribution"),
+    (_PooledStudent, "recalculate_fair_distribution"),
+    (SummaryAccumulator, "summary"),
+]
+_INSTRUMENTED_C_FUNCTIONS = [
+    "init_student",
+    "calculate_fair_distribution",
+    "recalculate_fair_distribution",
+    "destroy_object",
+    "fair_distribution",
+    "fair_redistribution",
+    "set_student",
+    "init_students_bulk",
+    "destroy_students_bulk",
+    "calculate_fair_distribution_batch",
+    "allocate_scores",
+]
+
+# Disabled (None) by default: nothing is wrapped, so there is no overhead.
+_metrics: Optional[BridgeMetrics] = None
+_metrics_lock = threading.Lock()
+_uninstrumented: Dict[tuple, Any] = {}
+_dump_paths: set = set()
+
+
+def _timed(name: str, fn, metrics: BridgeMetrics):
+    clock = time.perf_counter
+
+    @functools.wraps(fn)
+    def timed(*args, **kwargs):
+        t0 = clock()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            metrics.observe(name, clock() - t0)
+    return timed
+
+
+def _instrument_lib(lib: ctypes.CDLL, metrics: BridgeMetrics) -> None:
+    # instance attributes shadow the CDLL's own function lookup
+    for fname in _INSTRUMENTED_C_FUNCTIONS:
+        if hasattr(lib, fname):
+            original = getattr(lib, fname)
+            _uninstrumented[(lib, fname)] = original
+            setattr(lib, fname, _timed(f"c.{fname}", original, metrics))
+
+
+def enable_metrics(dump_path=None) -> BridgeMetrics:
+    """
+    Start recording call counts and latencies.
+
+    Wraps the bridge functions listed above with timers; disable_metrics()
+    puts the originals back. Calling it again keeps the running metrics.
+    Every dump_path given (on any call) is written with the Prometheus text
+    when the interpreter exits, until disable_metrics().
+
+    Only calls looked up on this module at call time are timed. Code that
+    did `from cwa_engine_bridge import compute_summary` (the GUI does) holds
+    the unwrapped function; its work is still seen through the instrumented
+    methods (e.g. SummaryAccumulator.summary) and the c.* engine calls.
+    cwa_service and cwa_cohort_runner call through the module and are
+    measured in full.
+    """
+    with _metrics_lock:
+        metrics = _metrics
+        if metrics is None:
+            metrics = _enable_metrics_locked()
+        if dump_path is not None and str(dump_path) not in _dump_paths:
+            _dump_paths.add(str(dump_path))
+            atexit.register(metrics.dump_prometheus, dump_path)
+    return metrics
+
+
+def _enable_metrics_locked() -> BridgeMetrics:
+    # wrap everything; the caller holds _metrics_lock
+    global _metrics
+    metrics = BridgeMetrics()
+    module = globals()
+    for fname in _INSTRUMENTED_FUNCTIONS:
+        _uninstrumented[(None, fname)] = module[fname]
+        module[fname] = _timed(fname, module[fname], metrics)
+    for cls, fname in _INSTRUMENTED_METHODS:
+        original = cls.__dict__[fname]
+        _uninstrumented[(cls, fname)] = original
+        setattr(cls, fname, _timed(f"{cls.__name__}.{fname}", original, metrics))
+    if _c_lib is not None:
+        _instrument_lib(_c_lib, metrics)
+    _metrics = metrics
+    return metrics
+
+
+def disable_metrics() -> None:
+    """Remove every timer added by enable_metrics(); recorded data and exit dumps are dropped."""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is not None:
+            # unregisters every dump_prometheus registration of this instance
+            atexit.unregister(_metrics.dump_prometheus)
+        _dump_paths.clear()
+        module = globals()
+        for (owner, fname), original in _uninstrumented.items():
+            if owner is None:
+                module[fname] = original
+            else:
+                setattr(owner, fname, original)
+        _uninstrumented.clear()
+        _metrics = None
+
+
+def metrics_snapshot() -> Optional[Dict[str, dict]]:
+    """Per-function calls, total/mean time and p50/p95/p99, or None while disabled."""
+    metrics = _metrics
+    return metrics.snapshot() if metrics is not None else None
+
+
+def dump_metrics(path) -> Optional[Path]:
+    """Write the Prometheus text file now; returns None while disabled."""
+    metrics = _metrics
+    return metrics.dump_prometheus(path) if metrics is not None else None
@@ -1,8 +1,27 @@
 import sys
+import csv
 import math
-from typing import Optional, List
-
-from PySide6.QtCore import Qt, QSize
+import time
+from array import array
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional, List
+
+import numpy as np
+
+from PySide6.QtCore import (
+    Qt,
+    QSize,
+    QTimer,
+    QPointF,
+    QRect,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal,
+)
 from PySide6.QtGui import QColor, QFont, QPainter, QPen, QIntValidator, QDoubleValidator
 from PySide6.QtWidgets import (
     QApplication,
@@ -15,8 +34,8 @@ from PySide6.QtWidgets import (
     QGridLayout,
     QToolButton,
     QButtonGroup,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QHeaderView,
     QAbstractItemView,
     QGraphicsDropShadowEffect,
     QPushButton,
@@ -27,11 +46,22 @@ from PySide6.QtWidgets import (
     QStackedWidget,
     QTabWidget,
     QCheckBox,
+    QComboBox,
+    QFileDialog,
 )
 
 # QtCharts (PySide6-Addons)
 try:
-    from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis, QCategoryAxis
+    from PySide6.QtCharts import (
+        QChart,
+        QChartView,
+        QLineSeries,
+        QScatterSeries,
+        QValueAxis,
+        QBarSeries,
+        QBarSet,
+        QBarCategoryAxis,
+    )
     CHARTS_OK = True
 except Exception:
     CHARTS_OK = False
@@ -41,14 +71,26 @@ except Exception:
 # cwa_engine_bridge.py must be in the same folder as this file.
 try:
     # keep access to the low-level calculate_cwa, but use compute_summary for the GUI
-    from cwa_engine_bridge import calculate_cwa as engine_calculate_cwa, compute_summary
+    from cwa_engine_bridge import calculate_cwa as engine_calculate_cwa, compute_summary, SummaryAccumulator
+    from cwa_engine_bridge import load_engine, allocate_scores, STATUS_INVALID
+    from cwa_engine_bridge import compute_summaries, STATUS_ABOVE_MAX, STATUS_BELOW_MIN, STATUS_NO_REMAINING
+    from cwa_engine_bridge import TrajectoryAccumulator, engine_info
+
+    # the bridge loads the library lazily; load it now so the status is known at startup
+    load_engine()
     ENGINE_OK = True
     ENGINE_ERR = ""
+    ENGINE_VARIANT = engine_info()["variant"]
 except Exception as e:
     ENGINE_OK = False
     ENGINE_ERR = str(e)
+    ENGINE_VARIANT = ""
     engine_calculate_cwa = None  # type: ignore
     compute_summary = None       # type: ignore
+    SummaryAccumulator = None    # type: ignore
+    allocate_scores = None       # type: ignore
+    compute_summaries = None     # type: ignore
+    TrajectoryAccumulator = None  # type: ignore
 
 
 APP_QSS = """
@@ -166,7 +208,7 @@ QLineEdit[field="mini"] {
 }
 
 /* Table */
-QTableWidget {
+QTableView {
     background: #ffffff;
     border: 1px solid #e5e7eb;
     border-radius: 10px;
@@ -182,29 +224,11 @@ QHeaderView::section {
     border-bottom: 1px solid #e5e7eb;
     padding: 8px;
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background: transparent;
     color: #111827;
 }
 
-/* Target tick box (VISIBLE ✓) */
-QLabel[targetBox="true"] {
-    min-width: 20px;
-    max-width: 20px;
-    min-height: 20px;
-    max-height: 20px;
-    border-radius: 4px;
-    border: 1px solid #cbd5e1;
-    background: #ffffff;
-    color: transparent;
-    font-weight: 900;
-}
-QLabel[targetBox="true"][checked="true"] {
-    background: #1d4ed8;
-    border: 1px solid #1d4ed8;
-    color: #ffffff;
-}
-
 /* Tab look (semesters) */
 QTabWidget::pane { border: 0px; }
 QTabBar::tab {
@@ -260,6 +284,313 @@ class DoubleDelegate(QStyledItemDelegate):
         return ed
 
 
+class CourseTableModel(QAbstractTableModel):
+    """
+    Course rows of one semester, stored column by column.
+
+    Credits, Current Score and Allocated Score are array('d') columns with
+    NaN for an empty cell; auto-filled Allocated Scores are flagged in a
+    bytearray. Row colours, the Target tick and the auto-fill styling are
+    derived in data(), so an edit never needs a restyle pass.
+
+    setData() is the user-edit path and emits rowEdited(row);
+    set_allocated_many() writes solver results without it.
+    """
+
+    HEADERS = ["Course", "Credits", "Current Score", "Target", "Allocated Score"]
+    COL_NAME, COL_CREDITS, COL_CURRENT, COL_TARGET, COL_ALLOCATED = range(5)
+
+    # bool: credits > 0 and Current Score >= Allocated Score
+    TICK_ROLE = Qt.UserRole + 1
+
+    ROW_BG = (QColor("#eaf7e5"), QColor("#dbf0d4"))
+    AUTO_FG = QColor("#6b7280")
+
+    rowEdited = Signal(int)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._names: List[str] = []
+        self._credits = array("d")
+        self._current = array("d")
+        self._allocated = array("d")
+        self._auto = bytearray()
+        self._auto_font = QFont()
+        self._auto_font.setItalic(True)
+
+    # ---- Qt model interface ----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if index.column() == self.COL_TARGET:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        r = index.row()
+        c = index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self.text(r, c)
+        if role == Qt.BackgroundRole:
+            return self.ROW_BG[r % 2]
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignVCenter | Qt.AlignLeft) if c == self.COL_NAME else int(Qt.AlignCenter)
+        if role == self.TICK_ROLE:
+            return self.target_reached(r)
+        if c == self.COL_ALLOCATED and self._auto[r]:
+            if role == Qt.ForegroundRole:
+                return self.AUTO_FG
+            if role == Qt.FontRole:
+                return self._auto_font
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        r = index.row()
+        c = index.column()
+        text = "" if value is None else str(value).strip()
+
+        if c == self.COL_NAME:
+            self._names[r] = text
+        elif c == self.COL_CREDITS:
+            self._credits[r] = self._parse(text, whole=True)
+        elif c == self.COL_CURRENT:
+            self._current[r] = self._parse(text)
+        elif c == self.COL_ALLOCATED:
+            # a typed Allocated Score pins the course; clearing it hands it back to the solver
+            self._allocated[r] = self._parse(text)
+            self._auto[r] = 0
+        else:
+            return False
+
+        self.dataChanged.emit(self.index(r, 0), self.index(r, self.COL_ALLOCATED))
+        self.rowEdited.emit(r)
+        return True
+
+    # ---- row access ----
+    @staticmethod
+    def _parse(text: str, whole: bool = False) -> float:
+        if text == "":
+            return math.nan
+        try:
+            v = float(text)
+            return float(int(v)) if whole else v
+        except (ValueError, OverflowError):
+            # like the old _safe_int: "inf" / "nan" credits count as 0
+            return 0.0
+
+    def add_row(self) -> int:
+        r = len(self._names)
+        self.beginInsertRows(QModelIndex(), r, r)
+        self._names.append("")
+        self._credits.append(math.nan)
+        self._current.append(math.nan)
+        self._allocated.append(math.nan)
+        self._auto.append(0)
+        self.endInsertRows()
+        return r
+
+    def text(self, r: int, c: int) -> str:
+        if c == self.COL_NAME:
+            return self._names[r]
+        if c == self.COL_CREDITS:
+            v = self._credits[r]
+            return "" if v != v else str(int(v))
+        if c == self.COL_CURRENT:
+            v = self._current[r]
+            return "" if v != v else f"{v:g}"
+        if c == self.COL_ALLOCATED:
+            v = self._allocated[r]
+            return "" if v != v else (f"{v:.2f}" if self._auto[r] else f"{v:g}")
+        return ""
+
+    def is_active(self, r: int) -> bool:
+        """False for fully empty rows, which the summary skips."""
+        return bool(
+            self._names[r]
+            or self._credits[r] == self._credits[r]
+            or self._current[r] == self._current[r]
+            or self._allocated[r] == self._allocated[r]
+        )
+
+    def values(self, r: int):
+        """(credits, current, allocated) with empty cells as 0."""
+        cr = self._credits[r]
+        cur = self._current[r]
+        alloc = self._allocated[r]
+        return (int(cr) if cr == cr else 0, cur if cur == cur else 0.0, alloc if alloc == alloc else 0.0)
+
+    def is_auto(self, r: int) -> bool:
+        return bool(self._auto[r])
+
+    def is_pinned(self, r: int) -> bool:
+        """True if the user typed this row's Allocated Score (auto-filled ones are not pinned)."""
+        return self._allocated[r] == self._allocated[r] and not self._auto[r]
+
+    def target_reached(self, r: int) -> bool:
+        cr, cur, alloc = self.values(r)
+        return cr > 0 and self._allocated[r] == self._allocated[r] and cur >= alloc
+
+    def columns(self):
+        """Copies of the columns as NumPy arrays: credits, current, allocated (NaN = empty), auto."""
+        return (
+            np.nan_to_num(np.array(self._credits)).astype(np.int64),
+            np.nan_to_num(np.array(self._current)),
+            np.array(self._allocated),
+            np.frombuffer(bytes(self._auto), dtype=np.uint8).astype(bool),
+        )
+
+    def set_allocated_many(self, rows, values, auto: bool) -> List[int]:
+        """
+        Write Allocated Scores (None or NaN = empty) without emitting rowEdited.
+        Returns the rows whose value changed; one dataChanged covers them all.
+        """
+        changed = []
+        touched = []
+        flag = 1 if auto else 0
+        for r, v in zip(rows, values):
+            v = math.nan if v is None else float(v)
+            old = self._allocated[r]
+            same = (old == v) or (old != old and v != v)
+            if not same or self._auto[r] != flag:
+                self._allocated[r] = v
+                self._auto[r] = flag
+                touched.append(r)
+                if not same:
+                    changed.append(r)
+        if touched:
+            self.dataChanged.emit(
+                self.index(min(touched), self.COL_TARGET), self.index(max(touched), self.COL_ALLOCATED)
+            )
+        return changed
+
+
+class TickDelegate(QStyledItemDelegate):
+    """Paints the Target tick from TICK_ROLE; no per-row widgets."""
+
+    def paint(self, painter, option, index):
+        painter.save()
+        bg = index.data(Qt.BackgroundRole)
+        if bg is not None:
+            painter.fillRect(option.rect, bg)
+
+        box = QRect(0, 0, 20, 20)
+        box.moveCenter(option.rect.center())
+        checked = bool(index.data(CourseTableModel.TICK_ROLE))
+
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(QPen(QColor("#1d4ed8" if checked else "#cbd5e1"), 1))
+        painter.setBrush(QColor("#1d4ed8") if checked else QColor("#ffffff"))
+        painter.drawRoundedRect(box, 4, 4)
+        if checked:
+            font = painter.font()
+            font.setBold(True)
+            painter.setFont(font)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(box, Qt.AlignCenter, "✓")
+        painter.restore()
+
+
+class EngineSignals(QObject):
+    """Results of EngineJob, delivered on the thread that owns this object."""
+
+    finished = Signal(int, object)  # generation, result
+    failed = Signal(int, object)    # generation, exception
+
+
+class EngineJob(QRunnable):
+    """
+    One recompute's engine work on a QThreadPool thread.
+
+    fn gets only snapshots (plain numbers and NumPy copies), never the
+    widgets or models. A job whose generation is already superseded when
+    it starts returns without running.
+    """
+
+    def __init__(self, generation: int, fn, signals: EngineSignals, is_current) -> None:
+        super().__init__()
+        self.generation = generation
+        self._fn = fn
+        self._signals = signals
+        self._is_current = is_current
+
+    def run(self) -> None:
+        if not self._is_current(self.generation):
+            return
+        try:
+            result = self._fn()
+        except Exception as e:
+            self._signals.failed.emit(self.generation, e)
+            return
+        self._signals.finished.emit(self.generation, result)
+
+
+class RecomputeProfiler:
+    """
+    Opt-in per-stage timing of CWAEstimatorPage updates.
+
+    Stages: row_update (one edited row's running totals), credit_totals,
+    engine (summary call), allocate (Allocated Score auto-fill), chart
+    (target sweep + series update) and total (from recompute() until the
+    worker's result is on screen).
+    record() returns at once while disabled.
+    """
+
+    STAGES = ("row_update", "credit_totals", "engine", "allocate", "chart", "total")
+
+    def __init__(self, window: int = 200, log_size: int = 10000) -> None:
+        self.enabled = False
+        self._recent = {stage: deque(maxlen=window) for stage in self.STAGES}
+        self._worst = dict.fromkeys(self.STAGES, 0.0)
+        self._log = deque(maxlen=log_size)
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = bool(enabled)
+
+    def record(self, stage: str, start: float, end: float) -> None:
+        if not self.enabled:
+            return
+        ms = (end - start) * 1e3
+        self._recent[stage].append(ms)
+        if ms > self._worst[stage]:
+            self._worst[stage] = ms
+        self._log.append((time.time(), stage, ms))
+
+    def reset(self) -> None:
+        for samples in self._recent.values():
+            samples.clear()
+        self._worst = dict.fromkeys(self.STAGES, 0.0)
+        self._log.clear()
+
+    def stats(self) -> dict:
+        """{stage: (rolling average ms, worst ms since reset, samples)}"""
+        return {
+            stage: (sum(samples) / len(samples) if samples else 0.0, self._worst[stage], len(samples))
+            for stage, samples in self._recent.items()
+        }
+
+    def export(self, path: str) -> int:
+        """Write the timing log as CSV (timestamp, stage, ms); returns the row count."""
+        rows = list(self._log)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# CWA recompute timing log, exported {datetime.now().isoformat(timespec='seconds')}\n")
+            f.write(f"# python {sys.version.split()[0]}, engine {ENGINE_VARIANT if ENGINE_OK else 'not connected'}\n")
+            f.write("timestamp,stage,ms\n")
+            for ts, stage, ms in rows:
+                f.write(f"{datetime.fromtimestamp(ts).isoformat(timespec='milliseconds')},{stage},{ms:.4f}\n")
+        return len(rows)
+
+
 class CWAEstimatorPage(QWidget):
     """
     - Add course scrolls to new row.
@@ -271,6 +602,12 @@ class CWAEstimatorPage(QWidget):
     - Target tick: credits > 0 and Current Score >= Allocated Score.
     """
 
+    # Edits within this window are folded into one recompute (0 = next event-loop tick)
+    RECOMPUTE_DEBOUNCE_MS = 16
+
+    # Targets the chart evaluates in one target_sweep() call
+    SWEEP_TARGETS = [i * 0.5 for i in range(201)]
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -283,20 +620,99 @@ class CWAEstimatorPage(QWidget):
         self.sum_engine_status: QLabel | None = None
 
         self.semester_tabs: QTabWidget | None = None
-        self.tables: List[QTableWidget] = []
+        self.tables: List[QTableView] = []
 
         self.series_current = None
         self.series_adjusted = None
+        self.series_target = None
+
+        self.series_actual = None
+        self.series_projected = None
+        self.series_goal = None
+        self.traj_axis_x = None
+        self.chart_stack: QStackedWidget | None = None
 
         self._current_cwa_getter = lambda: "0"
         self._building = False
 
+        # Running totals per (model, row): a cell edit updates one row in O(1)
+        self._summary_acc = SummaryAccumulator() if SummaryAccumulator is not None else None
+        self._active_rows: set = set()
+        # ... and per semester tab, for the CWA-by-semester chart
+        self._traj_acc = TrajectoryAccumulator() if TrajectoryAccumulator is not None else None
+
+        # Remaining courses per tab, {id(model): {row: (credits, pinned score or NaN)}},
+        # kept by _update_row. The solver arrays built from them are patched in
+        # place and only rebuilt when a course opens, closes or is (un)pinned.
+        self._open_rows: Dict[int, Dict[int, tuple]] = {}
+        self._alloc_cache: Optional[dict] = None
+
+        # Coalesced recompute: bursts of edits mark the page dirty and
+        # trigger a single recompute once the timer fires
+        self._dirty = False
+        self._auto_recalc = True
+        self._auto_allocate = True
+        self._recompute_timer = QTimer(self)
+        self._recompute_timer.setSingleShot(True)
+        self._recompute_timer.setInterval(self.RECOMPUTE_DEBOUNCE_MS)
+        self._recompute_timer.timeout.connect(self._flush_recompute)
+        self.recalc_btn: QPushButton | None = None
+
+        # Engine work runs on a single pool thread. Every input change bumps
+        # the generation; results from older generations are dropped.
+        self._generation = 0
+        self._engine_pool = QThreadPool(self)
+        self._engine_pool.setMaxThreadCount(1)
+        self._engine_signals = EngineSignals(self)
+        self._engine_signals.finished.connect(self._on_engine_finished)
+        self._engine_signals.failed.connect(self._on_engine_failed)
+
+        self.profiler = RecomputeProfiler()
+        self._pending: dict = {}
+
         self._build_ui()
 
     # ---- hook from MainWindow ----
     def set_current_cwa_getter(self, getter):
         self._current_cwa_getter = getter
 
+    def set_auto_recalculate(self, enabled: bool) -> None:
+        """Wired to the "Auto recalculate" setting; when off, use the Recalculate button."""
+        self._auto_recalc = bool(enabled)
+        if self.recalc_btn:
+            self.recalc_btn.setVisible(not self._auto_recalc)
+        if self._auto_recalc and self._dirty:
+            self._recompute_timer.start()
+
+    def set_auto_allocate(self, enabled: bool) -> None:
+        """Wired to the "Auto-fill allocated scores" setting."""
+        self._auto_allocate = bool(enabled)
+        if not self._auto_allocate:
+            self._clear_auto_allocations()
+        self.schedule_recompute()
+
+    # ---- recompute scheduling ----
+    def schedule_recompute(self, *_args) -> None:
+        """Mark the page dirty; many calls before the timer fires cost one recompute."""
+        self._dirty = True
+        # inputs changed: whatever the engine is working on is now stale
+        self._generation += 1
+        if self._auto_recalc and not self._recompute_timer.isActive():
+            self._recompute_timer.start()
+
+    def _flush_recompute(self) -> None:
+        if self._dirty:
+            self.recompute()
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def wait_for_engine(self, msecs: int = -1) -> bool:
+        """Block until the engine worker is idle and its result is shown (scripts and benchmarks)."""
+        done = self._engine_pool.waitForDone(msecs)
+        QApplication.sendPostedEvents(self)
+        return done
+
     # ---- helpers ----
     @staticmethod
     def _safe_int(text: str) -> int:
@@ -312,10 +728,6 @@ class CWAEstimatorPage(QWidget):
         except Exception:
             return 0.0
 
-    @staticmethod
-    def _text(item: Optional[QTableWidgetItem]) -> str:
-        return item.text().strip() if item else ""
-
     def _get_current_cwa(self) -> float:
         try:
             return float((self._current_cwa_getter() or "0").strip())
@@ -330,14 +742,15 @@ class CWAEstimatorPage(QWidget):
             return None
         return self._safe_float(txt)
 
-    def _row_bg(self, r: int) -> QColor:
-        return QColor("#eaf7e5") if (r % 2 == 0) else QColor("#dbf0d4")
-
     # ---- table / semesters ----
-    def _make_table(self) -> QTableWidget:
-        t = QTableWidget(0, 5)
-        t.setHorizontalHeaderLabels(["Course", "Credits", "Current Score", "Target", "Allocated Score"])
+    def _make_table(self) -> QTableView:
+        t = QTableView()
+        # owned by the view, so load_semesters() deleting the tables frees the models too
+        model = CourseTableModel(t)
+        t.setModel(model)
         t.verticalHeader().setVisible(False)
+        t.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        t.verticalHeader().setDefaultSectionSize(40)
         t.setShowGrid(True)
         t.setSelectionMode(QAbstractItemView.NoSelection)
         t.setEditTriggers(
@@ -357,9 +770,10 @@ class CWAEstimatorPage(QWidget):
 
         t.setItemDelegateForColumn(1, IntDelegate(0, 60, t))
         t.setItemDelegateForColumn(2, DoubleDelegate(0.0, 100.0, 2, t))
+        t.setItemDelegateForColumn(3, TickDelegate(t))
         t.setItemDelegateForColumn(4, DoubleDelegate(0.0, 100.0, 2, t))
 
-        t.itemChanged.connect(self.recompute)
+        model.rowEdited.connect(lambda r, m=model: self._on_row_edited(m, r))
         return t
 
     def add_semester(self) -> None:
@@ -371,119 +785,250 @@ class CWAEstimatorPage(QWidget):
         self.semester_tabs.addTab(table, f"Semester {idx}")
         self.semester_tabs.setCurrentWidget(table)
         self.add_course_row()
-        self.recompute()
+        self.schedule_recompute()
 
-    def current_table(self) -> Optional[QTableWidget]:
+    def current_table(self) -> Optional[QTableView]:
         if not self.semester_tabs:
             return None
         w = self.semester_tabs.currentWidget()
-        return w if isinstance(w, QTableWidget) else None
-
-    def _set_item(self, t: QTableWidget, r: int, c: int, text: str, align: Qt.AlignmentFlag, editable: bool) -> None:
-        it = QTableWidgetItem(text)
-        it.setTextAlignment(align)
-        it.setBackground(self._row_bg(r))
-        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
-        if editable:
-            flags |= Qt.ItemIsEditable
-        it.setFlags(flags)
-        t.setItem(r, c, it)
+        return w if isinstance(w, QTableView) else None
+
+    def current_model(self) -> Optional[CourseTableModel]:
+        t = self.current_table()
+        return t.model() if t else None
 
     def add_course_row(self) -> None:
         t = self.current_table()
         if not t:
             return
 
-        r = t.rowCount()
+        model = t.model()
+        r = model.add_row()
+        self._update_row(model, r)
+        self.schedule_recompute()
 
-        t.blockSignals(True)
-        t.insertRow(r)
+        idx = model.index(r, 0)
+        t.setCurrentIndex(idx)
+        t.scrollTo(idx, QAbstractItemView.PositionAtBottom)
 
-        self._set_item(t, r, 0, "", Qt.AlignVCenter | Qt.AlignLeft, True)
-        self._set_item(t, r, 1, "", Qt.AlignCenter, True)
-        self._set_item(t, r, 2, "", Qt.AlignCenter, True)
-        self._set_item(t, r, 4, "", Qt.AlignCenter, True)
+    # ---- saved courses (cwa_store) ----
+    def semester_courses(self) -> List[List[dict]]:
+        """
+        Courses of every semester tab as compute_summary() course dicts.
 
-        self._set_target_box(t, r, checked=False, bg=self._row_bg(r))
-        t.setRowHeight(r, 40)
-        t.blockSignals(False)
+        Fully empty rows are skipped and auto-filled Allocated Scores are
+        left out (saved as 0), so a reload hands them back to the solver.
+        """
+        semesters = []
+        for t in self.tables:
+            model = t.model()
+            courses = []
+            for r in range(model.rowCount()):
+                if not model.is_active(r):
+                    continue
+                cr, cur, alloc = model.values(r)
+                courses.append(
+                    {
+                        "course": model.text(r, CourseTableModel.COL_NAME),
+                        "credits": cr,
+                        "current": cur,
+                        "allocated": 0.0 if model.is_auto(r) else alloc,
+                    }
+                )
+            semesters.append(courses)
+        return semesters
 
-        self._restyle_table(t)
-        self.recompute()
+    def load_semesters(self, semesters: List[List[dict]], target_cwa: Optional[float] = None) -> None:
+        """Replace every semester tab with the given courses (0 values load as empty cells)."""
+        if not self.semester_tabs:
+            return
+
+        self._building = True
+        self.semester_tabs.clear()
+        for t in self.tables:
+            t.deleteLater()
+        self.tables.clear()
+        self._active_rows.clear()
+        self._open_rows.clear()
+        self._alloc_cache = None
+        if self._summary_acc is not None:
+            self._summary_acc.clear()
+        if self._traj_acc is not None:
+            self._traj_acc.clear()
+
+        for courses in semesters or [[]]:
+            self.add_semester()
+            model = self.current_model()
+            for i, c in enumerate(courses):
+                if i:
+                    self.add_course_row()
+                cells = [
+                    str(c.get("course", "") or ""),
+                    str(int(c.get("credits", 0) or 0) or ""),
+                    f"{float(c.get('current', 0.0) or 0.0):g}" if c.get("current") else "",
+                    "",
+                    f"{float(c.get('allocated', 0.0) or 0.0):g}" if c.get("allocated") else "",
+                ]
+                for col, text in enumerate(cells):
+                    if text:
+                        model.setData(model.index(i, col), text)
+
+        self.semester_tabs.setCurrentIndex(0)
+        if target_cwa is not None and self.target_cwa_edit:
+            self.target_cwa_edit.setText(f"{target_cwa:g}")
+        self._building = False
+        self.schedule_recompute()
+
+    # ---- incremental row updates ----
+    def _update_row(self, model: CourseTableModel, r: int) -> None:
+        """Replace this row's contribution to the running totals."""
+        key = (id(model), r)
+        cr, cur, alloc = model.values(r)
+
+        # a course that is done (or has no credits) keeps no auto-filled score
+        if model.is_auto(r) and (cr <= 0 or cur > 0.0):
+            model.set_allocated_many([r], [None], False)
+            alloc = 0.0
+
+        # same rule as _build_payload: fully empty rows are skipped
+        if model.is_active(r):
+            self._active_rows.add(key)
+        else:
+            self._active_rows.discard(key)
+
+        if self._summary_acc is not None:
+            self._summary_acc.set_row(key, cr, cur, alloc)
+        if self._traj_acc is not None:
+            self._traj_acc.set_row(key, id(model), cr, cur, alloc)
+        self._update_open_row(model, r, cr, cur, alloc)
+
+    def _update_open_row(self, model: CourseTableModel, r: int, cr: int, cur: float, alloc: float) -> None:
+        rows = self._open_rows.setdefault(id(model), {})
+        old = rows.get(r)
+        new = None
+        if cr > 0 and cur <= 0.0:
+            new = (cr, alloc if model.is_pinned(r) else math.nan)
+            rows[r] = new
+        else:
+            rows.pop(r, None)
+
+        cache = self._alloc_cache
+        if cache is None or old == new:
+            return
+        if old is None or new is None or (old[1] != old[1]) != (new[1] != new[1]):
+            # opened, closed, or switched between free and pinned
+            self._alloc_cache = None
+            return
+        i = cache["index"][(id(model), r)]
+        cache["credits"][i] = new[0]
+        if new[1] == new[1]:
+            cache["lower"][i] = cache["upper"][i] = new[1]
+
+    def _on_row_edited(self, model: CourseTableModel, r: int) -> None:
+        t0 = time.perf_counter()
+        self._update_row(model, r)
+        self.profiler.record("row_update", t0, time.perf_counter())
+        self.schedule_recompute()
+
+    # ---- allocated score auto-fill ----
+    def _set_allocated(self, model: CourseTableModel, rows, values, auto: bool) -> None:
+        for r in model.set_allocated_many(rows, values, auto):
+            self._update_row(model, r)
+
+    def _clear_auto_allocations(self) -> None:
+        for t in self.tables:
+            model = t.model()
+            rows = np.flatnonzero(model.columns()[3]).tolist()
+            self._set_allocated(model, rows, [None] * len(rows), False)
+
+    def _build_alloc_cache(self) -> dict:
+        """Solver arrays over the remaining courses, in tab then row order."""
+        models = [t.model() for t in self.tables]
+        keys, owner, row, credits, pinned = [], [], [], [], []
+        for m, model in enumerate(models):
+            for r, (cr, score) in sorted(self._open_rows.get(id(model), {}).items()):
+                keys.append((id(model), r))
+                owner.append(m)
+                row.append(r)
+                credits.append(cr)
+                pinned.append(score)
+
+        pinned = np.array(pinned, dtype=np.float64)
+        free = np.isnan(pinned)
+        return {
+            "models": models,
+            "index": {k: i for i, k in enumerate(keys)},
+            "owner": np.array(owner, dtype=np.int64),
+            "row": np.array(row, dtype=np.int64),
+            "free": free,
+            "credits": np.array(credits, dtype=np.int64),
+            "lower": np.where(free, 0.0, pinned),
+            "upper": np.where(free, 100.0, pinned),
+        }
+
+    def _allocation_inputs(self) -> Optional[dict]:
+        """
+        Snapshot what the Allocated Score auto-fill needs, on the GUI thread.
+
+        Costs a copy of the remaining-course arrays; the per-row state is
+        kept up to date by _update_row. Returns None when nothing is left to
+        fill.
+        """
+        if not self._auto_allocate or allocate_scores is None or self._summary_acc is None:
+            return None
+
+        if self._alloc_cache is None:
+            self._alloc_cache = self._build_alloc_cache()
+        cache = self._alloc_cache
+        free = cache["free"]
+        if not free.any():
+            return None
 
-        t.setCurrentCell(r, 0)
-        t.scrollToItem(t.item(r, 0), QAbstractItemView.PositionAtBottom)
-
-    # ---- target tick box ----
-    def _set_target_box(self, table: QTableWidget, r: int, checked: bool, bg: QColor) -> None:
-        holder = table.cellWidget(r, 3)
-        if holder is None:
-            holder = QWidget()
-            lay = QHBoxLayout(holder)
-            lay.setContentsMargins(0, 0, 0, 0)
-            lay.setAlignment(Qt.AlignCenter)
-
-            box = QLabel("")
-            box.setAlignment(Qt.AlignCenter)
-            box.setProperty("targetBox", True)
-            lay.addWidget(box)
-
-            table.setCellWidget(r, 3, holder)
-
-        box = holder.findChild(QLabel)
-        if box is not None:
-            box.setText("✓" if checked else "")
-            box.setProperty("checked", "true" if checked else "false")
-            box.style().unpolish(box)
-            box.style().polish(box)
-
-        holder.setAutoFillBackground(True)
-        pal = holder.palette()
-        pal.setColor(holder.backgroundRole(), bg)
-        holder.setPalette(pal)
-
-    def _restyle_table(self, t: QTableWidget) -> None:
-        t.blockSignals(True)
-        for r in range(t.rowCount()):
-            bg = self._row_bg(r)
-
-            for col, align in [
-                (0, Qt.AlignVCenter | Qt.AlignLeft),
-                (1, Qt.AlignCenter),
-                (2, Qt.AlignCenter),
-                (4, Qt.AlignCenter),
-            ]:
-                it = t.item(r, col)
-                if it:
-                    it.setBackground(bg)
-                    it.setTextAlignment(align)
-
-            cr_txt = self._text(t.item(r, 1))
-            cur_txt = self._text(t.item(r, 2))
-            alloc_txt = self._text(t.item(r, 4))
-            cr = self._safe_int(cr_txt) if cr_txt else 0
-            cur = self._safe_float(cur_txt) if cur_txt else 0.0
-            alloc = self._safe_float(alloc_txt) if alloc_txt else 0.0
-
-            # Target tick: credits > 0 and Current Score >= Allocated Score.
-            reached = (cr > 0) and (alloc_txt != "") and (cur >= alloc)
-            self._set_target_box(t, r, checked=reached, bg=bg)
-
-        t.blockSignals(False)
+        # the worker gets copies, since edits patch the cached arrays in place
+        return {
+            "models": cache["models"],
+            "owner": cache["owner"][free],
+            "row": cache["row"][free],
+            "free": free.copy(),
+            "credits": cache["credits"].copy(),
+            "lower": cache["lower"].copy(),
+            "upper": cache["upper"].copy(),
+        }
+
+    @staticmethod
+    def _solve_allocations(inputs: dict, target_cwa: float, current_cwa: float, acc) -> Optional[list]:
+        """
+        Allocated Scores for the free courses in inputs (worker thread).
+
+        Scores the user typed are kept and treated as fixed (lower = upper);
+        the solver spreads the rest of the target so that the highest
+        score any course needs is as low as possible. The weighted total to
+        spread is the engine's remaining weighted average, so with nothing
+        pinned every course gets the Required Avg.
+        """
+        required_wa = target_cwa * acc.total_credits - current_cwa * acc.completed_credits
+        result = allocate_scores(inputs["credits"], required_wa, inputs["lower"], inputs["upper"])
+        if result["status"] == STATUS_INVALID:
+            return None
+        # stored as shown (2 dp), so the running totals match the table
+        return [float(f"{v:.2f}") for v in result["allocated"][inputs["free"]].tolist()]
+
+    def _apply_allocations(self, inputs: dict, scores: list) -> None:
+        scores = np.asarray(scores)
+        owner = inputs["owner"]
+        row = inputs["row"]
+        for m in np.unique(owner).tolist():
+            sel = owner == m
+            self._set_allocated(inputs["models"][m], row[sel].tolist(), scores[sel].tolist(), True)
 
     # ---- credits summary ----
     def _credits_from_tables(self) -> int:
         selected = 0
         for t in self.tables:
-            for r in range(t.rowCount()):
-                name_txt = self._text(t.item(r, 0))
-                cr_txt = self._text(t.item(r, 1))
-                cur_txt = self._text(t.item(r, 2))
-                alloc_txt = self._text(t.item(r, 4))
-
-                active = (name_txt != "") or (cr_txt != "") or (cur_txt != "") or (alloc_txt != "")
-                cr = self._safe_int(cr_txt) if cr_txt else 0
-                if active and cr > 0:
+            model = t.model()
+            for r in range(model.rowCount()):
+                cr = model.values(r)[0]
+                if model.is_active(r) and cr > 0:
                     selected += cr
         return selected
 
@@ -491,6 +1036,47 @@ class CWAEstimatorPage(QWidget):
         if CHARTS_OK and self.series_current and self.series_adjusted:
             self.series_current.clear()
             self.series_adjusted.clear()
+            self.series_target.clear()
+        if CHARTS_OK and self.series_actual:
+            self.series_actual.clear()
+            self.series_projected.clear()
+            self.series_goal.clear()
+
+    def _draw_trajectory(self, target_cwa: float) -> None:
+        """CWA after each semester: completed courses only, and with allocated scores counted."""
+        if not (CHARTS_OK and self.series_actual and self._traj_acc is not None):
+            return
+        # O(semesters): the per-tab totals are kept up to date by _update_row
+        trajectory = self._traj_acc.trajectory([id(t.model()) for t in self.tables])
+
+        def points(values) -> list:
+            return [QPointF(float(s), float(v)) for s, v in enumerate(values, start=1) if v == v]
+
+        self.series_actual.replace(points(trajectory["cwa"].tolist()))
+        self.series_projected.replace(points(trajectory["projected"].tolist()))
+        last = float(max(2, len(self.tables)))
+        self.series_goal.replace([QPointF(1.0, target_cwa), QPointF(last, target_cwa)])
+        self.traj_axis_x.setRange(1.0, last)
+        self.traj_axis_x.setTickCount(int(last))
+
+    def _draw_curve(self, current_cwa: float, targets, required, feasible, target_cwa: float, target_required: float) -> None:
+        """Plot required average against target CWA; infeasible targets are left out."""
+        if not (CHARTS_OK and self.series_current and self.series_adjusted):
+            return
+        self.series_current.replace([QPointF(0.0, current_cwa), QPointF(100.0, current_cwa)])
+        self.series_adjusted.replace(
+            [QPointF(float(t), float(r)) for t, r, ok in zip(targets, required, feasible) if ok]
+        )
+        if 0.0 <= target_required <= 100.0:
+            self.series_target.replace([QPointF(float(target_cwa), float(target_required))])
+        else:
+            self.series_target.clear()
+
+    def _fallback_curve(self, completed: int, remaining: int, current_cwa: float):
+        targets = self.SWEEP_TARGETS
+        required = [self._fallback_required_avg(completed, remaining, current_cwa, t) for t in targets]
+        feasible = [remaining > 0 and 0.0 <= r <= 100.0 for r in required]
+        return targets, required, feasible
 
     def _fallback_required_avg(self, completed: int, remaining: int, current_cwa: float, target_cwa: float) -> float:
         if remaining <= 0:
@@ -505,22 +1091,19 @@ class CWAEstimatorPage(QWidget):
 
         courses = []
         for t in self.tables:
-            for r in range(t.rowCount()):
-                name = self._text(t.item(r, 0))
-                cr_txt = self._text(t.item(r, 1))
-                cur_txt = self._text(t.item(r, 2))
-                alloc_txt = self._text(t.item(r, 4))
-
+            model = t.model()
+            for r in range(model.rowCount()):
                 # skip fully empty rows
-                if name == "" and cr_txt == "" and cur_txt == "" and alloc_txt == "":
+                if not model.is_active(r):
                     continue
 
+                cr, cur, alloc = model.values(r)
                 courses.append(
                     {
-                        "course": name,
-                        "credits": self._safe_int(cr_txt),
-                        "current": self._safe_float(cur_txt),
-                        "allocated": self._safe_float(alloc_txt),
+                        "course": model.text(r, CourseTableModel.COL_NAME),
+                        "credits": cr,
+                        "current": cur,
+                        "allocated": alloc,
                     }
                 )
 
@@ -530,14 +1113,33 @@ class CWAEstimatorPage(QWidget):
         return {"courses": courses, "target_cwa": float(target)}
 
     def recompute(self) -> None:
+        """
+        Refresh the summary and chart from the running row totals.
+
+        Cell edits update their row first (_on_row_edited), so this costs
+        the same for one row or hundreds. The credit labels are set here;
+        the engine summary, the Allocated Score auto-fill and the target
+        sweep run on the engine worker, and _on_engine_finished shows the
+        result if no newer input has arrived meanwhile.
+        """
         if self._building:
             return
 
-        for t in self.tables:
-            self._restyle_table(t)
+        self._dirty = False
+        self._recompute_timer.stop()
+        self._generation += 1
+        generation = self._generation
+        # queued jobs that have not started yet are all superseded
+        self._engine_pool.clear()
+
+        prof = self.profiler
+        t_start = time.perf_counter()
 
         # Local selected/total/remaining (still computed, but will be overridden by engine summary)
-        selected = self._credits_from_tables()
+        if self._summary_acc is not None:
+            selected = self._summary_acc.total_credits
+        else:
+            selected = self._credits_from_tables()
         total = selected
         remaining = total - selected
 
@@ -554,44 +1156,65 @@ class CWAEstimatorPage(QWidget):
 
         if self.sum_engine_status:
             if ENGINE_OK:
-                self.sum_engine_status.setText("Engine: connected (cwa_engine_bridge.py)")
+                self.sum_engine_status.setText(f"Engine: connected ({ENGINE_VARIANT} build)")
             else:
                 self.sum_engine_status.setText(f"Engine: not connected ({ENGINE_ERR})")
 
-        # ---------- use engine bridge if available ----------
-        payload = None
-        if target_cwa is not None and compute_summary is not None and ENGINE_OK:
-            payload = self._build_payload()
+        t_totals = time.perf_counter()
+        prof.record("credit_totals", t_start, t_totals)
 
-        if not payload:
+        # ---------- use engine bridge if available ----------
+        if target_cwa is None or self._summary_acc is None or not ENGINE_OK or not self._active_rows:
             self._set_chart_reset()
+            prof.record("total", t_start, time.perf_counter())
             return
 
-        try:
-            summary = compute_summary(payload)
-        except Exception as e:
-            # fall back to simple Python estimation if engine or bridge fails
-            current_cwa = self._get_current_cwa()
-            required = self._fallback_required_avg(
-                completed=selected,
-                remaining=remaining,
-                current_cwa=current_cwa,
-                target_cwa=float(target_cwa or 0.0),
-            )
-            if self.sum_required_avg:
-                self.sum_required_avg.setText(f"{required:.1f}")
-            if self.sum_engine_status:
-                self.sum_engine_status.setText(f"Engine error: {e}")
-            if CHARTS_OK and self.series_current and self.series_adjusted:
-                self.series_current.clear()
-                self.series_adjusted.clear()
-                self.series_current.append(0, current_cwa)
-                self.series_current.append(1, current_cwa)
-                self.series_current.append(2, current_cwa)
-                self.series_adjusted.append(0, current_cwa)
-                self.series_adjusted.append(1, max(0.0, min(100.0, required)))
-                self.series_adjusted.append(2, float(target_cwa or 0.0))
-            return
+        # everything the worker sees is a snapshot taken now
+        alloc_inputs = self._allocation_inputs()
+        acc = self._summary_acc.snapshot()
+        target_cwa = float(target_cwa)
+        want_sweep = bool(CHARTS_OK and self.series_current and self.series_adjusted)
+        sweep_targets = self.SWEEP_TARGETS
+
+        def evaluate() -> dict:
+            t0 = time.perf_counter()
+            summary = acc.summary(target_cwa)
+            t1 = time.perf_counter()
+            scores = None
+            if alloc_inputs is not None:
+                current_cwa = float(summary.get("current_cwa", 0.0))
+                scores = self._solve_allocations(alloc_inputs, target_cwa, current_cwa, acc)
+            t2 = time.perf_counter()
+            # the whole target -> required-average curve in one engine call
+            sweep = acc.sweep(sweep_targets) if want_sweep else None
+            t3 = time.perf_counter()
+            return {
+                "summary": summary,
+                "scores": scores,
+                "sweep": sweep,
+                "times": (t0, t1, t2, t3),
+            }
+
+        self._pending = {
+            "t_start": t_start,
+            "target_cwa": target_cwa,
+            "selected": selected,
+            "remaining": remaining,
+            "total": total,
+            "alloc_inputs": alloc_inputs,
+        }
+        self._engine_pool.start(EngineJob(generation, evaluate, self._engine_signals, self._is_current))
+
+    def _on_engine_finished(self, generation: int, result: dict) -> None:
+        if generation != self._generation:
+            return  # superseded while the worker was busy
+
+        pending = self._pending
+        prof = self.profiler
+        summary = result["summary"]
+        total = pending["total"]
+        selected = pending["selected"]
+        remaining = pending["remaining"]
 
         # Use engine summary
         current_cwa = float(summary.get("current_cwa", 0.0))
@@ -606,15 +1229,59 @@ class CWAEstimatorPage(QWidget):
         if self.sum_required_avg:
             self.sum_required_avg.setText(f"{required:.1f}")
 
-        if CHARTS_OK and self.series_current and self.series_adjusted:
-            self.series_current.clear()
-            self.series_adjusted.clear()
-            self.series_current.append(0, current_cwa)
-            self.series_current.append(1, current_cwa)
-            self.series_current.append(2, current_cwa)
-            self.series_adjusted.append(0, current_cwa)
-            self.series_adjusted.append(1, max(0.0, min(100.0, required)))
-            self.series_adjusted.append(2, float(target_cwa or 0.0))
+        t0, t1, t2, t3 = result["times"]
+        prof.record("engine", t0, t1)
+
+        t_alloc = time.perf_counter()
+        if result["scores"] is not None:
+            self._apply_allocations(pending["alloc_inputs"], result["scores"])
+        prof.record("allocate", t1, t2 + (time.perf_counter() - t_alloc))
+
+        t_chart = time.perf_counter()
+        sweep = result["sweep"]
+        if sweep is not None:
+            self._draw_curve(
+                current_cwa,
+                sweep["target_cwa"].tolist(),
+                sweep["required_avg"].tolist(),
+                sweep["feasible"].tolist(),
+                pending["target_cwa"],
+                required,
+            )
+        # drawn after the auto-fill above, so projected counts the new scores
+        self._draw_trajectory(pending["target_cwa"])
+
+        t_end = time.perf_counter()
+        prof.record("chart", t2, t3 + (t_end - t_chart))
+        prof.record("total", pending["t_start"], t_end)
+
+    def _on_engine_failed(self, generation: int, error: Exception) -> None:
+        if generation != self._generation:
+            return
+
+        # fall back to simple Python estimation if engine or bridge fails
+        pending = self._pending
+        selected = pending["selected"]
+        remaining = pending["remaining"]
+        target_cwa = pending["target_cwa"]
+        current_cwa = self._get_current_cwa()
+        required = self._fallback_required_avg(
+            completed=selected,
+            remaining=remaining,
+            current_cwa=current_cwa,
+            target_cwa=target_cwa,
+        )
+        if self.sum_required_avg:
+            self.sum_required_avg.setText(f"{required:.1f}")
+        if self.sum_engine_status:
+            self.sum_engine_status.setText(f"Engine error: {error}")
+        self._draw_curve(
+            current_cwa,
+            *self._fallback_curve(selected, remaining, current_cwa),
+            target_cwa,
+            required,
+        )
+        self.profiler.record("total", pending["t_start"], time.perf_counter())
 
     # ---- build UI ----
     def _build_ui(self):
@@ -644,8 +1311,16 @@ class CWAEstimatorPage(QWidget):
         add_course_btn.setCursor(Qt.PointingHandCursor)
         add_course_btn.clicked.connect(self.add_course_row)
 
+        self.recalc_btn = QPushButton("Recalculate")
+        self.recalc_btn.setObjectName("GhostBtn")
+        self.recalc_btn.setCursor(Qt.PointingHandCursor)
+        self.recalc_btn.clicked.connect(self.recompute)
+        self.recalc_btn.setVisible(False)
+
         header.addWidget(title)
         header.addStretch(1)
+        header.addWidget(self.recalc_btn)
+        header.addSpacing(8)
         header.addWidget(add_sem_btn)
         header.addSpacing(8)
         header.addWidget(add_course_btn)
@@ -654,7 +1329,7 @@ class CWAEstimatorPage(QWidget):
 
         self.semester_tabs = QTabWidget()
         self.semester_tabs.setDocumentMode(True)
-        self.semester_tabs.currentChanged.connect(lambda _: self.recompute())
+        self.semester_tabs.currentChanged.connect(self.schedule_recompute)
         courses_layout.addWidget(self.semester_tabs, 1)
 
         root.addWidget(courses_card, 2)
@@ -670,12 +1345,24 @@ class CWAEstimatorPage(QWidget):
         gl.setContentsMargins(14, 14, 14, 14)
         gl.setSpacing(10)
 
+        gheader = QHBoxLayout()
         gtitle = QLabel("CWA Distribution Graph")
         gtitle.setObjectName("CardTitle")
-        gl.addWidget(gtitle)
+        gheader.addWidget(gtitle)
+        gheader.addStretch(1)
+        gl.addLayout(gheader)
 
         if CHARTS_OK:
-            gl.addWidget(self._build_chart(), 1)
+            self.chart_stack = QStackedWidget()
+            self.chart_stack.addWidget(self._build_chart())
+            self.chart_stack.addWidget(self._build_trajectory_chart())
+
+            chart_view = QComboBox()
+            chart_view.addItems(["Required Avg by target", "CWA by semester"])
+            chart_view.currentIndexChanged.connect(self.chart_stack.setCurrentIndex)
+            gheader.addWidget(chart_view)
+
+            gl.addWidget(self.chart_stack, 1)
         else:
             lab = QLabel("QtCharts not available. Install: pip install PySide6-Addons")
             lab.setStyleSheet("color:#6b7280; font-weight:900;")
@@ -724,7 +1411,7 @@ class CWAEstimatorPage(QWidget):
         self.target_cwa_edit = QLineEdit("")  # no placeholder, no default
         self.target_cwa_edit.setProperty("field", "mini")
         self.target_cwa_edit.setValidator(QDoubleValidator(0.0, 100.0, 2, self))
-        self.target_cwa_edit.textChanged.connect(self.recompute)
+        self.target_cwa_edit.textChanged.connect(self.schedule_recompute)
         grid.addWidget(self.target_cwa_edit, 3, 1, alignment=Qt.AlignRight)
 
         grid.addWidget(lbl("Required Avg:"), 4, 0)
@@ -759,31 +1446,36 @@ class CWAEstimatorPage(QWidget):
         pen_current = QPen(QColor("#1d4ed8"))
         pen_current.setWidth(3)
         self.series_current.setPen(pen_current)
-        self.series_current.setPointsVisible(True)
         self.series_current.setName("Current CWA")
 
         pen_adjusted = QPen(QColor("#93c5fd"))
         pen_adjusted.setWidth(2)
         pen_adjusted.setStyle(Qt.DashLine)
         self.series_adjusted.setPen(pen_adjusted)
-        self.series_adjusted.setPointsVisible(True)
-        self.series_adjusted.setName("Adjusted CWA")
+        self.series_adjusted.setName("Required Avg")
+
+        self.series_target = QScatterSeries()
+        self.series_target.setName("Target CWA")
+        self.series_target.setColor(QColor("#1d4ed8"))
+        self.series_target.setBorderColor(QColor("#1d4ed8"))
+        self.series_target.setMarkerSize(10)
 
         chart = QChart()
         chart.addSeries(self.series_current)
         chart.addSeries(self.series_adjusted)
+        chart.addSeries(self.series_target)
         chart.setBackgroundVisible(False)
         chart.setPlotAreaBackgroundVisible(False)
         chart.legend().setVisible(True)
         chart.legend().setAlignment(Qt.AlignBottom)
         chart.legend().setLabelColor(QColor("#374151"))
 
-        axis_x = QCategoryAxis()
-        axis_x.setRange(0, 2)
-        axis_x.append("Initial", 0)
-        axis_x.append("Selected", 1)
-        axis_x.append("Adjusted", 2)
-        axis_x.setLabelsPosition(QCategoryAxis.AxisLabelsPositionOnValue)
+        axis_x = QValueAxis()
+        axis_x.setRange(0, 100)
+        axis_x.setTickCount(6)
+        axis_x.setLabelFormat("%d")
+        axis_x.setTitleText("Target CWA")
+        axis_x.setTitleBrush(QColor("#6b7280"))
         axis_x.setLabelsColor(QColor("#6b7280"))
         axis_x.setGridLineVisible(False)
 
@@ -799,6 +1491,69 @@ class CWAEstimatorPage(QWidget):
         self.series_current.attachAxis(axis_y)
         self.series_adjusted.attachAxis(axis_x)
         self.series_adjusted.attachAxis(axis_y)
+        self.series_target.attachAxis(axis_x)
+        self.series_target.attachAxis(axis_y)
+
+        view = QChartView(chart)
+        view.setRenderHint(QPainter.Antialiasing, True)
+        view.setStyleSheet("background: transparent;")
+        view.setMinimumHeight(270)
+        return view
+
+    def _build_trajectory_chart(self) -> QChartView:
+        self.series_actual = QLineSeries()
+        self.series_projected = QLineSeries()
+        self.series_goal = QLineSeries()
+
+        pen_actual = QPen(QColor("#1d4ed8"))
+        pen_actual.setWidth(3)
+        self.series_actual.setPen(pen_actual)
+        self.series_actual.setPointsVisible(True)
+        self.series_actual.setName("CWA so far")
+
+        pen_projected = QPen(QColor("#93c5fd"))
+        pen_projected.setWidth(2)
+        pen_projected.setStyle(Qt.DashLine)
+        self.series_projected.setPen(pen_projected)
+        self.series_projected.setPointsVisible(True)
+        self.series_projected.setName("With allocated scores")
+
+        pen_goal = QPen(QColor("#9ca3af"))
+        pen_goal.setWidth(1)
+        pen_goal.setStyle(Qt.DotLine)
+        self.series_goal.setPen(pen_goal)
+        self.series_goal.setName("Target CWA")
+
+        chart = QChart()
+        chart.addSeries(self.series_goal)
+        chart.addSeries(self.series_projected)
+        chart.addSeries(self.series_actual)
+        chart.setBackgroundVisible(False)
+        chart.setPlotAreaBackgroundVisible(False)
+        chart.legend().setVisible(True)
+        chart.legend().setAlignment(Qt.AlignBottom)
+        chart.legend().setLabelColor(QColor("#374151"))
+
+        self.traj_axis_x = QValueAxis()
+        self.traj_axis_x.setRange(1, 2)
+        self.traj_axis_x.setTickCount(2)
+        self.traj_axis_x.setLabelFormat("%d")
+        self.traj_axis_x.setTitleText("Semester")
+        self.traj_axis_x.setTitleBrush(QColor("#6b7280"))
+        self.traj_axis_x.setLabelsColor(QColor("#6b7280"))
+        self.traj_axis_x.setGridLineVisible(False)
+
+        axis_y = QValueAxis()
+        axis_y.setRange(0, 100)
+        axis_y.setTickCount(6)
+        axis_y.setLabelsColor(QColor("#6b7280"))
+        axis_y.setGridLineColor(QColor("#e5e7eb"))
+
+        chart.addAxis(self.traj_axis_x, Qt.AlignBottom)
+        chart.addAxis(axis_y, Qt.AlignLeft)
+        for series in (self.series_goal, self.series_projected, self.series_actual):
+            series.attachAxis(self.traj_axis_x)
+            series.attachAxis(axis_y)
 
         view = QChartView(chart)
         view.setRenderHint(QPainter.Antialiasing, True)
@@ -914,6 +1669,298 @@ class CGPACalculatorPage(QWidget):
         self.new_cgpa.setText(f"{new_cgpa:.3f}")
 
 
+# ---- Cohort distribution ----
+
+def cohort_metrics(path: str) -> dict:
+    """
+    Per-student values for the cohort view: {metric name: float64 array}.
+
+    path is a cohort file (.cwab), a registrar extract CSV (student_id,
+    credits, current, allocated, target) or a model CSV (current_cwa,
+    credit_load, study_hours). Required averages above 100 / below 0 are
+    +inf / -inf; students with nothing left to distribute are NaN.
+    """
+    if path.lower().endswith(".cwab"):
+        from cwa_cohort_format import open_cohort
+
+        results = open_cohort(path).evaluate()
+    else:
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f), [])
+
+        import model_training
+
+        if all(c in header for c in model_training.FEATURES):
+            with open(path, "r", newline="", encoding="utf-8") as f:
+                rows = [[model_training.parse_float(r[c]) for c in model_training.FEATURES] for r in csv.DictReader(f)]
+            features = np.asarray(rows, dtype=np.float64).reshape(-1, len(model_training.FEATURES))
+            return {
+                "Predicted CWA": np.asarray(model_training.predict_cwa_many(features), dtype=np.float64),
+                "Current CWA": features[:, 0].copy(),
+            }
+
+        from cwa_cohort_runner import read_extract
+
+        if compute_summaries is None:
+            raise RuntimeError(f"engine not connected ({ENGINE_ERR})")
+        results = compute_summaries(*read_extract(path))
+
+    status = results["status"]
+    required = np.asarray(results["required_avg"], dtype=np.float64).copy()
+    required[status == STATUS_ABOVE_MAX] = np.inf
+    required[status == STATUS_BELOW_MIN] = -np.inf
+    required[status == STATUS_NO_REMAINING] = np.nan
+    return {
+        "Required Avg": required,
+        "Current CWA": np.asarray(results["current_cwa"], dtype=np.float64),
+    }
+
+
+def bin_values(values: np.ndarray, bins: int, lo: float = 0.0, hi: float = 100.0) -> dict:
+    """
+    Histogram of values over [lo, hi] in equal-width bins, plus what fell outside.
+
+    Returns counts (int64[bins]), edges (float64[bins + 1]), below, above,
+    missing (NaN) and the mean / median of the finite values.
+    """
+    v = np.asarray(values, dtype=np.float64)
+    nan = np.isnan(v)
+    below = int(np.count_nonzero(v < lo))
+    above = int(np.count_nonzero(v > hi))
+    counts, edges = np.histogram(v[~nan & (v >= lo) & (v <= hi)], bins=bins, range=(lo, hi))
+    finite = v[np.isfinite(v)]
+    return {
+        "counts": counts.astype(np.int64),
+        "edges": edges,
+        "n": int(v.shape[0]),
+        "below": below,
+        "above": above,
+        "missing": int(np.count_nonzero(nan)),
+        "mean": float(finite.mean()) if finite.size else math.nan,
+        "median": float(np.median(finite)) if finite.size else math.nan,
+    }
+
+
+class CohortPage(QWidget):
+    """
+    Distribution of required averages / predicted CWAs across a cohort.
+
+    Loading, evaluation and binning run as EngineJobs on a worker thread;
+    the chart only ever receives the bin counts (one bar per bin), so a
+    100k-student cohort redraws as fast as a small one. Like the estimator,
+    a generation counter drops results for superseded requests.
+    """
+
+    BIN_CHOICES = [10, 20, 25, 50, 100]
+    FILE_FILTER = "Cohorts (*.cwab *.csv);;Cohort files (*.cwab);;CSV files (*.csv)"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._metrics: dict = {}
+        self._path = ""
+        self._load_seconds = 0.0
+
+        self._generation = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = EngineSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+
+        self.bar_set = None
+        self.axis_bins = None
+        self.axis_x = None
+        self.axis_y = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(18, 18, 18, 18)
+        layout.setSpacing(14)
+
+        card = ShadowCard()
+        cl = QVBoxLayout(card)
+        cl.setContentsMargins(14, 14, 14, 14)
+        cl.setSpacing(10)
+
+        header = QHBoxLayout()
+        title = QLabel("Cohort Distribution")
+        title.setObjectName("CardTitle")
+
+        self.metric_box = QComboBox()
+        self.metric_box.currentTextChanged.connect(self.rebin)
+
+        self.bins_box = QComboBox()
+        for b in self.BIN_CHOICES:
+            self.bins_box.addItem(f"{b} bins", b)
+        self.bins_box.setCurrentIndex(self.BIN_CHOICES.index(20))
+        self.bins_box.currentIndexChanged.connect(self.rebin)
+
+        open_btn = QPushButton("Open cohort…")
+        open_btn.setObjectName("GhostBtn")
+        open_btn.setCursor(Qt.PointingHandCursor)
+        open_btn.clicked.connect(self._choose_file)
+
+        header.addWidget(title)
+        header.addStretch(1)
+        header.addWidget(self.metric_box)
+        header.addWidget(self.bins_box)
+        header.addWidget(open_btn)
+        cl.addLayout(header)
+
+        self.status = QLabel("Open a cohort file (.cwab), a registrar extract or a model CSV.")
+        self.status.setStyleSheet("color:#6b7280; font-weight:700;")
+        self.status.setWordWrap(True)
+        cl.addWidget(self.status)
+
+        if CHARTS_OK:
+            cl.addWidget(self._build_chart(), 1)
+        else:
+            cl.addWidget(QLabel("QtCharts not available (install PySide6-Addons)."), 1)
+
+        layout.addWidget(card, 1)
+
+    def _build_chart(self) -> QChartView:
+        self.bar_set = QBarSet("Students")
+        self.bar_set.setColor(QColor("#1d4ed8"))
+        self.bar_set.setBorderColor(QColor("#1d4ed8"))
+
+        series = QBarSeries()
+        series.append(self.bar_set)
+        series.setBarWidth(1.0)
+
+        chart = QChart()
+        chart.addSeries(series)
+        chart.setBackgroundVisible(False)
+        chart.setPlotAreaBackgroundVisible(False)
+        chart.legend().setVisible(False)
+
+        # bars sit on a hidden category axis; the visible x axis shows the score range
+        self.axis_bins = QBarCategoryAxis()
+        self.axis_bins.setVisible(False)
+
+        self.axis_x = QValueAxis()
+        self.axis_x.setRange(0, 100)
+        self.axis_x.setTickCount(11)
+        self.axis_x.setLabelFormat("%d")
+        self.axis_x.setTitleBrush(QColor("#6b7280"))
+        self.axis_x.setLabelsColor(QColor("#6b7280"))
+        self.axis_x.setGridLineVisible(False)
+
+        self.axis_y = QValueAxis()
+        self.axis_y.setRange(0, 1)
+        self.axis_y.setLabelFormat("%d")
+        self.axis_y.setTitleText("Students")
+        self.axis_y.setTitleBrush(QColor("#6b7280"))
+        self.axis_y.setLabelsColor(QColor("#6b7280"))
+        self.axis_y.setGridLineColor(QColor("#e5e7eb"))
+
+        chart.addAxis(self.axis_bins, Qt.AlignBottom)
+        chart.addAxis(self.axis_x, Qt.AlignBottom)
+        chart.addAxis(self.axis_y, Qt.AlignLeft)
+        series.attachAxis(self.axis_bins)
+        series.attachAxis(self.axis_y)
+
+        view = QChartView(chart)
+        view.setRenderHint(QPainter.Antialiasing, True)
+        view.setStyleSheet("background: transparent;")
+        view.setMinimumHeight(320)
+        return view
+
+    # ---- worker jobs ----
+    def _submit(self, fn) -> None:
+        self._generation += 1
+        self._pool.clear()
+        self._pool.start(EngineJob(self._generation, fn, self._signals, self._is_current))
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def wait_for_worker(self, msecs: int = -1) -> bool:
+        """Block until the worker is idle and its result is shown (scripts and benchmarks)."""
+        done = self._pool.waitForDone(msecs)
+        QApplication.sendPostedEvents(self)
+        return done
+
+    def _choose_file(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(self, "Open cohort", "", self.FILE_FILTER)
+        if path:
+            self.load(path)
+
+    def load(self, path: str) -> None:
+        """Evaluate a cohort on the worker, then show the selected metric."""
+        self.status.setText(f"Loading {path} …")
+        metric = self.metric_box.currentText()
+        bins = self.bins_box.currentData()
+
+        def job() -> dict:
+            t0 = time.perf_counter()
+            metrics = cohort_metrics(path)
+            seconds = time.perf_counter() - t0
+            name = metric if metric in metrics else next(iter(metrics))
+            return {
+                "path": path,
+                "metrics": metrics,
+                "seconds": seconds,
+                "metric": name,
+                "hist": bin_values(metrics[name], bins),
+            }
+
+        self._submit(job)
+
+    def rebin(self, *_args) -> None:
+        """Re-bin the loaded cohort for the selected metric and bin count."""
+        metric = self.metric_box.currentText()
+        values = self._metrics.get(metric)
+        if values is None:
+            return
+        bins = self.bins_box.currentData()
+        self._submit(lambda: {"metric": metric, "hist": bin_values(values, bins)})
+
+    def _on_finished(self, generation: int, result: dict) -> None:
+        if generation != self._generation:
+            return
+
+        if "metrics" in result:
+            self._metrics = result["metrics"]
+            self._path = result["path"]
+            self._load_seconds = result["seconds"]
+            self.metric_box.blockSignals(True)
+            self.metric_box.clear()
+            self.metric_box.addItems(list(self._metrics))
+            self.metric_box.setCurrentText(result["metric"])
+            self.metric_box.blockSignals(False)
+
+        self._show(result["metric"], result["hist"])
+
+    def _on_failed(self, generation: int, error: Exception) -> None:
+        if generation == self._generation:
+            self.status.setText(f"Could not load cohort: {error}")
+
+    def _show(self, metric: str, hist: dict) -> None:
+        counts = hist["counts"]
+        edges = hist["edges"]
+
+        if self.bar_set is not None:
+            self.bar_set.remove(0, self.bar_set.count())
+            self.bar_set.append([float(c) for c in counts.tolist()])
+            self.axis_bins.setCategories([f"{a:g}–{b:g}" for a, b in zip(edges[:-1].tolist(), edges[1:].tolist())])
+            self.axis_x.setRange(float(edges[0]), float(edges[-1]))
+            self.axis_x.setTitleText(metric)
+            self.axis_y.setRange(0, max(1, int(counts.max()) if counts.size else 1))
+            self.axis_y.applyNiceNumbers()
+
+        parts = [f"{hist['n']:,} students", f"loaded in {self._load_seconds:.2f} s"]
+        if not math.isnan(hist["mean"]):
+            parts.append(f"mean {hist['mean']:.1f}, median {hist['median']:.1f}")
+        if hist["above"]:
+            parts.append(f"above 100: {hist['above']:,}")
+        if hist["below"]:
+            parts.append(f"below 0: {hist['below']:,}")
+        if hist["missing"]:
+            parts.append(f"nothing remaining: {hist['missing']:,}")
+        self.status.setText(f"{self._path} — " + " · ".join(parts))
+
+
 class SettingsPage(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -934,20 +1981,90 @@ class SettingsPage(QWidget):
         self.auto_recalc.setChecked(True)
         self.confirm_reset = QCheckBox("Confirm before reset")
         self.confirm_reset.setChecked(False)
+        self.auto_allocate = QCheckBox("Auto-fill allocated scores")
+        self.auto_allocate.setChecked(True)
 
         cl.addWidget(self.auto_recalc)
+        cl.addWidget(self.auto_allocate)
         cl.addWidget(self.confirm_reset)
 
         engine = QLabel(
-            ("Engine status: connected (cwa_engine_bridge.py)" if ENGINE_OK else f"Engine status: not connected ({ENGINE_ERR})")
+            (f"Engine status: connected ({ENGINE_VARIANT} build)" if ENGINE_OK else f"Engine status: not connected ({ENGINE_ERR})")
         )
         engine.setStyleSheet("color:#6b7280; font-weight:900;")
         cl.addSpacing(8)
         cl.addWidget(engine)
 
+        # Recompute profiling (opt-in), shown under the engine status
+        self.profile_recompute = QCheckBox("Profile recompute")
+        self.profile_recompute.setChecked(False)
+        cl.addWidget(self.profile_recompute)
+
+        self.profile_stats = QLabel("")
+        self.profile_stats.setStyleSheet("color:#6b7280; font-family: monospace;")
+        self.profile_stats.setVisible(False)
+        cl.addWidget(self.profile_stats)
+
+        prof_row = QHBoxLayout()
+        self.profile_export_btn = QPushButton("Export timing log")
+        self.profile_reset_btn = QPushButton("Reset")
+        prof_row.addWidget(self.profile_export_btn)
+        prof_row.addWidget(self.profile_reset_btn)
+        prof_row.addStretch(1)
+        cl.addLayout(prof_row)
+
+        self._profiler: Optional[RecomputeProfiler] = None
+        self._profile_timer = QTimer(self)
+        self._profile_timer.setInterval(500)
+        self._profile_timer.timeout.connect(self.refresh_profile_stats)
+
+        self.profile_recompute.toggled.connect(self._on_profile_toggled)
+        self.profile_export_btn.clicked.connect(self.export_timing_log)
+        self.profile_reset_btn.clicked.connect(self._reset_profile)
+        self._on_profile_toggled(False)
+
         cl.addStretch(1)
         layout.addWidget(card, 1)
 
+    def attach_profiler(self, profiler: RecomputeProfiler) -> None:
+        self._profiler = profiler
+        profiler.set_enabled(self.profile_recompute.isChecked())
+
+    def _on_profile_toggled(self, enabled: bool) -> None:
+        if self._profiler is not None:
+            self._profiler.set_enabled(enabled)
+        self.profile_stats.setVisible(enabled)
+        self.profile_export_btn.setEnabled(enabled)
+        self.profile_reset_btn.setEnabled(enabled)
+        if enabled:
+            self.refresh_profile_stats()
+            self._profile_timer.start()
+        else:
+            self._profile_timer.stop()
+
+    def _reset_profile(self) -> None:
+        if self._profiler is not None:
+            self._profiler.reset()
+        self.refresh_profile_stats()
+
+    def refresh_profile_stats(self) -> None:
+        if self._profiler is None:
+            self.profile_stats.setText("No page attached")
+            return
+        lines = [f"{'stage':<14}{'avg ms':>9}{'worst ms':>10}{'n':>6}"]
+        for stage, (avg, worst, n) in self._profiler.stats().items():
+            lines.append(f"{stage:<14}{avg:>9.3f}{worst:>10.3f}{n:>6}")
+        self.profile_stats.setText("\n".join(lines))
+
+    def export_timing_log(self) -> None:
+        if self._profiler is None:
+            return
+        default = f"cwa_timing_{datetime.now():%Y%m%d_%H%M%S}.csv"
+        path, _ = QFileDialog.getSaveFileName(self, "Export timing log", default, "CSV files (*.csv)")
+        if path:
+            n = self._profiler.export(path)
+            self.profile_stats.setToolTip(f"Exported {n} samples to {path}")
+
 
 class AboutPage(QWidget):
     def __init__(self, parent=None):
@@ -983,11 +2100,15 @@ class MainWindow(QMainWindow):
     Navigation:
       - CWA Estimator
       - CGPA Calculator
+      - Cohort Distribution
       - Settings
       - About
     """
 
-    def __init__(self):
+    # Student id the estimator's courses are saved under in a cwa_store file
+    STORE_STUDENT_ID = "local"
+
+    def __init__(self, store=None):
         super().__init__()
         self.setWindowTitle("Academic Tools")
         self.resize(1200, 740)
@@ -998,10 +2119,28 @@ class MainWindow(QMainWindow):
 
         self.stack: QStackedWidget | None = None
         self.cwa_page: CWAEstimatorPage | None = None
+        self.settings_page: SettingsPage | None = None
+        self.cohort_page: CohortPage | None = None
 
         self._build()
         self._apply_nav(0)
 
+        # Optional cwa_store.CWAStore: restore the estimator now, save it on close
+        self.store = store
+        if store is not None and store.target(self.STORE_STUDENT_ID) is not None:
+            self.cwa_page.load_semesters(store.semesters(self.STORE_STUDENT_ID), store.target(self.STORE_STUDENT_ID))
+
+    def save_to_store(self) -> None:
+        if self.store is None or self.cwa_page is None:
+            return
+        self.store.replace_student(
+            self.STORE_STUDENT_ID, self.cwa_page.semester_courses(), self.cwa_page._target_cwa_value() or 0.0
+        )
+
+    def closeEvent(self, event) -> None:
+        self.save_to_store()
+        super().closeEvent(event)
+
     def _build(self):
         root = QWidget()
         root.setObjectName("AppRoot")
@@ -1055,9 +2194,10 @@ class MainWindow(QMainWindow):
 
         sb.addWidget(nav("CWA Estimator", QStyle.SP_ComputerIcon, 0, checked=True))
         sb.addWidget(nav("CGPA Calculator", QStyle.SP_DriveHDIcon, 1))
+        sb.addWidget(nav("Cohort Distribution", QStyle.SP_FileDialogListView, 2))
         sb.addSpacing(14)
-        sb.addWidget(nav("Settings", QStyle.SP_FileDialogDetailedView, 2))
-        sb.addWidget(nav("About", QStyle.SP_MessageBoxInformation, 3))
+        sb.addWidget(nav("Settings", QStyle.SP_FileDialogDetailedView, 3))
+        sb.addWidget(nav("About", QStyle.SP_MessageBoxInformation, 4))
         sb.addStretch(1)
 
         # Right panel
@@ -1114,12 +2254,21 @@ class MainWindow(QMainWindow):
         self.cwa_page.set_current_cwa_getter(
             lambda: (self.current_cwa_input.text().strip() if self.current_cwa_input else "0") or "0"
         )
-        self.current_cwa_input.textChanged.connect(self.cwa_page.recompute)
+        self.current_cwa_input.textChanged.connect(self.cwa_page.schedule_recompute)
+
+        self.settings_page = SettingsPage()
+        self.settings_page.auto_recalc.toggled.connect(self.cwa_page.set_auto_recalculate)
+        self.cwa_page.set_auto_recalculate(self.settings_page.auto_recalc.isChecked())
+        self.settings_page.auto_allocate.toggled.connect(self.cwa_page.set_auto_allocate)
+        self.settings_page.attach_profiler(self.cwa_page.profiler)
+
+        self.cohort_page = CohortPage()
 
         self.stack.addWidget(self.cwa_page)          # 0
         self.stack.addWidget(CGPACalculatorPage())   # 1
-        self.stack.addWidget(SettingsPage())         # 2
-        self.stack.addWidget(AboutPage())            # 3
+        self.stack.addWidget(self.cohort_page)       # 2
+        self.stack.addWidget(self.settings_page)     # 3
+        self.stack.addWidget(AboutPage())            # 4
 
         shell_layout.addWidget(sidebar)
         shell_layout.addWidget(right, 1)
@@ -1131,7 +2280,7 @@ class MainWindow(QMainWindow):
         assert self.stack is not None
         self.stack.setCurrentIndex(idx)
 
-        titles = ["CWA Estimator", "CGPA Calculator", "Settings", "About"]
+        titles = ["CWA Estimator", "CGPA Calculator", "Cohort Distribution", "Settings", "About"]
         if self.page_title:
             self.page_title.setText(titles[idx])
 
@@ -1139,12 +2288,28 @@ class MainWindow(QMainWindow):
             self.current_cwa_container.setVisible(idx == 0)
 
         if idx == 0 and self.cwa_page:
-            self.cwa_page.recompute()
+            self.cwa_page.schedule_recompute()
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Academic Tools")
+    parser.add_argument("--store", metavar="PATH", help="SQLite file (cwa_store) to restore and save the estimator's courses")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setFont(QFont("Arial", 10))
-    w = MainWindow()
+
+    store = None
+    if args.store:
+        from cwa_store import CWAStore
+
+        store = CWAStore(args.store)
+
+    w = MainWindow(store)
     w.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    code = app.exec()
+    if store is not None:
+        store.close()
+    sys.exit(code)
\ No newline at end of file
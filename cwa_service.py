@@ -0,0 +1,298 @@
+"""
+Local JSON service for compute_summary(), with micro-batching.
+
+Concurrent requests are queued; a batcher task collects them for at most
+max_wait seconds (or until max_batch payloads are waiting), evaluates the
+whole batch with one compute_summary_many() call in a worker thread, and
+hands each request its own result. Standard library + NumPy only.
+
+Endpoints (HTTP/1.1, JSON bodies):
+    POST /summary     one compute_summary() payload  -> one summary
+    POST /summaries   a list of payloads              -> a list of summaries
+    GET  /health      {"ok": true}
+    GET  /stats       batch counters
+
+A summary is the compute_summary() dict plus "status", the engine's
+STATUS_* code (0 ok, 1 nothing remaining, -1 above 100, -2 below 0), as
+returned by compute_summary_many().
+
+Run:
+    python cwa_service.py --port 8765 --max-batch 256 --max-wait-ms 2
+    python cwa_service.py --unix /tmp/cwa.sock
+"""
+import argparse
+import asyncio
+import json
+import sys
+from typing import List, Optional, Tuple
+
+import cwa_engine_bridge
+
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+def _check_payload(payload: dict, label: str = "payload") -> None:
+    # reject bad payloads up front, so one of them cannot fail a whole batch
+    if "target_cwa" not in payload:
+        raise ValueError(f"target_cwa is required in {label}")
+    courses = payload.get("courses", []) or []
+    if not isinstance(courses, list) or not all(isinstance(c, dict) for c in courses):
+        raise ValueError(f"courses must be a list of objects in {label}")
+
+
+class MicroBatcher:
+    """
+    Gathers compute_summary() payloads from concurrent callers into batches.
+
+    max_batch bounds the payloads per engine call; max_wait is how long the
+    first payload of a batch may wait for company. max_wait=0 still batches
+    whatever arrived while the previous batch was being evaluated.
+    """
+
+    def __init__(self, max_batch: int = 256, max_wait: float = 0.002) -> None:
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive")
+        if max_wait < 0:
+            raise ValueError("max_wait must not be negative")
+        self.max_batch = int(max_batch)
+        self.max_wait = float(max_wait)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: List[Tuple[dict, asyncio.Future]] = []
+        self.batches = 0
+        self.payloads = 0
+        self.largest_batch = 0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop batching; requests still queued or in flight fail with RuntimeError."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        pending = self._inflight
+        self._inflight = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, fut in pending:
+            if not fut.done():
+                fut.set_exception(RuntimeError("service stopping"))
+
+    async def submit(self, payload: dict) -> dict:
+        """Queue one payload and wait for its summary."""
+        _check_payload(payload)
+        self.start()
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((payload, fut))
+        return await fut
+
+    async def submit_many(self, payloads: List[dict]) -> List[dict]:
+        for i, payload in enumerate(payloads):
+            _check_payload(payload, f"payload {i}")
+        return list(await asyncio.gather(*(self.submit(p) for p in payloads)))
+
+    async def _collect(self) -> List[Tuple[dict, asyncio.Future]]:
+        batch = [await self._queue.get()]
+        # tracked from the first item on: stop() fails these if it cancels us mid-batch
+        self._inflight = batch
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            # take everything already queued without waiting
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            timeout = deadline - loop.time()
+            if len(batch) >= self.max_batch or timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            payloads = [p for p, _ in batch]
+            try:
+                results = await loop.run_in_executor(None, cwa_engine_bridge.compute_summary_many, payloads)
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                self._inflight = []
+                continue
+
+            self.batches += 1
+            self.payloads += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            for (_, fut), result in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(result)
+            self._inflight = []
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "payloads": self.payloads,
+            "mean_batch": self.payloads / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1e3,
+        }
+
+
+# -----------------------------------
+# HTTP
+# -----------------------------------
+
+async def _read_request(reader: asyncio.StreamReader):
+    """(method, path, headers, body) for the next request, or None at EOF."""
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise ValueError("malformed request line")
+    method, path, _version = parts
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", "0") or 0)
+    if length > MAX_BODY_BYTES:
+        raise OverflowError(length)
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+
+def _response(status: int, obj, keep_alive: bool) -> bytes:
+    body = json.dumps(obj).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class SummaryService:
+    def __init__(self, batcher: MicroBatcher) -> None:
+        self.batcher = batcher
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, object]:
+        if path == "/health":
+            return 200, {"ok": True}
+        if path == "/stats":
+            return 200, self.batcher.stats()
+        if path not in ("/summary", "/summaries"):
+            return 404, {"error": f"unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+
+        try:
+            data = json.loads(body or b"null")
+            if path == "/summary":
+                if not isinstance(data, dict):
+                    raise ValueError("expected a JSON object")
+                return 200, await self.batcher.submit(data)
+            if not isinstance(data, list) or not all(isinstance(p, dict) for p in data):
+                raise ValueError("expected a JSON list of objects")
+            return 200, await self.batcher.submit_many(data)
+        except ValueError as e:
+            return 400, {"error": str(e)}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except OverflowError:
+                    writer.write(_response(413, {"error": "request body too large"}, False))
+                    break
+                except (ValueError, asyncio.IncompleteReadError):
+                    writer.write(_response(400, {"error": "malformed request"}, False))
+                    break
+                if request is None:
+                    break
+
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, obj = await self._dispatch(method, path.split("?", 1)[0], body)
+                writer.write(_response(status, obj, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_path: Optional[str] = None,
+    max_batch: int = 256,
+    max_wait: float = 0.002,
+) -> None:
+    cwa_engine_bridge.load_engine()
+    engine = cwa_engine_bridge.engine_info()
+    batcher = MicroBatcher(max_batch, max_wait)
+    batcher.start()
+    service = SummaryService(batcher)
+
+    if unix_path:
+        server = await asyncio.start_unix_server(service.handle, path=unix_path)
+        where = unix_path
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+        where = f"http://{host}:{port}"
+
+    print(
+        f"Serving compute_summary on {where} (max batch {max_batch}, max wait {max_wait * 1e3:g} ms, "
+        f"engine {engine['variant']})",
+        file=sys.stderr,
+    )
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Local JSON service for compute_summary with micro-batching")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind (default: localhost only)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--max-batch", type=int, default=256, help="payloads per engine call")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="longest a request waits for a batch to fill")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.max_batch, args.max_wait_ms / 1e3))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,497 @@
+"""
+Local SQLite store for students, semesters and course rows.
+
+Each student row carries the compute_summary() totals of its courses
+(completed / remaining credits, weighted sum, locked WA / credits). The
+totals are kept up to date by triggers on the courses table, so a
+summary is one primary-key read plus the engine step, not a rescan of
+the student's courses.
+
+Imports go through executemany() inside a single transaction per batch.
+
+Run:
+    python cwa_store.py store.sqlite import records.csv
+    python cwa_store.py store.sqlite summary S001 --target 70
+    python cwa_store.py store.sqlite summaries --output results.csv
+    python cwa_store.py store.sqlite trajectories --output trajectories.csv
+"""
+import argparse
+import csv
+import math
+import sqlite3
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+import cwa_engine_bridge
+
+SCHEMA_VERSION = 1
+
+# Aggregate columns on students, in the order summary_from_totals() takes them.
+AGGREGATES = ["completed_credits", "remaining_credits", "weighted_sum", "locked_wa", "locked_credits"]
+
+# Per-course contribution to AGGREGATES, as SQL over a row alias; the same
+# rules as cwa_engine_bridge._course_contribution() (rows with credits <= 0 add nothing).
+_CONTRIBUTION = {
+    "completed_credits": "CASE WHEN {r}.credits > 0 AND {r}.current > 0 THEN {r}.credits ELSE 0 END",
+    "remaining_credits": "CASE WHEN {r}.credits > 0 AND {r}.current <= 0 THEN {r}.credits ELSE 0 END",
+    "weighted_sum": "CASE WHEN {r}.credits > 0 THEN {r}.credits * {r}.current ELSE 0.0 END",
+    "locked_wa": (
+        "CASE WHEN {r}.credits > 0 AND {r}.current <= 0 AND {r}.allocated > 0 AND {r}.current >= {r}.allocated "
+        "THEN {r}.allocated * {r}.credits ELSE 0.0 END"
+    ),
+    "locked_credits": (
+        "CASE WHEN {r}.credits > 0 AND {r}.current <= 0 AND {r}.allocated > 0 AND {r}.current >= {r}.allocated "
+        "THEN {r}.credits ELSE 0 END"
+    ),
+}
+
+
+def _apply(row: str, sign: str) -> str:
+    """SET clause adding (sign '+') or removing (sign '-') one course's contribution."""
+    sets = [f"{col} = {col} {sign} ({_CONTRIBUTION[col].format(r=row)})" for col in AGGREGATES]
+    sets.append(f"course_count = course_count {sign} 1")
+    return ",\n        ".join(sets)
+
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS students (
+    student_id        TEXT PRIMARY KEY,
+    target_cwa        REAL    NOT NULL DEFAULT 0,
+    completed_credits INTEGER NOT NULL DEFAULT 0,
+    remaining_credits INTEGER NOT NULL DEFAULT 0,
+    weighted_sum      REAL    NOT NULL DEFAULT 0,
+    locked_wa         REAL    NOT NULL DEFAULT 0,
+    locked_credits    INTEGER NOT NULL DEFAULT 0,
+    course_count      INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS semesters (
+    student_id TEXT    NOT NULL REFERENCES students(student_id) ON DELETE CASCADE,
+    semester   INTEGER NOT NULL,
+    label      TEXT    NOT NULL DEFAULT '',
+    PRIMARY KEY (student_id, semester)
+);
+
+CREATE TABLE IF NOT EXISTS courses (
+    course_id  INTEGER PRIMARY KEY,
+    student_id TEXT    NOT NULL,
+    semester   INTEGER NOT NULL,
+    course     TEXT    NOT NULL DEFAULT '',
+    credits    INTEGER NOT NULL DEFAULT 0,
+    current    REAL    NOT NULL DEFAULT 0,
+    allocated  REAL    NOT NULL DEFAULT 0,
+    FOREIGN KEY (student_id, semester) REFERENCES semesters(student_id, semester) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS courses_by_student ON courses(student_id, semester, course_id);
+CREATE INDEX IF NOT EXISTS courses_by_semester ON courses(semester);
+
+-- parents are created on demand, so callers only need to insert course rows
+CREATE TRIGGER IF NOT EXISTS courses_parents BEFORE INSERT ON courses
+WHEN NOT EXISTS (SELECT 1 FROM semesters WHERE student_id = NEW.student_id AND semester = NEW.semester)
+BEGIN
+    INSERT OR IGNORE INTO students(student_id) VALUES (NEW.student_id);
+    INSERT OR IGNORE INTO semesters(student_id, semester) VALUES (NEW.student_id, NEW.semester);
+END;
+
+CREATE TRIGGER IF NOT EXISTS courses_insert AFTER INSERT ON courses
+BEGIN
+    UPDATE students SET
+        {_apply("NEW", "+")}
+    WHERE student_id = NEW.student_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS courses_delete AFTER DELETE ON courses
+BEGIN
+    UPDATE students SET
+        {_apply("OLD", "-")}
+    WHERE student_id = OLD.student_id;
+    -- drop float residue once a student has no courses left
+    UPDATE students SET weighted_sum = 0.0, locked_wa = 0.0
+    WHERE student_id = OLD.student_id AND course_count = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS courses_update
+AFTER UPDATE OF student_id, semester, credits, current, allocated ON courses
+BEGIN
+    INSERT OR IGNORE INTO students(student_id) VALUES (NEW.student_id);
+    INSERT OR IGNORE INTO semesters(student_id, semester) VALUES (NEW.student_id, NEW.semester);
+    UPDATE students SET
+        {_apply("OLD", "-")}
+    WHERE student_id = OLD.student_id;
+    UPDATE students SET
+        {_apply("NEW", "+")}
+    WHERE student_id = NEW.student_id;
+END;
+"""
+
+COURSE_COLUMNS = ["student_id", "semester", "course", "credits", "current", "allocated"]
+
+
+class CWAStore:
+    """
+    SQLite store of course rows with trigger-maintained per-student totals.
+
+    Writes made through the methods below are committed before they
+    return; import_rows() commits once per batch. Use the store as a
+    context manager (or call close()) to release the connection.
+    """
+
+    def __init__(self, path=":memory:") -> None:
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if self.path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "CWAStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---- writes ----
+    def set_target(self, student_id: str, target_cwa: float) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO students(student_id, target_cwa) VALUES (?, ?) "
+                "ON CONFLICT(student_id) DO UPDATE SET target_cwa = excluded.target_cwa",
+                (str(student_id), _finite_float(target_cwa)),
+            )
+
+    def add_course(
+        self,
+        student_id: str,
+        semester: int,
+        course: str = "",
+        credits: Any = 0,
+        current: Any = 0.0,
+        allocated: Any = 0.0,
+    ) -> int:
+        """Insert one course row and return its course_id."""
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO courses(student_id, semester, course, credits, current, allocated) VALUES (?, ?, ?, ?, ?, ?)",
+                _course_row(student_id, semester, course, credits, current, allocated),
+            )
+        return int(cur.lastrowid)
+
+    def update_course(self, course_id: int, **fields: Any) -> None:
+        """Change some of course, credits, current, allocated (or move the row) for one course."""
+        unknown = set(fields) - set(COURSE_COLUMNS)
+        if unknown:
+            raise ValueError(f"unknown course field(s): {', '.join(sorted(unknown))}")
+        if not fields:
+            return
+        parse = {
+            "student_id": str,
+            "semester": int,
+            "course": str,
+            "credits": cwa_engine_bridge.safe_int,
+            "current": _finite_float,
+            "allocated": _finite_float,
+        }
+        names = list(fields)
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE courses SET {', '.join(f'{n} = ?' for n in names)} WHERE course_id = ?",
+                [parse[n](fields[n]) for n in names] + [int(course_id)],
+            )
+
+    def delete_course(self, course_id: int) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM courses WHERE course_id = ?", (int(course_id),))
+
+    def delete_student(self, student_id: str) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM courses WHERE student_id = ?", (str(student_id),))
+            self.conn.execute("DELETE FROM students WHERE student_id = ?", (str(student_id),))
+
+    def import_rows(self, rows: Iterable[Sequence[Any]], batch_size: int = 10_000) -> int:
+        """
+        Bulk insert (student_id, semester, course, credits, current, allocated[, target]) rows.
+
+        Each batch is one executemany() in one transaction; a target, when
+        present, is stored for the student. Unparseable or non-finite
+        numbers are stored as 0. Returns the number of rows.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        n = 0
+        batch: List[tuple] = []
+        targets: Dict[str, float] = {}
+
+        def flush() -> None:
+            with self.conn:
+                # parents once per batch, so courses_parents finds them and skips its inserts
+                parents = list(dict.fromkeys((r[0], r[1]) for r in batch))
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO students(student_id) VALUES (?)", [(p[0],) for p in parents]
+                )
+                self.conn.executemany("INSERT OR IGNORE INTO semesters(student_id, semester) VALUES (?, ?)", parents)
+                self.conn.executemany(
+                    "INSERT INTO courses(student_id, semester, course, credits, current, allocated) VALUES (?, ?, ?, ?, ?, ?)",
+                    batch,
+                )
+                if targets:
+                    self.conn.executemany(
+                        "UPDATE students SET target_cwa = ? WHERE student_id = ?",
+                        [(t, s) for s, t in targets.items()],
+                    )
+            batch.clear()
+            targets.clear()
+
+        for row in rows:
+            batch.append(_course_row(*row[:6]))
+            if len(row) > 6:
+                targets[str(row[0])] = _finite_float(row[6])
+            n += 1
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+        return n
+
+    def import_records(self, src, batch_size: int = 10_000) -> int:
+        """import_rows() from a course-record CSV (the cwa_stream_pipeline input format)."""
+        from cwa_stream_pipeline import read_records
+
+        return self.import_rows(
+            (
+                (r["student_id"], r["semester"], r["course"], r["credits"], r["current"], r["allocated"], r["target"])
+                for r in read_records(src)
+            ),
+            batch_size,
+        )
+
+    def replace_student(self, student_id: str, semesters: List[List[dict]], target_cwa: Optional[float] = None) -> None:
+        """
+        Replace all of a student's rows with semesters (a list of course-dict
+        lists, as in compute_summary() payloads), in one transaction.
+        """
+        sid = str(student_id)
+        rows = [
+            _course_row(sid, i + 1, c.get("course", ""), c.get("credits", 0), c.get("current", 0.0), c.get("allocated", 0.0))
+            for i, courses in enumerate(semesters)
+            for c in courses
+        ]
+        with self.conn:
+            self.conn.execute("DELETE FROM courses WHERE student_id = ?", (sid,))
+            self.conn.execute("DELETE FROM semesters WHERE student_id = ?", (sid,))
+            self.conn.execute("INSERT OR IGNORE INTO students(student_id) VALUES (?)", (sid,))
+            self.conn.executemany(
+                "INSERT INTO semesters(student_id, semester) VALUES (?, ?)",
+                [(sid, i + 1) for i in range(len(semesters))],
+            )
+            self.conn.executemany(
+                "INSERT INTO courses(student_id, semester, course, credits, current, allocated) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            if target_cwa is not None:
+                self.conn.execute(
+                    "UPDATE students SET target_cwa = ? WHERE student_id = ?",
+                    (_finite_float(target_cwa), sid),
+                )
+
+    def rebuild_aggregates(self) -> None:
+        """
+        Recompute every student's totals from the course rows.
+
+        The triggers add and subtract floats, so after many updates the
+        sums can drift from a fresh pass by a few ulps; this resets them.
+        """
+        sums = ",\n".join(f"COALESCE((SELECT SUM({_CONTRIBUTION[c].format(r='c')}) FROM courses c "
+                          f"WHERE c.student_id = students.student_id), 0)" for c in AGGREGATES)
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE students SET ({', '.join(AGGREGATES)}, course_count) = ({sums}, "
+                "(SELECT COUNT(*) FROM courses c WHERE c.student_id = students.student_id))"
+            )
+
+    # ---- reads ----
+    def students(self) -> List[str]:
+        return [r[0] for r in self.conn.execute("SELECT student_id FROM students ORDER BY student_id")]
+
+    def target(self, student_id: str) -> Optional[float]:
+        row = self.conn.execute("SELECT target_cwa FROM students WHERE student_id = ?", (str(student_id),)).fetchone()
+        return None if row is None else float(row[0])
+
+    def semesters(self, student_id: str) -> List[List[dict]]:
+        """The student's courses grouped by semester, in semester and insertion order."""
+        sid = str(student_id)
+        numbers = [r[0] for r in self.conn.execute(
+            "SELECT semester FROM semesters WHERE student_id = ? ORDER BY semester", (sid,)
+        )]
+        grouped: Dict[int, List[dict]] = {s: [] for s in numbers}
+        for r in self.conn.execute(
+            "SELECT semester, course, credits, current, allocated FROM courses "
+            "WHERE student_id = ? ORDER BY semester, course_id",
+            (sid,),
+        ):
+            grouped.setdefault(r["semester"], []).append(
+                {"course": r["course"], "credits": r["credits"], "current": r["current"], "allocated": r["allocated"]}
+            )
+        return [grouped[s] for s in sorted(grouped)]
+
+    def totals(self, student_id: str) -> Optional[dict]:
+        """The trigger-maintained totals for one student (None if unknown)."""
+        row = self.conn.execute(
+            f"SELECT target_cwa, course_count, {', '.join(AGGREGATES)} FROM students WHERE student_id = ?",
+            (str(student_id),),
+        ).fetchone()
+        return None if row is None else dict(row)
+
+    def summary(self, student_id: str, target_cwa: Optional[float] = None) -> dict:
+        """
+        compute_summary() for one stored student, from the stored totals.
+
+        target_cwa defaults to the student's stored target.
+        """
+        t = self.totals(student_id)
+        if t is None:
+            raise KeyError(student_id)
+        target = t["target_cwa"] if target_cwa is None else target_cwa
+        return cwa_engine_bridge.summary_from_totals(
+            int(t["completed_credits"]),
+            int(t["remaining_credits"]),
+            float(t["weighted_sum"]),
+            float(t["locked_wa"]),
+            int(t["locked_credits"]),
+            cwa_engine_bridge.safe_float(target),
+        )
+
+    def summaries(self, target_cwa: Optional[float] = None) -> dict:
+        """compute_summaries() for every stored student (student_id order), from the stored totals."""
+        rows = self.conn.execute(
+            f"SELECT student_id, target_cwa, {', '.join(AGGREGATES)} FROM students ORDER BY student_id"
+        ).fetchall()
+        ids = np.array([r[0] for r in rows], dtype=str)
+        cols = np.array([tuple(r)[1:] for r in rows], dtype=np.float64).reshape(len(rows), 1 + len(AGGREGATES))
+        target = cols[:, 0] if target_cwa is None else np.full(len(rows), float(target_cwa))
+        return cwa_engine_bridge.summaries_from_totals(
+            ids,
+            cols[:, 1].astype(np.int64),
+            cols[:, 2].astype(np.int64),
+            cols[:, 3],
+            cols[:, 4],
+            cols[:, 5].astype(np.int64),
+            target,
+        )
+
+    def trajectories(self) -> dict:
+        """cwa_trajectories() for every stored student, read in one ordered scan of courses."""
+        rows = self.conn.execute(
+            "SELECT student_id, semester, credits, current, allocated FROM courses ORDER BY student_id, semester, course_id"
+        ).fetchall()
+        if not rows:
+            empty = np.empty((0, 0))
+            return {
+                "student_id": np.array([], dtype=str),
+                "semester": np.array([], dtype=np.int64),
+                "cwa": empty,
+                "completed_credits": empty.astype(np.int64),
+                "projected": empty.copy(),
+            }
+        sid, sem, cr, cur, alloc = zip(*rows)
+        return cwa_engine_bridge.cwa_trajectories(
+            np.array(sid, dtype=str), np.array(sem, dtype=np.int64), cr, cur, alloc
+        )
+
+
+def write_trajectories(result: dict, out, key: str = "cwa") -> None:
+    """One CSV row per student: student_id, then result[key] after each semester (empty = no value yet)."""
+    writer = csv.writer(out)
+    writer.writerow(["student_id"] + [f"semester_{s}" for s in result["semester"].tolist()])
+    for sid, values in zip(result["student_id"].tolist(), result[key].tolist()):
+        writer.writerow([sid] + ["" if v != v else v for v in values])
+
+
+def _finite_float(x: Any) -> float:
+    # safe_float(), with NaN / inf stored as 0.0 like an unparseable value
+    # (SQLite turns NaN into NULL, which the NOT NULL columns reject)
+    v = cwa_engine_bridge.safe_float(x)
+    return v if math.isfinite(v) else 0.0
+
+
+def _course_row(student_id, semester, course, credits, current, allocated) -> tuple:
+    return (
+        str(student_id),
+        cwa_engine_bridge.safe_int(semester),
+        str(course or ""),
+        cwa_engine_bridge.safe_int(credits),
+        _finite_float(current),
+        _finite_float(allocated),
+    )
+
+
+def open_store(path) -> CWAStore:
+    return CWAStore(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="SQLite course store with per-student aggregates")
+    parser.add_argument("store", help="SQLite file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="bulk import a course-record CSV")
+    imp.add_argument("records", help="CSV with student_id,semester,course,credits,current,allocated,target")
+    imp.add_argument("--batch-size", type=int, default=10_000, help="rows per transaction")
+
+    one = sub.add_parser("summary", help="summary for one student")
+    one.add_argument("student_id")
+    one.add_argument("--target", type=float, default=None, help="override the stored target CWA")
+
+    many = sub.add_parser("summaries", help="summaries for every student")
+    many.add_argument("--target", type=float, default=None, help="override the stored targets")
+    many.add_argument("--output", default="-", help="results CSV ('-' for stdout)")
+
+    traj = sub.add_parser("trajectories", help="cumulative CWA after each semester, per student")
+    traj.add_argument("--projected", action="store_true", help="count remaining courses at their allocated score")
+    traj.add_argument("--output", default="-", help="CSV destination ('-' for stdout)")
+
+    args = parser.parse_args(argv)
+
+    with open_store(args.store) as store:
+        t0 = time.perf_counter()
+        if args.command == "import":
+            with open(args.records, "r", newline="", encoding="utf-8") as f:
+                n = store.import_records(f, args.batch_size)
+            print(f"Imported {n} rows in {time.perf_counter() - t0:.2f} s", file=sys.stderr)
+        elif args.command == "summary":
+            print(store.summary(args.student_id, args.target))
+        elif args.command == "trajectories":
+            result = store.trajectories()
+            key = "projected" if args.projected else "cwa"
+            if args.output == "-":
+                write_trajectories(result, sys.stdout, key)
+            else:
+                with open(args.output, "w", newline="", encoding="utf-8") as f:
+                    write_trajectories(result, f, key)
+            print(f"{len(result['student_id'])} students in {time.perf_counter() - t0:.2f} s", file=sys.stderr)
+        else:
+            from cwa_cohort_runner import write_results
+
+            results = store.summaries(args.target)
+            if args.output == "-":
+                write_results(results, sys.stdout)
+            else:
+                with open(args.output, "w", newline="", encoding="utf-8") as f:
+                    write_results(results, f)
+            print(f"{len(results['student_id'])} students in {time.perf_counter() - t0:.2f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
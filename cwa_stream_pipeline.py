@@ -0,0 +1,153 @@
+"""
+Streaming pipeline from a course-record CSV to per-student summaries.
+
+Reads rows one at a time, groups them lazily by student, runs
+compute_summary() on each group and writes the summaries as they are
+produced. Only one student's courses are held in memory at a time, so
+memory use does not grow with the size of the file.
+
+Input format (CSV, one row per course, sorted by student_id):
+    student_id,semester,course,credits,current,allocated,target
+
+The target is taken from each student's first row. An input that is not
+sorted by student_id (including a student whose rows are split across the
+file) is an error (ValueError), not several summaries.
+
+Run:
+    python cwa_stream_pipeline.py records.csv --output summaries.jsonl
+    python cwa_stream_pipeline.py records.csv --format csv > summaries.csv
+"""
+import argparse
+import csv
+import itertools
+import json
+import sys
+import time
+from typing import IO, Iterable, Iterator, Tuple
+
+import cwa_engine_bridge
+
+INPUT_COLUMNS = ["student_id", "semester", "course", "credits", "current", "allocated", "target"]
+
+SUMMARY_COLUMNS = [
+    "student_id",
+    "courses",
+    "semesters",
+    "current_cwa",
+    "required_avg",
+    "total_credits",
+    "selected_credits",
+    "remaining_credits",
+]
+
+
+# -----------------------------------
+# STAGES
+# -----------------------------------
+
+def read_records(src: IO[str]) -> Iterator[dict]:
+    """Yield the rows of a course-record CSV as dicts."""
+    reader = csv.DictReader(src)
+    missing = [c for c in INPUT_COLUMNS if c not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"input is missing column(s): {', '.join(missing)}")
+    yield from reader
+
+
+def group_by_student(records: Iterable[dict]) -> Iterator[Tuple[str, list]]:
+    """
+    Yield (student_id, rows) for each run of rows with the same student_id.
+
+    Input must be sorted by student_id. Only the previous student_id is
+    kept, so a student_id lower than it (an unsorted file, or a student
+    whose rows are split) raises ValueError.
+    """
+    previous = None
+    for student_id, rows in itertools.groupby(records, key=lambda r: r["student_id"]):
+        if previous is not None and student_id < previous:
+            raise ValueError(f"student {student_id!r} comes after {previous!r}; sort the input by student_id")
+        previous = student_id
+        yield student_id, list(rows)
+
+
+def summarize(groups: Iterable[Tuple[str, list]]) -> Iterator[dict]:
+    """compute_summary() for each student group, as a generator."""
+    for student_id, rows in groups:
+        payload = {
+            "courses": [
+                {"course": r["course"], "credits": r["credits"], "current": r["current"], "allocated": r["allocated"]}
+                for r in rows
+            ],
+            "target_cwa": rows[0]["target"],
+        }
+        summary = cwa_engine_bridge.compute_summary(payload)
+        yield {
+            "student_id": student_id,
+            "courses": len(rows),
+            "semesters": len({r["semester"] for r in rows}),
+            **summary,
+        }
+
+
+def stream_summaries(src: IO[str]) -> Iterator[dict]:
+    """The whole pipeline: CSV text in, one summary dict per student out."""
+    return summarize(group_by_student(read_records(src)))
+
+
+# -----------------------------------
+# SINKS
+# -----------------------------------
+
+def write_csv(summaries: Iterable[dict], dst: IO[str]) -> int:
+    writer = csv.DictWriter(dst, fieldnames=SUMMARY_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    n = 0
+    for s in summaries:
+        writer.writerow(s)
+        n += 1
+    return n
+
+
+def write_jsonl(summaries: Iterable[dict], dst: IO[str]) -> int:
+    n = 0
+    for s in summaries:
+        dst.write(json.dumps(s) + "\n")
+        n += 1
+    return n
+
+
+SINKS = {"csv": write_csv, "jsonl": write_jsonl}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Stream course records into per-student summaries")
+    parser.add_argument("records", help="CSV with " + ",".join(INPUT_COLUMNS) + " ('-' for stdin)")
+    parser.add_argument("--output", default="-", help="summary destination ('-' for stdout)")
+    parser.add_argument(
+        "--format", choices=sorted(SINKS), default=None,
+        help="output format (default: from the --output extension, else jsonl)",
+    )
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+
+    t0 = time.perf_counter()
+    src = sys.stdin if args.records == "-" else open(args.records, "r", newline="", encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        n = SINKS[fmt](stream_summaries(src), dst)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+    print(f"{n} students in {time.perf_counter() - t0:.2f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
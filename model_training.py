@@ -1,7 +1,14 @@
+import argparse
+import csv
+import hashlib
+import json
+import sys
+import threading
+from pathlib import Path
+
 import numpy as np
-from sklearn.linear_model import LinearRegression
 
-# Train a simple model (example data)
+# Training data (example data)
 X = np.array([
     [75.0, 18, 30],
     [70.0, 21, 25],
@@ -11,11 +18,231 @@ X = np.array([
 
 y = np.array([78.0, 75.0, 82.0, 70.0])
 
-model = LinearRegression()
-model.fit(X, y)
+FEATURES = ["current_cwa", "credit_load", "study_hours"]
+
+# Trained coefficients are stored here by `python model_training.py --train`
+MODEL_ARTIFACT_PATH = Path(__file__).resolve().parent / "models" / "cwa_linear_model.json"
+ARTIFACT_FORMAT = "cwa-linear-model"
+ARTIFACT_VERSION = 1
+
+
+class LinearCWAModel:
+    """
+    Trained linear model as plain NumPy arrays.
+
+    predict() is X @ coef_ + intercept_, the same computation as
+    LinearRegression.predict, without importing scikit-learn.
+    """
+
+    def __init__(self, coef, intercept: float) -> None:
+        self.coef_ = np.asarray(coef, dtype=np.float64)
+        self.intercept_ = float(intercept)
+
+    def predict(self, X_in) -> np.ndarray:
+        return np.asarray(X_in, dtype=np.float64) @ self.coef_ + self.intercept_
+
+
+def _training_data_hash() -> str:
+    h = hashlib.sha256()
+    h.update(np.ascontiguousarray(X, dtype=np.float64).tobytes())
+    h.update(np.ascontiguousarray(y, dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+def train_model() -> LinearCWAModel:
+    """Fit LinearRegression on the training data (imports scikit-learn)."""
+    from sklearn.linear_model import LinearRegression
+
+    reg = LinearRegression()
+    reg.fit(X, y)
+    return LinearCWAModel(reg.coef_, reg.intercept_)
+
+
+def save_model_artifact(model: LinearCWAModel, path=MODEL_ARTIFACT_PATH) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    artifact = {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_VERSION,
+        "features": FEATURES,
+        "coef": [float(c) for c in model.coef_],
+        "intercept": float(model.intercept_),
+        "training_data_sha256": _training_data_hash(),
+    }
+    path.write_text(json.dumps(artifact, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def load_model_artifact(path=MODEL_ARTIFACT_PATH) -> LinearCWAModel:
+    """
+    Load a saved model. Raises ValueError if the file is not a supported
+    artifact or was trained on different data than this module's X / y.
+    """
+    artifact = json.loads(Path(path).read_text(encoding="utf-8"))
+
+    if artifact.get("format") != ARTIFACT_FORMAT or artifact.get("version") != ARTIFACT_VERSION:
+        raise ValueError(f"unsupported model artifact: {artifact.get('format')} v{artifact.get('version')}")
+    if artifact.get("features") != FEATURES or len(artifact.get("coef", [])) != len(FEATURES):
+        raise ValueError("model artifact features do not match")
+    if artifact.get("training_data_sha256") != _training_data_hash():
+        raise ValueError("model artifact is stale (training data changed); retrain with --train")
+
+    return LinearCWAModel(artifact["coef"], artifact["intercept"])
+
+
+# The model is loaded on first use, so importing this module does not
+# pull in scikit-learn or run the fit.
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_model() -> LinearCWAModel:
+    """
+    Return the model (thread-safe, runs once).
+
+    Uses the saved artifact when it is present and current; otherwise fits
+    with scikit-learn in-process.
+    """
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                try:
+                    _model = load_model_artifact()
+                except (OSError, ValueError):
+                    _model = train_model()
+    return _model
+
+
+def __getattr__(name):
+    # keeps `from model_training import model` working
+    if name == "model":
+        return get_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # THIS FUNCTION IS WHAT GUI WILL USE
 def predict_cwa(current_cwa, credit_load, study_hours):
     input_data = np.array([[current_cwa, credit_load, study_hours]])
-    prediction = model.predict(input_data)
+    prediction = get_model().predict(input_data)
     return round(prediction[0], 2)
+
+
+def predict_cwa_many(current_cwa, credit_load=None, study_hours=None) -> np.ndarray:
+    """
+    Vectorized predict_cwa().
+
+    Accepts either one (N, 3) array of [current_cwa, credit_load, study_hours]
+    rows, or three 1-D arrays of length N. Returns N predictions rounded to
+    2 decimals, computed in a single matrix-vector product.
+    """
+    if credit_load is None and study_hours is None:
+        features = np.asarray(current_cwa, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != len(FEATURES):
+            raise ValueError(f"expected an (N, {len(FEATURES)}) array")
+    elif credit_load is None or study_hours is None:
+        raise ValueError("pass either one (N, 3) array or all three feature arrays")
+    else:
+        features = np.column_stack([
+            np.asarray(current_cwa, dtype=np.float64),
+            np.asarray(credit_load, dtype=np.float64),
+            np.asarray(study_hours, dtype=np.float64),
+        ])
+
+    return np.round(get_model().predict(features), 2)
+
+
+def parse_float(text: str) -> float:
+    """float(text), or NaN for a blank / unparseable cell (a missing feature)."""
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def score_csv(src, dst, chunk_size: int = 65536) -> dict:
+    """
+    Stream a CSV through predict_cwa_many() in chunks of chunk_size rows.
+
+    src must have a header containing the FEATURES columns; all input
+    columns are copied to dst with a "predicted_cwa" column appended.
+    Rows with missing or non-numeric features get an empty prediction.
+    Memory use is bounded by the chunk size, not the file size.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    reader = csv.reader(src)
+    writer = csv.writer(dst)
+
+    header = next(reader, None)
+    if header is None:
+        return {"rows": 0, "invalid": 0}
+    missing = [f for f in FEATURES if f not in header]
+    if missing:
+        raise ValueError(f"input is missing column(s): {', '.join(missing)}")
+    cols = [header.index(f) for f in FEATURES]
+    writer.writerow(header + ["predicted_cwa"])
+
+    rows = 0
+    invalid = 0
+    chunk = []
+
+    def flush() -> None:
+        nonlocal invalid
+        features = np.array(
+            [[parse_float(r[c]) if c < len(r) else float("nan") for c in cols] for r in chunk],
+            dtype=np.float64,
+        ).reshape(len(chunk), len(FEATURES))
+        preds = predict_cwa_many(features)
+        ok = np.isfinite(preds)
+        invalid += int((~ok).sum())
+        writer.writerows(
+            r + ([f"{p:.2f}"] if good else [""]) for r, p, good in zip(chunk, preds.tolist(), ok.tolist())
+        )
+        chunk.clear()
+
+    for row in reader:
+        chunk.append(row)
+        rows += 1
+        if len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+
+    return {"rows": rows, "invalid": invalid}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="CWA prediction model")
+    parser.add_argument("--train", action="store_true", help="fit the model and save the artifact")
+    parser.add_argument("--out", default=str(MODEL_ARTIFACT_PATH), help="artifact path")
+    parser.add_argument("--score", metavar="CSV", help="score a CSV file ('-' for stdin)")
+    parser.add_argument("--output", default="-", help="scored CSV destination ('-' for stdout)")
+    parser.add_argument("--chunk-size", type=int, default=65536, help="rows per prediction batch")
+    args = parser.parse_args(argv)
+
+    if args.train:
+        path = save_model_artifact(train_model(), args.out)
+        print(f"Saved model artifact: {path}")
+        return 0
+
+    if args.score:
+        src = sys.stdin if args.score == "-" else open(args.score, "r", newline="", encoding="utf-8")
+        dst = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+        try:
+            stats = score_csv(src, dst, args.chunk_size)
+        finally:
+            if src is not sys.stdin:
+                src.close()
+            if dst is not sys.stdout:
+                dst.close()
+        print(f"Scored {stats['rows']} rows ({stats['invalid']} invalid)", file=sys.stderr)
+        return 0
+
+    parser.print_help()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
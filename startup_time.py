@@ -0,0 +1,86 @@
+"""
+Import-time check for the library modules.
+
+Imports each module in a fresh interpreter, times the import with
+time.perf_counter(), and checks that nothing expensive happened as a side
+effect (engine library loaded, scikit-learn imported, model fitted).
+
+Run: python startup_time.py [--repeat 5] [--json]
+Exit status is 1 if a module is over its budget or loads something eagerly.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# module -> (budget in ms, modules it must not import, attribute that must still be None)
+CHECKS = {
+    "cwa_engine_bridge": (200.0, ["sklearn", "PySide6"], "_c_lib"),
+    "model_training": (200.0, ["sklearn"], "_model"),
+}
+
+_CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+mod = __import__({module!r})
+elapsed = (time.perf_counter() - t0) * 1000.0
+print(json.dumps({{
+    "ms": elapsed,
+    "loaded": [m for m in {forbidden!r} if m in sys.modules],
+    "deferred": getattr(mod, {attr!r}, None) is None,
+}}))
+"""
+
+
+def measure(module: str, repeat: int) -> dict:
+    budget, forbidden, attr = CHECKS[module]
+    code = _CHILD.format(module=module, forbidden=forbidden, attr=attr)
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    median_ms = statistics.median(r["ms"] for r in runs)
+    loaded = sorted({m for r in runs for m in r["loaded"]})
+    deferred = all(r["deferred"] for r in runs)
+    return {
+        "module": module,
+        "median_ms": round(median_ms, 2),
+        "budget_ms": budget,
+        "eager_imports": loaded,
+        "deferred": deferred,
+        "ok": median_ms <= budget and not loaded and deferred,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure import time of the CWA modules")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [measure(m, max(1, args.repeat)) for m in CHECKS]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            status = "ok" if r["ok"] else "FAIL"
+            extra = f" eager imports: {', '.join(r['eager_imports'])}" if r["eager_imports"] else ""
+            if not r["deferred"]:
+                extra += " (not deferred)"
+            print(f"{r['module']:<20} {r['median_ms']:8.1f} ms / {r['budget_ms']:.0f} ms  {status}{extra}")
+
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())